@@ -24,6 +24,7 @@ Pydoc-markdown is an extensible framework for generating API documentation,
 with a focus on Python source code and the Markdown output format.
 """
 
+import copy
 import dataclasses
 import logging
 import os
@@ -31,19 +32,11 @@ import subprocess
 import typing as t
 from pathlib import Path
 
-import databind.json
 import docspec
-import tomli
 import typing_extensions as te
 from databind.core import Alias, Context as DatabindContext, ExtraKeys, format_context_trace
 
-from pydoc_markdown.contrib.loaders.python import PythonLoader
-from pydoc_markdown.contrib.processors.crossref import CrossrefProcessor
-from pydoc_markdown.contrib.processors.filter import FilterProcessor
-from pydoc_markdown.contrib.processors.smart import SmartProcessor
-from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
-from pydoc_markdown.interfaces import Builder, Context, Loader, Processor, Renderer, Resolver
-from pydoc_markdown.util import ytemplate
+from pydoc_markdown.interfaces import Builder, Context, IncrementalRenderer, Loader, Processor, Renderer, Resolver
 
 __author__ = "Niklas Rosenstein <rosensteinniklas@gmail.com>"
 __version__ = "4.8.2"
@@ -51,6 +44,30 @@ __version__ = "4.8.2"
 logger = logging.getLogger(__name__)
 
 
+# NOTE: The default plugins are imported only when they are needed such that importing this module (e.g. for
+#       `pydoc-markdown --version`) does not pull in the Python parser, YAPF and their dependencies.
+
+
+def _default_loaders() -> t.List[Loader]:
+    from pydoc_markdown.contrib.loaders.python import PythonLoader
+
+    return [PythonLoader()]
+
+
+def _default_processors() -> t.List[Processor]:
+    from pydoc_markdown.contrib.processors.crossref import CrossrefProcessor
+    from pydoc_markdown.contrib.processors.filter import FilterProcessor
+    from pydoc_markdown.contrib.processors.smart import SmartProcessor
+
+    return [FilterProcessor(), SmartProcessor(), CrossrefProcessor()]
+
+
+def _default_renderer() -> Renderer:
+    from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
+
+    return MarkdownRenderer()
+
+
 @dataclasses.dataclass
 class Hooks:
     pre_render: te.Annotated[t.List[str], Alias("pre-render")] = dataclasses.field(default_factory=list)
@@ -65,16 +82,24 @@ class PydocMarkdown:
 
     #: A list of loader implementations that load #docspec.Module#s.
     #: Defaults to #PythonLoader.
-    loaders: t.List[Loader] = dataclasses.field(default_factory=lambda: [PythonLoader()])
+    loaders: t.List[Loader] = dataclasses.field(default_factory=_default_loaders)
 
     #: A list of processor implementations that modify #docspec.Module#s. Defaults
     #: to #FilterProcessor, #SmartProcessor and #CrossrefProcessor.
-    processors: t.List[Processor] = dataclasses.field(
-        default_factory=lambda: [FilterProcessor(), SmartProcessor(), CrossrefProcessor()]
-    )
+    processors: t.List[Processor] = dataclasses.field(default_factory=_default_processors)
 
     #: A renderer for #docspec.Module#s. Defaults to #MarkdownRenderer.
-    renderer: Renderer = dataclasses.field(default_factory=MarkdownRenderer)
+    renderer: Renderer = dataclasses.field(default_factory=_default_renderer)
+
+    #: Named renderers to render the #docspec.Module#s with. If specified, the #renderer is ignored and the
+    #: modules are loaded and processed once for all of them. Only the `get_resolver()` and `process()` steps
+    #: of the renderers run for each of them. Renderers with a different resolver than the first renderer get
+    #: a copy of the modules on which the processors that use the resolver run again with their resolver. If
+    #: multiple renderers support building, each of them builds into a subdirectory named after it.
+    renderers: t.Dict[str, Renderer] = dataclasses.field(default_factory=dict)
+
+    #: The maximum number of threads to render the #renderers with. By default, they render one after another.
+    max_render_workers: int = 1
 
     #: Hooks that can be executed at certain points in the pipeline. The commands
     #: are executed with the current `SHELL`.
@@ -87,6 +112,14 @@ class PydocMarkdown:
         self.resolver: t.Optional[Resolver] = None
         self._context: t.Optional[Context] = None
 
+        #: The modules passed to the last #process(), and the copies processed with another resolver than the
+        #: #resolver for each of the renderers that use that resolver.
+        self._processed_modules: t.Optional[t.List[docspec.Module]] = None
+        self._renderer_modules: t.Dict[str, t.List[docspec.Module]] = {}
+
+        #: The names of the environment variables that the configuration file referenced when it was loaded.
+        self.env_vars: t.Set[str] = set()
+
     def load_config(self, arg: t.Union[str, dict]) -> None:
         """
         Loads the configuration from a nested data structure or filename as specified per the *data*
@@ -97,14 +130,23 @@ class PydocMarkdown:
         :param data: A nested structure or the path to a configuration file.
         """
 
+        import databind.json
+
         filename = None
+        env_vars: t.Set[str] = set()
         if isinstance(arg, str):
             filename = arg
             logger.info('Loading configuration file "%s".', filename)
             if filename.endswith(".toml"):
+                import tomli
+
                 data = tomli.loads(Path(filename).read_text())
             else:
-                data = ytemplate.load(filename, {"env": ytemplate.Attributor(os.environ)})
+                from pydoc_markdown.util import ytemplate
+
+                env = ytemplate.Attributor(os.environ)
+                data = ytemplate.load(filename, {"env": env})
+                env_vars = env.accessed
             if filename == "pyproject.toml":
                 try:
                     data = data["tool"]["pydoc-markdown"]
@@ -129,6 +171,7 @@ class PydocMarkdown:
             ],
         )  # type: ignore[arg-type]  # noqa: E501  # Bad databind typehint
         vars(self).update(vars(result))
+        self.env_vars = env_vars
 
         for ctx, keys in unknown_keys:
             prefix = f'Unknown key(s) "{keys}" at:\n'
@@ -149,7 +192,15 @@ class PydocMarkdown:
             loader.init(context)
         for processor in self.processors:
             processor.init(context)
-        self.renderer.init(context)
+        for renderer in self.get_renderers().values():
+            renderer.init(context)
+
+    def get_renderers(self) -> t.Dict[str, Renderer]:
+        """
+        Returns the #renderers, or the #renderer by the name `default` if no #renderers are specified.
+        """
+
+        return dict(self.renderers) if self.renderers else {"default": self.renderer}
 
     def ensure_initialized(self) -> None:
         if not self._context:
@@ -167,38 +218,148 @@ class PydocMarkdown:
             modules.extend(loader.load())
         return modules
 
+    def get_resolver_groups(
+        self, modules: t.List[docspec.Module]
+    ) -> t.List[t.Tuple[t.Optional[Resolver], t.List[str]]]:
+        """
+        Groups the names of the renderers by the resolver that they return for the *modules*, in the order of the
+        renderers. Resolvers are the same if they are equal dataclasses of the same type, or the same object.
+        """
+
+        groups: t.List[t.Tuple[t.Optional[Resolver], t.List[str]]] = []
+        for name, renderer in self.get_renderers().items():
+            resolver = renderer.get_resolver(modules)
+            for other, names in groups:
+                if other is resolver or (
+                    type(other) is type(resolver) and dataclasses.is_dataclass(resolver) and other == resolver
+                ):
+                    names.append(name)
+                    break
+            else:
+                groups.append((resolver, [name]))
+        return groups
+
     def process(self, modules: t.List[docspec.Module]) -> None:
         """
-        Process modules via the #processors.
+        Process modules via the #processors with the resolver of the first renderer. If other renderers use a
+        different resolver, the processors starting with the first one that uses the resolver (see
+        #Processor.uses_resolver, e.g. the #CrossrefProcessor) run again on a copy of the modules for each of them.
+        The copies are used when the *modules* are passed to #render().
         """
 
         self.ensure_initialized()
+        groups = self.get_resolver_groups(modules)
         if self.resolver is None:
-            self.resolver = self.renderer.get_resolver(modules)
-        for processor in self.processors:
-            processor.process(modules, self.resolver)
-
-    def render(self, modules: t.List[docspec.Module], run_hooks: bool = True) -> None:
+            self.resolver = groups[0][0]
+
+        index = next((i for i, p in enumerate(self.processors) if p.uses_resolver), len(self.processors))
+        self._process_with(modules, self.resolver, self.processors[:index])
+
+        renderer_modules = {}
+        if index < len(self.processors):
+            for resolver, names in groups[1:]:
+                logger.info("Processing a copy of the modules for %s.", ", ".join(map(repr, names)))
+                modules_copy = copy.deepcopy(modules)
+                for module in modules_copy:
+                    module.sync_hierarchy()
+                self._process_with(modules_copy, resolver, self.processors[index:])
+                renderer_modules.update(dict.fromkeys(names, modules_copy))
+            self._process_with(modules, self.resolver, self.processors[index:])
+
+        self._processed_modules = modules
+        self._renderer_modules = renderer_modules
+
+    def _process_with(
+        self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver], processors: t.List[Processor]
+    ) -> None:
+        from pydoc_markdown.util.docspec import ApiSuite
+
+        for processor in processors:
+            processor.process(modules, resolver)
+            ApiSuite.invalidate_modules(modules)
+
+    def render(
+        self,
+        modules: t.List[docspec.Module],
+        run_hooks: bool = True,
+        changed_modules: t.Optional[t.List[docspec.Module]] = None,
+    ) -> None:
         """
-        Render modules via the #renderer.
+        Render modules via the #renderer, or via each of the #renderers. If *changed_modules* is specified and a
+        renderer implements the #IncrementalRenderer interface, only the outputs that include objects from these
+        modules are rendered.
+
+        Renderers that modify the modules in their `process()` step render a copy of the modules if there are
+        multiple #renderers, such that they do not affect each other. Renderers that use another resolver than
+        the first renderer render the modules that #process() processed with their resolver.
         """
 
         self.ensure_initialized()
         if run_hooks:
             self.run_hooks("pre-render")
-        if self.resolver is None:
-            self.resolver = self.renderer.get_resolver(modules)
-        self.renderer.process(modules, self.resolver)
-        self.renderer.render(modules)
+
+        renderers = self.get_renderers()
+        if len(renderers) == 1:
+            (renderer,) = renderers.values()
+            if self.resolver is None:
+                self.resolver = renderer.get_resolver(modules)
+            self._render_with(renderer, modules, self.resolver, changed_modules)
+        else:
+            renderer_modules = self._renderer_modules if self._processed_modules is modules else {}
+
+            def _render(name: str, renderer: Renderer) -> None:
+                logger.info('Rendering "%s".', name)
+                target_modules = renderer_modules.get(name, modules)
+                target_changed_modules = changed_modules
+                if type(renderer).process is not Renderer.process:
+                    target_modules, target_changed_modules = copy.deepcopy((target_modules, changed_modules))
+                    for module in target_modules + (target_changed_modules or []):
+                        module.sync_hierarchy()
+                resolver = renderer.get_resolver(target_modules)
+                self._render_with(renderer, target_modules, resolver, target_changed_modules)
+
+            if self.max_render_workers > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(self.max_render_workers) as executor:
+                    futures = [executor.submit(_render, name, renderer) for name, renderer in renderers.items()]
+                    for future in futures:
+                        future.result()
+            else:
+                for name, renderer in renderers.items():
+                    _render(name, renderer)
+
         if run_hooks:
             self.run_hooks("post-render")
 
+    @staticmethod
+    def _render_with(
+        renderer: Renderer,
+        modules: t.List[docspec.Module],
+        resolver: t.Optional[Resolver],
+        changed_modules: t.Optional[t.List[docspec.Module]],
+    ) -> None:
+        renderer.process(modules, resolver)
+        if changed_modules is not None and isinstance(renderer, IncrementalRenderer):
+            renderer.render_changed(modules, changed_modules)
+        else:
+            renderer.render(modules)
+
     def build(self, site_dir: str) -> None:
-        if not isinstance(self.renderer, Builder):
-            name = type(self.renderer).__name__
-            raise NotImplementedError('Renderer "{}" does not support building'.format(name))
+        """
+        Invokes the build of every renderer that implements the #Builder interface. If there are multiple builders,
+        each of them builds into a subdirectory of *site_dir* that is named after the renderer, such that they do
+        not overwrite each other's output.
+        """
+
+        renderers = self.get_renderers()
+        builders = {name: r for name, r in renderers.items() if isinstance(r, Builder)}
+        if not builders:
+            names = ", ".join(type(r).__name__ for r in renderers.values())
+            raise NotImplementedError('Renderer "{}" does not support building'.format(names))
         self.ensure_initialized()
-        self.renderer.build(site_dir)
+        for name, builder in builders.items():
+            builder.build(os.path.join(site_dir, name) if len(builders) > 1 else site_dir)
 
     def run_hooks(self, hook_name: str) -> None:
         assert self._context is not None
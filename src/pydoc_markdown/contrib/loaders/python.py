@@ -23,6 +23,8 @@
 Loads Python source code.
 """
 
+import contextlib
+import copy
 import dataclasses
 import logging
 import os
@@ -35,6 +37,7 @@ import docspec_python
 from pydoc_markdown.interfaces import Context, Loader
 
 logger = logging.getLogger(__name__)
+_ParseKey = t.Tuple[str, str]
 
 
 @dataclasses.dataclass
@@ -85,6 +88,8 @@ class PythonLoader(Loader):
 
     def __post_init__(self) -> None:
         self._context: t.Optional[Context] = None
+        self._parse_cache: t.Optional[t.Dict[_ParseKey, t.Tuple[t.Tuple[t.Any, ...], docspec.Module]]] = None
+        self._parsed_modules: t.Dict[_ParseKey, t.Tuple[t.Tuple[t.Any, ...], docspec.Module]] = {}
 
     def get_effective_search_path(self) -> t.List[str]:
         if self.search_path is None:
@@ -135,14 +140,74 @@ class PythonLoader(Loader):
             do_discover,
         )
 
-        return docspec_python.load_python_modules(
-            modules=modules,
-            packages=packages,
-            search_path=search_path,
-            options=self.parser,
-            encoding=self.encoding,
+        files = [(name, docspec_python.find_module(name, search_path)) for name in modules]
+        for package in packages:
+            files.extend(docspec_python.iter_package_files(package, search_path))
+        return [self._parse_file(module_name, filename) for module_name, filename in files]
+
+    def _parse_file(self, module_name: str, filename: str) -> docspec.Module:
+        """
+        Parses a Python source file, unless it was passed to #use_parsed_modules() or, if #keep_parsed_modules()
+        was called, it did not change since it was last parsed by this loader.
+        """
+
+        key = (module_name, os.path.realpath(filename))
+        stamp = self._get_stamp(key[1])
+        parsed = self._parsed_modules.pop(key, None)
+        if parsed is not None and parsed[0] == stamp:
+            return parsed[1]
+        if self._parse_cache is None:
+            return self._parse(module_name, filename)
+
+        cached = self._parse_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = self._parse_cache[key] = (stamp, self._parse(module_name, filename))
+
+        # Processors modify the modules in place, so we hand out a copy of the cached module.
+        module = copy.deepcopy(cached[1])
+        module.sync_hierarchy()
+        return module
+
+    def _parse(self, module_name: str, filename: str) -> docspec.Module:
+        return docspec_python.parse_python_module(
+            filename, module_name=module_name, options=self.parser, encoding=self.encoding
         )
 
+    def _get_stamp(self, filename: str) -> t.Tuple[t.Any, ...]:
+        st = os.stat(filename)
+        return (st.st_mtime_ns, st.st_size, repr(self.parser), self.encoding)
+
+    def keep_parsed_modules(self) -> None:
+        """
+        Keep the parsed modules across calls to #load() and only parse files again when they changed. This is
+        only worth it in a long-running process that loads the modules repeatedly (e.g. `--server` or
+        `pydoc-markdown daemon`), as every load then hands out a copy of the kept modules.
+        """
+
+        if self._parse_cache is None:
+            self._parse_cache = {}
+
+    @contextlib.contextmanager
+    def use_parsed_modules(self, modules: t.Iterable[docspec.Module]) -> t.Iterator[None]:
+        """
+        Use modules that were parsed before (e.g. in a previous build, see `--changed-since`) instead of parsing
+        their files again while the context manager is active, unless the files changed since this call. The
+        modules are handed out as they are, and only once.
+        """
+
+        parsed = {}
+        for module in modules:
+            filename = os.path.realpath(module.location.filename)
+            try:
+                parsed[(module.name, filename)] = (self._get_stamp(filename), module)
+            except FileNotFoundError:
+                pass
+        self._parsed_modules = parsed
+        try:
+            yield
+        finally:
+            self._parsed_modules = {}
+
     # PluginBase
 
     def init(self, context: Context) -> None:
@@ -0,0 +1,95 @@
+"""
+Loads modules from dumps written with `pydoc-markdown --dump`.
+"""
+
+import dataclasses
+import fnmatch
+import io
+import json
+import logging
+import os
+import typing as t
+
+import docspec
+
+from pydoc_markdown.interfaces import Context, Loader, LoaderError
+from pydoc_markdown.util.snapshot import SnapshotError, iter_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class SnapshotLoader(Loader):
+    """
+    This implementation of the #Loader interface loads modules from dumps instead of parsing Python source code.
+    Dumps are written with `pydoc-markdown --dump`, preferably with the `--dump-format snapshot` option, which
+    allows the modules to be parsed once in one stage of a pipeline and to be rendered in other stages.
+
+    The modules are read from the dump one at a time while they are loaded, the dump is never read into memory
+    as a whole. Dumps in Docspec JSON format are supported as well, but are a lot slower to load.
+
+    Example:
+
+    ```yml
+    loaders:
+      - type: snapshot
+        path: build/modules.snapshot
+    ```
+    """
+
+    #: The dump file, or a directory that contains dump files, to load the modules from. The path is relative to
+    #: the directory of the configuration file. Files in a directory are loaded in the order of their names,
+    #: files whose name starts with a dot are ignored.
+    path: str
+
+    #: A list of glob patterns for the names of the modules to load. If not specified, all modules in the dump
+    #: are loaded. Modules that are not selected are not decoded.
+    modules: t.Optional[t.List[str]] = None
+
+    def __post_init__(self) -> None:
+        self._context: t.Optional[Context] = None
+
+    def _get_files(self) -> t.List[str]:
+        assert self._context is not None
+        path = os.path.join(self._context.directory, self.path)
+        if not os.path.isdir(path):
+            return [path]
+        return [
+            os.path.join(path, name)
+            for name in sorted(os.listdir(path))
+            if not name.startswith(".") and os.path.isfile(os.path.join(path, name))
+        ]
+
+    def _select(self, name: str) -> bool:
+        return self.modules is None or any(fnmatch.fnmatchcase(name, pattern) for pattern in self.modules)
+
+    def _iter_file(self, filename: str) -> t.Iterator[docspec.Module]:
+        logger.info('Loading modules from "%s".', filename)
+        with open(filename, "rb") as fp:
+            assert isinstance(fp, io.BufferedReader)
+            if fp.peek(1)[:1] != b"{":
+                yield from iter_snapshot(fp, self._select)
+                return
+            # Docspec JSON, as written by `pydoc-markdown --dump` (one module per line).
+            for line in fp:
+                if line.strip():
+                    module = docspec.load_module(json.loads(line))
+                    if self._select(module.name):
+                        yield module
+
+    def _iter_modules(self) -> t.Iterator[docspec.Module]:
+        for filename in self._get_files():
+            try:
+                yield from self._iter_file(filename)
+            except (OSError, ValueError, SnapshotError) as exc:
+                raise LoaderError(f'could not load modules from "{filename}": {exc}')
+
+    # Loader
+
+    def load(self) -> t.Iterable[docspec.Module]:
+        return self._iter_modules()
+
+    # PluginBase
+
+    def init(self, context: Context) -> None:
+        self._context = context
@@ -25,12 +25,136 @@ import re
 import typing as t
 
 import docspec
+import tomli_w
 
 from pydoc_markdown.interfaces import Processor, Resolver, ResolverV2
 from pydoc_markdown.util.docspec import ApiSuite
 
 logger = logging.getLogger(__name__)
 
+#: The pattern for cross-references in docstrings.
+CROSSREF_PATTERN = re.compile(
+    r"""
+    (?<!\]\()                       # Avoid parsing Markdown formatted local anchor links (e.g. `[a](#b)`).
+    \B\#(?P<ref>[\w\d\._]+)         # Begin with a hash tag followed by member name(s)
+    (?P<parens>\(\))?               # Optionally followed by parentheses.
+    (?P<trailing>\#[\w\d\._]+)?     # Another hash tag which supplies the text to render for the reference.
+    """,
+    re.VERBOSE,
+)
+
+
+class _Crossref(t.NamedTuple):
+    start: int
+    end: int
+    ref: str
+    text: str
+    has_trailing_dot: bool
+
+    @staticmethod
+    def from_match(match: re.Match) -> "_Crossref":
+        ref = match.group("ref")
+        parens = match.group("parens") or ""
+        trailing = (match.group("trailing") or "").lstrip("#")
+        # Remove the dot from the ref if its trailing (it is probably just
+        # the end of the sentence).
+        has_trailing_dot = False
+        if trailing and trailing.endswith("."):
+            trailing = trailing[:-1]
+            has_trailing_dot = True
+        elif not parens and ref.endswith("."):
+            ref = ref[:-1]
+            has_trailing_dot = True
+        return _Crossref(match.start(), match.end(), ref, ref + parens + trailing, has_trailing_dot)
+
+
+class CrossrefEngine:
+    """
+    Replaces cross-references in the docstrings of a list of modules. The #ApiSuite is created once
+    for all modules, and every unique reference is resolved only once per API object, even if it
+    appears multiple times in the same docstring.
+
+    References are replaced in three passes: First all references are collected from the docstrings,
+    then the unique references are resolved and finally the docstrings are rewritten.
+    """
+
+    def __init__(
+        self,
+        modules: t.List[docspec.Module],
+        resolver: t.Optional[Resolver],
+        resolver_v2: t.Optional[ResolverV2] = None,
+    ) -> None:
+        self._modules = modules
+        self._resolver = resolver
+        self._resolver_v2 = resolver_v2
+        self._suite = ApiSuite(modules)
+
+        #: Maps the fully qualified name of API objects to the references in their docstring that could
+        #: not be resolved. Populated by #process().
+        self.unresolved: t.Dict[str, t.List[str]] = {}
+
+    def _collect(self) -> t.List[t.Tuple[docspec.ApiObject, t.List[_Crossref]]]:
+        found: t.List[t.Tuple[docspec.ApiObject, t.List[_Crossref]]] = []
+
+        def _visit(node: docspec.ApiObject) -> None:
+            # Most docstrings contain no references, so we avoid running the regex on them at all.
+            if not node.docstring or "#" not in node.docstring.content:
+                return
+            refs = [_Crossref.from_match(m) for m in CROSSREF_PATTERN.finditer(node.docstring.content)]
+            if refs:
+                found.append((node, refs))
+
+        docspec.visit(self._modules, _visit)
+        return found
+
+    def _resolve(self, node: docspec.ApiObject, ref: str) -> t.Union[None, str, docspec.ApiObject]:
+        if self._resolver_v2:
+            return self._resolver_v2.resolve_reference(self._suite, node, ref)
+        elif self._resolver:
+            return self._resolver.resolve_ref(node, ref)
+        return None
+
+    def _format(self, crossref: _Crossref, target: t.Union[None, str, docspec.ApiObject]) -> t.Optional[str]:
+        if isinstance(target, docspec.ApiObject):
+            opt = tomli_w.dumps({"text": crossref.text})
+            return f'{{@link pydoc:{".".join(x.name for x in target.path)} :with {opt}}}'
+        elif target:
+            return "[`{}`]({})".format(crossref.text, target)
+        return None
+
+    def process(self) -> None:
+        found = self._collect()
+
+        resolved: t.Dict[t.Tuple[int, str], t.Union[None, str, docspec.ApiObject]] = {}
+        for node, refs in found:
+            for crossref in refs:
+                key = (id(node), crossref.ref)
+                if key not in resolved:
+                    resolved[key] = self._resolve(node, crossref.ref)
+
+        for node, refs in found:
+            assert node.docstring is not None
+            content = node.docstring.content
+            parts: t.List[str] = []
+            offset = 0
+            for crossref in refs:
+                result = self._format(crossref, resolved[(id(node), crossref.ref)])
+                if result is None:
+                    uid = ".".join(x.name for x in node.path)
+                    self.unresolved.setdefault(uid, []).append(crossref.ref)
+                    result = "`{}`".format(crossref.text)
+
+                # Add back the dot.
+                if crossref.has_trailing_dot:
+                    result += "."
+
+                parts.append(content[offset : crossref.start])
+                parts.append(result)
+                offset = crossref.end
+
+            parts.append(content[offset:])
+            node.docstring.content = "".join(parts)
+
 
 @dataclasses.dataclass
 class CrossrefProcessor(Processor):
@@ -67,82 +191,19 @@ class CrossrefProcessor(Processor):
     #: code for the reference uses Novella `{@link}` syntax.
     resolver_v2: t.Optional[ResolverV2] = None
 
+    uses_resolver = True
+
     def process(self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver]) -> None:
-        unresolved: t.Dict[str, t.List[str]] = {}
-        docspec.visit(
-            modules, lambda x: self._preprocess_refs(x, t.cast(Resolver, resolver), ApiSuite(modules), unresolved)
-        )
+        engine = CrossrefEngine(modules, resolver, self.resolver_v2)
+        engine.process()
 
-        if unresolved:
+        if engine.unresolved:
             summary = []
-            for uid, refs in unresolved.items():
+            for uid, refs in engine.unresolved.items():
                 summary.append("  {}: {}".format(uid, ", ".join(refs)))
 
             logger.warning(
                 "%s cross-reference(s) could not be resolved:\n%s",
-                sum(map(len, unresolved.values())),
+                sum(map(len, engine.unresolved.values())),
                 "\n".join(summary),
             )
-
-    def _preprocess_refs(
-        self,
-        node: docspec.ApiObject,
-        resolver: t.Optional[Resolver],
-        suite: ApiSuite,
-        unresolved: t.Dict[str, t.List[str]],
-    ) -> None:
-        if not node.docstring:
-            return
-
-        def handler(match: re.Match) -> str:
-            ref = match.group("ref")
-            parens = match.group("parens") or ""
-            trailing = (match.group("trailing") or "").lstrip("#")
-            # Remove the dot from the ref if its trailing (it is probably just
-            # the end of the sentence).
-            has_trailing_dot = False
-            if trailing and trailing.endswith("."):
-                trailing = trailing[:-1]
-                has_trailing_dot = True
-            elif not parens and ref.endswith("."):
-                ref = ref[:-1]
-                has_trailing_dot = True
-
-            text = ref + parens + trailing
-            result: t.Optional[str] = None
-
-            if self.resolver_v2:
-                target = self.resolver_v2.resolve_reference(suite, node, ref)
-                if target:
-                    import tomli_w
-
-                    opt = tomli_w.dumps({"text": text})
-                    result = f'{{@link pydoc:{".".join(x.name for x in target.path)} :with {opt}}}'
-
-            elif resolver:
-                href = resolver.resolve_ref(node, ref)
-                if href:
-                    result = "[`{}`]({})".format(text, href)
-
-            if result is None:
-                uid = ".".join(x.name for x in node.path)
-                unresolved.setdefault(uid, []).append(ref)
-                result = "`{}`".format(ref + parens + trailing)
-
-            # Add back the dot.
-            if has_trailing_dot:
-                result += "."
-
-            return result
-
-        node.docstring.content = re.sub(
-            r"""
-            (?<!\]\()                       # Avoid parsing Markdown formatted local anchor links (e.g. `[a](#b)`).
-            \B\#(?P<ref>[\w\d\._]+)         # Begin with a hash tag followed by member name(s)
-            (?P<parens>\(\))?               # Optionally followed by parentheses.
-            (?P<trailing>\#[\w\d\._]+)?     # Another hash tag which supplies the text to render for the reference.
-            """,
-            handler,
-            node.docstring.content,
-            flags=re.VERBOSE,
-        )
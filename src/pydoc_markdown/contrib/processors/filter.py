@@ -19,12 +19,151 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import copy
 import dataclasses
+import fnmatch
+import re
 import typing as t
 
 import docspec
 
-from pydoc_markdown.interfaces import Processor, Resolver
+from pydoc_markdown.interfaces import Context, Processor, Resolver
+
+_KINDS = frozenset(("module", "class", "function", "variable", "indirection"))
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+@dataclasses.dataclass
+class FilterRule:
+    """
+    A declarative rule for the #FilterProcessor. A rule matches an API object if all of the conditions
+    that are set on the rule match. The first rule that matches an API object decides whether it is kept
+    or removed.
+
+    ### Options
+    """
+
+    #: A list of glob patterns. If set, the name of the API object must match at least one of them
+    #: (or one of the #name_regexes).
+    names: t.List[str] = dataclasses.field(default_factory=list)
+
+    #: A list of regular expressions. If set, the name of the API object must fully match at least
+    #: one of them (or one of the #names).
+    name_regexes: t.List[str] = dataclasses.field(default_factory=list)
+
+    #: A list of API object kinds. If set, the object must be of one of these kinds. Valid kinds are
+    #: `module`, `class`, `function`, `variable` and `indirection`. Methods are of kind `function`.
+    kinds: t.List[str] = dataclasses.field(default_factory=list)
+
+    #: A list of decorator names. If set, the API object must have at least one of these decorators.
+    decorators: t.List[str] = dataclasses.field(default_factory=list)
+
+    #: If set to `true`, only match API objects that have a docstring. If set to `false`, only match
+    #: API objects that have no docstring. Default: `null`
+    documented: t.Optional[bool] = None
+
+    #: Whether to keep or remove the API objects that match this rule. Default: `true`
+    keep: bool = True
+
+    def has_name_condition(self) -> bool:
+        return bool(self.names or self.name_regexes)
+
+    def get_name_patterns(self) -> t.Tuple[t.Optional[str], t.List[t.Pattern[str]]]:
+        """
+        Returns a regular expression that matches the #names and those #name_regexes that can be combined
+        with other expressions, and the compiled #name_regexes that must be matched separately because they
+        contain groups, backreferences or global flags.
+        """
+
+        alternatives = [fnmatch.translate(x) for x in self.names]
+        separate = []
+        for regex in self.name_regexes:
+            compiled = re.compile(regex)
+            if compiled.groups or compiled.flags != _DEFAULT_FLAGS:
+                separate.append(compiled)
+            else:
+                alternatives.append(f"(?:{regex})\\Z")
+        combined = "|".join(f"(?:{x})" for x in alternatives) if alternatives else None
+        return combined, separate
+
+    def matches_object(self, obj: docspec.ApiObject) -> bool:
+        """
+        Checks all conditions except for the name of the API object.
+        """
+
+        if self.kinds and type(obj).__name__.lower() not in self.kinds:
+            return False
+        if self.decorators:
+            decorations = getattr(obj, "decorations", None) or ()
+            if not any(d.name in self.decorators for d in decorations):
+                return False
+        if self.documented is not None and bool(obj.docstring) != self.documented:
+            return False
+        return True
+
+
+class _CompiledRules:
+    """
+    Compiles a list of #FilterRule#s into a single predicate. The name conditions of all rules are combined
+    into a single regular expression with one group per rule, so for most API objects a single regex match
+    is enough to know that no rule applies. Name regexes that contain groups, backreferences or global flags
+    can not be combined with others and are matched separately.
+    """
+
+    def __init__(self, rules: t.List[FilterRule]) -> None:
+        for rule in rules:
+            for kind in rule.kinds:
+                if kind not in _KINDS:
+                    raise ValueError(f"invalid FilterRule kind: {kind!r}")
+
+        self._rules = [(index, rule) for index, rule in enumerate(rules)]
+        self._patterns: t.Dict[int, t.Pattern[str]] = {}
+        self._separate: t.Dict[int, t.List[t.Pattern[str]]] = {}
+        for index, rule in self._rules:
+            combined, separate = rule.get_name_patterns()
+            if combined is not None:
+                self._patterns[index] = re.compile(combined)
+            if separate:
+                self._separate[index] = separate
+
+        # Rules that may match an object even if the combined regex does not match its name.
+        self._unnamed = any(not rule.has_name_condition() for rule in rules) or bool(self._separate)
+        self._regex = None
+        if self._patterns:
+            self._regex = re.compile("|".join(f"(?P<_r{index}>{p.pattern})" for index, p in self._patterns.items()))
+
+    def evaluate(self, obj: docspec.ApiObject) -> t.Optional[bool]:
+        """
+        Returns whether the first matching rule keeps the object, or #None if no rule matches it.
+        """
+
+        name = obj.name
+        match = self._regex.match(name) if self._regex else None
+        if match is None and not self._unnamed:
+            return None
+
+        # The regex engine tries the alternatives in order, thus the combined patterns of all rules before the
+        # group that matched can not match, and those after it need to be checked individually.
+        matched_index = -1
+        if match is not None:
+            matched_index = next(i for i in self._patterns if match.group(f"_r{i}") is not None)
+
+        for index, rule in self._rules:
+            if rule.has_name_condition():
+                if index == matched_index:
+                    pass
+                elif match is not None and index > matched_index and index in self._patterns:
+                    if not self._patterns[index].match(name) and not self._match_separate(index, name):
+                        continue
+                elif not self._match_separate(index, name):
+                    continue
+            if rule.matches_object(obj):
+                return rule.keep
+
+        return None
+
+    def _match_separate(self, index: int, name: str) -> bool:
+        return any(pattern.fullmatch(name) for pattern in self._separate.get(index, ()))
 
 
 @dataclasses.dataclass
@@ -40,6 +179,18 @@ class FilterProcessor(Processor):
       documented_only: false
     ```
 
+    Objects can also be filtered with a list of declarative #rules, which are faster to evaluate than
+    an #expression. The first #FilterRule that matches an API object decides whether it is kept:
+
+    ```yaml
+    - type: filter
+      rules:
+        - names: ['test_*']
+          keep: false
+        - kinds: [function]
+          decorators: [public]
+    ```
+
     ### Options
     """
 
@@ -50,6 +201,11 @@ class FilterProcessor(Processor):
     #: semantic as not specifying this field. Default: `null`
     expression: t.Optional[str] = None
 
+    #: A list of #FilterRule#s. The first rule that matches an API object decides whether it is kept or
+    #: removed, before any of the other options below are considered. Rules are part of the `default()`
+    #: semantics of the #expression.
+    rules: t.List[FilterRule] = dataclasses.field(default_factory=list)
+
     #: Keep only API objects that have docstrings. Default: `true`
     documented_only: bool = True
 
@@ -69,32 +225,68 @@ class FilterProcessor(Processor):
 
     SPECIAL_MEMBERS = ("__path__", "__annotations__", "__name__", "__all__")
 
-    def process(self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver]) -> None:
-        def m(obj):
-            return self._match(obj)
+    def __post_init__(self) -> None:
+        self._compiled_key: t.Optional[t.Tuple[t.Optional[str], t.List[FilterRule]]] = None
+        self._predicate: t.Optional[t.Callable[[docspec.ApiObject], bool]] = None
 
-        docspec.filter_visit(t.cast(t.List[docspec.ApiObject], modules), m, order="post")
+    def _get_predicate(self) -> t.Callable[[docspec.ApiObject], bool]:
+        """
+        Returns the predicate compiled from the #expression and #rules. The predicate is compiled again
+        only if either of them has changed since it was last compiled.
+        """
 
-    def _match(self, obj: docspec.ApiObject) -> bool:
-        members = getattr(obj, "members", [])
+        key = (self.expression, self.rules)
+        if self._predicate is None or key != self._compiled_key:
+            self._predicate = self._compile()
+            self._compiled_key = (self.expression, copy.deepcopy(self.rules))
+        return self._predicate
 
-        def _check():
+    def _compile(self) -> t.Callable[[docspec.ApiObject], bool]:
+        rules = _CompiledRules(self.rules) if self.rules else None
+
+        def _check(obj: docspec.ApiObject) -> bool:
+            if rules:
+                keep = rules.evaluate(obj)
+                if keep is not None:
+                    return keep
+            members = getattr(obj, "members", None)
             if members:
                 return True
-            if self.skip_empty_modules and isinstance(obj, docspec.Module) and not members:
+            is_module = isinstance(obj, docspec.Module)
+            if self.skip_empty_modules and is_module:
                 return False
-            if self.do_not_filter_modules and isinstance(obj, docspec.Module):
+            if self.do_not_filter_modules and is_module:
                 return True
             if self.documented_only and not obj.docstring:
                 return False
-            if self.exclude_private and obj.name.startswith("_") and not obj.name.endswith("_"):
+            name = obj.name
+            if self.exclude_private and name.startswith("_") and not name.endswith("_"):
                 return False
-            if self.exclude_special and obj.name in self.SPECIAL_MEMBERS:
+            if self.exclude_special and name in self.SPECIAL_MEMBERS:
                 return False
             return True
 
-        if self.expression:
-            scope = {"name": obj.name, "obj": obj, "default": _check}
-            return bool(eval(self.expression, scope))  # pylint: disable=eval-used
+        if not self.expression:
+            return _check
+
+        code = compile(self.expression, "<FilterProcessor.expression>", "eval")
+        scope: t.Dict[str, t.Any] = {}
+        scope["default"] = lambda: _check(scope["obj"])
+
+        def _eval(obj: docspec.ApiObject) -> bool:
+            scope["name"] = obj.name
+            scope["obj"] = obj
+            return bool(eval(code, scope))  # pylint: disable=eval-used
+
+        return _eval
+
+    def process(self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver]) -> None:
+        docspec.filter_visit(t.cast(t.List[docspec.ApiObject], modules), self._get_predicate(), order="post")
+
+    def _match(self, obj: docspec.ApiObject) -> bool:
+        return self._get_predicate()(obj)
+
+    # PluginBase
 
-        return _check()
+    def init(self, context: Context) -> None:
+        self._get_predicate()
@@ -24,10 +24,12 @@ import logging
 import typing as t
 
 import docspec
-import docstring_parser
 
 from pydoc_markdown.interfaces import Processor, Resolver
 
+if t.TYPE_CHECKING:
+    import docstring_parser
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,7 +101,7 @@ class SphinxProcessor(Processor):
     def process(self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver]) -> None:
         docspec.visit(modules, self._process)
 
-    def _convert_raises(self, raises: t.List[docstring_parser.common.DocstringRaises]) -> list:
+    def _convert_raises(self, raises: t.List["docstring_parser.common.DocstringRaises"]) -> list:
         """Convert a list of DocstringRaises from docstring_parser to markdown lines
 
         :return: A list of markdown formatted lines
@@ -109,7 +111,7 @@ class SphinxProcessor(Processor):
             converted_lines.append("- `{}`: {}".format(entry.type_name, entry.description))
         return converted_lines
 
-    def _convert_params(self, params: t.List[docstring_parser.common.DocstringParam]) -> list:
+    def _convert_params(self, params: t.List["docstring_parser.common.DocstringParam"]) -> list:
         """Convert a list of DocstringParam to markdown lines.
 
         :return: A list of markdown formatted lines
@@ -126,7 +128,7 @@ class SphinxProcessor(Processor):
                 )
         return converted
 
-    def _convert_returns(self, returns: t.Optional[docstring_parser.common.DocstringReturns]) -> str:
+    def _convert_returns(self, returns: t.Optional["docstring_parser.common.DocstringReturns"]) -> str:
         """Convert a DocstringReturns object to a markdown string.
 
         :return: A markdown formatted string
@@ -145,6 +147,8 @@ class SphinxProcessor(Processor):
         if not node.docstring:
             return
 
+        import docstring_parser
+
         lines = []
         components: t.Dict[str, t.List[str]] = {}
 
@@ -1,6 +1,7 @@
 # -*- coding: utf8 -*-
 
 import dataclasses
+import io
 import json
 import logging
 import os
@@ -12,11 +13,26 @@ import typing_extensions as te
 from databind.core import DeserializeAs
 
 from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
-from pydoc_markdown.interfaces import Context, Renderer
+from pydoc_markdown.interfaces import Context, IncrementalRenderer, Renderer
 
 logger = logging.getLogger(__name__)
 
 
+def _write_if_changed(path: Path, content: str, encoding: str) -> bool:
+    """
+    Writes *content* to *path* unless the file already has that content. Returns #True if the file was written.
+    """
+
+    try:
+        if path.read_text(encoding=encoding) == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    with path.open("w", encoding=encoding) as fp:
+        fp.write(content)
+    return True
+
+
 @dataclasses.dataclass
 class CustomizedMarkdownRenderer(MarkdownRenderer):
     """We override some defaults in this subclass."""
@@ -34,7 +50,7 @@ class CustomizedMarkdownRenderer(MarkdownRenderer):
 
 
 @dataclasses.dataclass
-class DocusaurusRenderer(Renderer):
+class DocusaurusRenderer(Renderer, IncrementalRenderer):
     """
     Produces Markdown files and a `sidebar.json` file for use in a [Docusaurus v2][1] websites.
     It creates files in a fixed layout that reflects the structure of the documented packages.
@@ -72,18 +88,36 @@ class DocusaurusRenderer(Renderer):
     #: module name will be used. This option assumes that there is only one top-level module.
     sidebar_top_level_module_label: t.Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self._output_files: t.Optional[t.List[str]] = None
+
     def init(self, context: Context) -> None:
         self.markdown.init(context)
 
+    def _render_module(self, module: docspec.Module) -> str:
+        fp = io.StringIO()
+        self.markdown.render_single_page(fp, [module])
+        return fp.getvalue()
+
+    def _get_module_parts(self, module: docspec.Module) -> t.List[str]:
+        module_parts = module.name.split(".")
+        if module.location.filename.endswith("__init__.py"):
+            module_parts.append("__init__")
+        return module_parts
+
     def render(self, modules: t.List[docspec.Module]) -> None:
+        self._render(modules, None)
+
+    def render_changed(self, modules: t.List[docspec.Module], changed_modules: t.List[docspec.Module]) -> None:
+        self._render(modules, changed_modules)
+
+    def _render(self, modules: t.List[docspec.Module], changed_modules: t.Optional[t.List[docspec.Module]]) -> None:
         module_tree: t.Dict[str, t.Any] = {"children": {}, "edges": []}
         output_path = Path(self.docs_base_path) / self.relative_output_path
+        filepaths: t.List[Path] = []
         for module in modules:
             filepath = output_path
-
-            module_parts = module.name.split(".")
-            if module.location.filename.endswith("__init__.py"):
-                module_parts.append("__init__")
+            module_parts = self._get_module_parts(module)
 
             relative_module_tree = module_tree
             intermediary_module = []
@@ -101,17 +135,38 @@ class DocusaurusRenderer(Renderer):
             # create intermediary missing directories and get the full path
             filepath.mkdir(parents=True, exist_ok=True)
             filepath = filepath / f"{module_parts[-1]}.md"
-
-            with filepath.open("w", encoding=self.markdown.encoding) as fp:
-                logger.info("Render file %s", filepath)
-                self.markdown.render_single_page(fp, [module])
+            filepaths.append(filepath)
 
             # only update the relative module tree if the file is not empty
             relative_module_tree["edges"].append(os.path.splitext(str(filepath.relative_to(self.docs_base_path)))[0])
 
-        self._render_side_bar_config(module_tree)
+        jobs = list(zip(filepaths, modules))
+        if changed_modules is not None:
+            # Only render the files of the changed modules and remove the files of modules that were removed.
+            changed_names = {m.name for m in changed_modules}
+            jobs = [(f, m) for f, m in jobs if m.name in changed_names or not f.exists()]
+            for module in changed_modules:
+                parts = self._get_module_parts(module)
+                filepath = output_path.joinpath(*parts[:-1]) / f"{parts[-1]}.md"
+                if filepath not in filepaths and filepath.exists():
+                    logger.info("Remove file %s", filepath)
+                    filepath.unlink()
+
+        # Only write the files whose content changed such that the Docusaurus dev server does not reload
+        # unchanged docs.
+        for filepath, module in jobs:
+            if _write_if_changed(filepath, self._render_module(module), self.markdown.encoding):
+                logger.info("Render file %s", filepath)
+            else:
+                logger.debug("Unchanged file %s", filepath)
+
+        sidebar_path = self._render_side_bar_config(module_tree)
+        self._output_files = [str(x) for x in filepaths + [sidebar_path]]
+
+    def get_output_files(self) -> t.Optional[t.List[str]]:
+        return self._output_files
 
-    def _render_side_bar_config(self, module_tree: t.Dict[t.Text, t.Any]) -> None:
+    def _render_side_bar_config(self, module_tree: t.Dict[t.Text, t.Any]) -> Path:
         """
         Render sidebar configuration in a JSON file. See Docusaurus sidebar structure:
 
@@ -133,9 +188,10 @@ class DocusaurusRenderer(Renderer):
                 sidebar = sidebar["items"][0]
 
         sidebar_path = Path(self.docs_base_path) / self.relative_output_path / self.relative_sidebar_path
-        with sidebar_path.open("w") as handle:
+        sidebar_path.parent.mkdir(parents=True, exist_ok=True)
+        if _write_if_changed(sidebar_path, json.dumps(sidebar, indent=2, sort_keys=True), "utf-8"):
             logger.info("Render file %s", sidebar_path)
-            json.dump(sidebar, handle, indent=2, sort_keys=True)
+        return sidebar_path
 
     def _build_sidebar_tree(self, sidebar: t.Dict[t.Text, t.Any], module_tree: t.Dict[t.Text, t.Any]) -> None:
         """
@@ -23,6 +23,8 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import hashlib
+import json
 import logging
 import os
 import platform as _platform
@@ -32,11 +34,11 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import time
 import typing as t
 from urllib.parse import urljoin, urlparse
 
 import docspec
-import requests
 import tomli_w
 import typing_extensions as te
 import yaml
@@ -44,8 +46,9 @@ from databind.core import Remainder
 from nr.util.fs import chmod
 
 from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
-from pydoc_markdown.interfaces import Builder, Context, Renderer, Resolver, Server
-from pydoc_markdown.util.knownfiles import KnownFiles
+from pydoc_markdown.interfaces import Builder, Context, IncrementalRenderer, Renderer, Resolver, Server
+from pydoc_markdown.util.cache import get_user_cache_dir
+from pydoc_markdown.util.knownfiles import KnownFiles, hash_file
 from pydoc_markdown.util.pages import GenericPage, Page, Pages
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,10 @@ class GetHugo:
     version: t.Optional[str] = None
     extended: bool = True
 
+    #: The directory in which downloaded Hugo binaries are cached. Defaults to the `hugo` directory in the
+    #: Pydoc-Markdown user cache directory (e.g. `~/.cache/pydoc-markdown/hugo` on Linux).
+    cache_directory: t.Optional[str] = None
+
 
 @dataclasses.dataclass
 class HugoPage(GenericPage["HugoPage"]):
@@ -182,7 +189,7 @@ class HugoConfig:
 
 
 @dataclasses.dataclass
-class HugoRenderer(Renderer, Server, Builder):
+class HugoRenderer(Renderer, IncrementalRenderer, Server, Builder):
     """
     A renderer that produces Markdown files compatible with [Hugo][0]. The `--bootstrap hugo`
     option can be used to create a Pydoc-Markdown configuration file with the Hugo template.
@@ -225,8 +232,8 @@ class HugoRenderer(Renderer, Server, Builder):
     #: pages are written to. Default: `content`
     content_directory: str = "content"
 
-    #: Clean up files that were previously generated by the renderer before the next
-    #: render pass. Defaults to `True`.
+    #: Clean up files that were previously generated by the renderer but are not generated
+    #: again in the next render pass. Defaults to `True`.
     clean_render: bool = True
 
     #: The pages to render.
@@ -262,7 +269,13 @@ class HugoRenderer(Renderer, Server, Builder):
     def __post_init__(self) -> None:
         self._context: Context
 
-    def _render_page(self, modules: t.List[docspec.Module], page: HugoPage, filename: str):
+    def _render_page(
+        self,
+        modules: t.List[docspec.Module],
+        page: HugoPage,
+        filename: str,
+        opener: t.Optional[t.Callable[[str, str], t.ContextManager[t.TextIO]]] = None,
+    ):
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         preamble = dict(**self.default_preamble, **{"title": page.title}, **page.preamble)
 
@@ -271,14 +284,12 @@ class HugoRenderer(Renderer, Server, Builder):
             fp.write(yaml.safe_dump(preamble))
             fp.write("---\n\n")
 
-        page.render(filename, modules, self.markdown, self._context.directory, _write_prefix)
+        page.render(filename, modules, self.markdown, self._context.directory, _write_prefix, opener)
 
     def _get_hugo_bin(self):
         hugo_bin = shutil.which("hugo")
         if not hugo_bin and self.get_hugo.enabled:
-            hugo_bin = os.path.abspath(os.path.join(self.build_directory, ".bin", "hugo"))
-            if not os.path.isfile(hugo_bin):
-                install_hugo(hugo_bin, self.get_hugo.version, self.get_hugo.extended)
+            hugo_bin = get_hugo_binary(self.get_hugo.version, self.get_hugo.extended, self.get_hugo.cache_directory)
         if not hugo_bin:
             raise RuntimeError("Hugo is not installed")
         return hugo_bin
@@ -286,15 +297,14 @@ class HugoRenderer(Renderer, Server, Builder):
     # Renderer
 
     def render(self, modules: t.List[docspec.Module]) -> None:
-        known_files = KnownFiles(self.build_directory)
-        content_dir = os.path.join(self.build_directory, self.content_directory)
+        self._render(modules, None)
 
-        if self.clean_render:
-            for file_ in known_files.load():
-                try:
-                    os.remove(file_.name)
-                except FileNotFoundError as exc:
-                    pass
+    def render_changed(self, modules: t.List[docspec.Module], changed_modules: t.List[docspec.Module]) -> None:
+        self._render(modules, changed_modules)
+
+    def _render(self, modules: t.List[docspec.Module], changed_modules: t.Optional[t.List[docspec.Module]]) -> None:
+        known_files = KnownFiles(self.build_directory, remove_stale=self.clean_render)
+        content_dir = os.path.join(self.build_directory, self.content_directory)
 
         # Render the pages.
         with known_files:
@@ -307,8 +317,10 @@ class HugoRenderer(Renderer, Server, Builder):
                 filename = item.filename(page_content_dir, ".md", index_name="_index", skip_empty_pages=False)
                 if not filename:
                     continue
-                self._render_page(item.page.filtered_modules(modules), item.page, filename)
-                known_files.append(filename)
+                if item.page.is_up_to_date(filename, changed_modules):
+                    known_files.append(filename)
+                    continue
+                self._render_page(item.page.filtered_modules(modules), item.page, filename, known_files.open)
 
             # Render the config file.
             if self.config is not None:
@@ -319,6 +331,12 @@ class HugoRenderer(Renderer, Server, Builder):
                 with known_files.open(filename, "w") as fp:
                     self.config.to_toml(fp)
 
+    def get_output_files(self) -> t.Optional[t.List[str]]:
+        return [record.name for record in KnownFiles(self.build_directory).load()]
+
+    def get_input_files(self) -> t.List[str]:
+        return self.pages.get_source_files(self._context.directory)
+
     def get_resolver(self, modules: t.List[docspec.Module]) -> t.Optional[Resolver]:
         # TODO (@NiklasRosenstein): The resolver returned by the Markdown
         #   renderer does not implement linking across multiple pages.
@@ -356,17 +374,129 @@ class HugoRenderer(Renderer, Server, Builder):
         self.markdown.init(context)
 
 
-def install_hugo(to: str, version: str | None = None, extended: bool = True) -> None:
+#: The base URL of the GitHub API that Hugo releases are fetched from.
+GITHUB_API_URL = "https://api.github.com"
+
+#: The number of seconds after which the latest Hugo release is looked up again.
+HUGO_RELEASES_INDEX_MAX_AGE = 24 * 60 * 60
+
+
+def install_hugo(
+    to: str,
+    version: str | None = None,
+    extended: bool = True,
+    cache_dir: str | None = None,
+    api_url: str = GITHUB_API_URL,
+) -> None:
     """
     Downloads the latest release of *Hugo* from [Github](https://github.com/gohugoio/hugo/releases)
     and places it at the path specified by *to*. This will install the extended version if it is
-    available and *extended* is set to `True`.
+    available and *extended* is set to `True`. The binary is taken from the cache if available
+    (see #get_hugo_binary()).
 
     :param to: The file to write the Hugo binary to.
     :param version: The Hugo version to get. If not specified, the latest release will be used.
     :param extended: Whether to download the "Hugo extended" version. Defaults to True.
+    :param cache_dir: The directory in which Hugo binaries are cached.
+    :param api_url: The base URL of the GitHub API.
     """
 
+    binary = get_hugo_binary(version, extended, cache_dir, api_url)
+    os.makedirs(os.path.dirname(to), exist_ok=True)
+    shutil.copyfile(binary, to)
+    chmod.update(to, "+x")
+    logger.info('Hugo installed to "%s"', to)
+
+
+def get_hugo_binary(
+    version: str | None = None,
+    extended: bool = True,
+    cache_dir: str | None = None,
+    api_url: str = GITHUB_API_URL,
+) -> str:
+    """
+    Returns the path to a Hugo binary in the shared, versioned binary cache, downloading it from
+    [Github](https://github.com/gohugoio/hugo/releases) only if it is not already cached. The checksum of the
+    downloaded archive is verified against the checksums published with the release, and the checksum of the
+    cached binary is verified every time it is reused. Release metadata is stored in an index in the cache
+    directory such that no network access is required for repeated builds.
+
+    :param version: The Hugo version to get. If not specified, the latest release will be used. The latest
+        release is looked up again at most every #HUGO_RELEASES_INDEX_MAX_AGE seconds, and the cached
+        release metadata is used if GitHub cannot be reached.
+    :param extended: Whether to get the "Hugo extended" version, if available. Defaults to True.
+    :param cache_dir: The directory in which Hugo binaries are cached. Defaults to the `hugo` directory in
+        the Pydoc-Markdown user cache directory.
+    :param api_url: The base URL of the GitHub API.
+    """
+
+    cache_dir = cache_dir or os.path.join(get_user_cache_dir(), "hugo")
+    platform, arch = _get_hugo_platform()
+    index = _HugoReleasesIndex(cache_dir, api_url)
+
+    if version:
+        version = version.lstrip("v")
+    else:
+        version = index.get_latest_version()
+
+    variant = "{}-{}-{}".format("extended" if extended else "standard", platform, arch)
+    binary = os.path.join(cache_dir, version, variant, "hugo")
+    if _verify_hugo_binary(binary):
+        logger.debug('Using cached Hugo v%s from "%s"', version, binary)
+        return binary
+
+    assets = index.get_assets(version)
+    hugo_archive = "hugo_{}_{}-{}.tar.gz".format(version, platform, arch)
+    hugo_extended_archive = "hugo_extended_{}_{}-{}.tar.gz".format(version, platform, arch)
+    if extended and hugo_extended_archive in assets:
+        filename = hugo_extended_archive
+    elif hugo_archive in assets:
+        filename = hugo_archive
+    else:
+        raise ValueError("no Hugo v{} release archive found for {}-{}".format(version, platform, arch))
+
+    import requests
+
+    checksums: t.Dict[str, str] = {}
+    checksums_file = "hugo_{}_checksums.txt".format(version)
+    if checksums_file in assets:
+        response = requests.get(assets[checksums_file])
+        response.raise_for_status()
+        for line in response.text.splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                checksums[parts[1]] = parts[0]
+    else:
+        logger.warning("Hugo v%s release has no %s, cannot verify the download", version, checksums_file)
+
+    logger.info('Downloading Hugo v%s from "%s"', version, assets[filename])
+    os.makedirs(os.path.dirname(binary), exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(binary)) as tempdir:
+        path = os.path.join(tempdir, filename)
+        archive_hash = hashlib.sha256()
+        with requests.get(assets[filename], stream=True) as response, open(path, "wb") as fp:
+            response.raise_for_status()
+            for chunk in response.iter_content(2**16):
+                archive_hash.update(chunk)
+                fp.write(chunk)
+        if filename in checksums and checksums[filename] != archive_hash.hexdigest():
+            raise RuntimeError("checksum mismatch for downloaded Hugo archive {!r}".format(filename))
+
+        tmp_binary = os.path.join(tempdir, "hugo")
+        with tarfile.open(path) as archive:
+            with open(tmp_binary, "wb") as fp:
+                shutil.copyfileobj(t.cast(t.IO[bytes], archive.extractfile("hugo")), t.cast(t.IO[bytes], fp))  # type: ignore[misc]  # See https://github.com/python/mypy/issues/15031  # noqa: E501
+        chmod.update(tmp_binary, "+x")
+
+        with open(binary + ".sha256", "w") as fp:
+            fp.write(hash_file(tmp_binary, "sha256"))
+        os.replace(tmp_binary, binary)
+
+    logger.info('Hugo v%s installed to "%s"', version, binary)
+    return binary
+
+
+def _get_hugo_platform() -> t.Tuple[str, str]:
     # TODO (@NiklasRosenstein): Support BSD platforms.
 
     if sys.platform.startswith("linux"):
@@ -386,39 +516,86 @@ def install_hugo(to: str, version: str | None = None, extended: bool = True) ->
     else:
         raise EnvironmentError("unsure whether to interpret {!r} as 32- or 64-bit.".format(machine))
 
-    releases = get_github_releases("gohugoio/hugo")
-    if version:
-        version = version.lstrip("v")
-        for release in releases:
-            if release["tag_name"].lstrip("v") == version:
-                break
-        else:
-            raise ValueError("no Hugo release for version {!r} found".format(version))
-    else:
-        release = next(releases)
-        version = release["tag_name"].lstrip("v")
+    return platform, arch
 
-    files = {asset["name"]: asset["browser_download_url"] for asset in release["assets"]}
 
-    hugo_archive = "hugo_{}_{}-{}.tar.gz".format(version, platform, arch)
-    hugo_extended_archive = "hugo_extended_{}_{}-{}.tar.gz".format(version, platform, arch)
-    if extended and hugo_extended_archive in files:
-        filename = hugo_extended_archive
-    else:
-        filename = hugo_archive
+def _verify_hugo_binary(binary: str) -> bool:
+    try:
+        with open(binary + ".sha256") as fp:
+            expected = fp.read().strip()
+        actual = hash_file(binary, "sha256")
+    except FileNotFoundError:
+        return False
+    if actual != expected:
+        logger.warning('Cached Hugo binary "%s" does not match its checksum and will be downloaded again', binary)
+        return False
+    return True
 
-    logger.info('Downloading Hugo v%s from "%s"', version, files[filename])
-    os.makedirs(os.path.dirname(to), exist_ok=True)
-    with tempfile.TemporaryDirectory() as tempdir:
-        path = os.path.join(tempdir, filename)
-        with open(path, "wb") as fp:
-            shutil.copyfileobj(requests.get(files[filename], stream=True).raw, fp)
-        with tarfile.open(path) as archive:
-            with open(to, "wb") as fp:
-                shutil.copyfileobj(t.cast(t.IO[bytes], archive.extractfile("hugo")), t.cast(t.IO[bytes], fp))  # type: ignore[misc]  # See https://github.com/python/mypy/issues/15031  # noqa: E501
 
-    chmod.update(to, "+x")
-    logger.info('Hugo v%s installed to "%s"', version, to)
+class _HugoReleasesIndex:
+    """
+    The Hugo release metadata stored in the cache directory. Maps every known version to the names and
+    download URLs of the release assets.
+    """
+
+    def __init__(self, cache_dir: str, api_url: str) -> None:
+        self._filename = os.path.join(cache_dir, "releases.json")
+        self._api_url = api_url.rstrip("/")
+        try:
+            with open(self._filename) as fp:
+                self._data = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            self._data = {}
+        self._data.setdefault("releases", {})
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self._filename), exist_ok=True)
+        tmp_filename = "{}.{}.tmp".format(self._filename, os.getpid())
+        with open(tmp_filename, "w") as fp:
+            json.dump(self._data, fp)
+        os.replace(tmp_filename, self._filename)
+
+    def _fetch(self, path: str) -> str:
+        import requests
+
+        response = requests.get("{}/repos/gohugoio/hugo/releases/{}".format(self._api_url, path))
+        response.raise_for_status()
+        release = response.json()
+        version = release["tag_name"].lstrip("v")
+        assets = {asset["name"]: asset["browser_download_url"] for asset in release["assets"]}
+        self._data["releases"][version] = assets
+        return version
+
+    def get_latest_version(self) -> str:
+        import requests
+
+        latest = self._data.get("latest")
+        if latest and time.time() - self._data.get("latest_updated", 0) < HUGO_RELEASES_INDEX_MAX_AGE:
+            return t.cast(str, latest)
+        try:
+            latest = self._fetch("latest")
+        except requests.RequestException:
+            if not latest:
+                raise
+            logger.warning("Could not look up the latest Hugo release, using cached latest release v%s", latest)
+            return t.cast(str, latest)
+        self._data["latest"] = latest
+        self._data["latest_updated"] = time.time()
+        self._save()
+        return t.cast(str, latest)
+
+    def get_assets(self, version: str) -> t.Dict[str, str]:
+        import requests
+
+        if version not in self._data["releases"]:
+            try:
+                self._fetch("tags/v" + version)
+            except requests.HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    raise ValueError("no Hugo release for version {!r} found".format(version))
+                raise
+            self._save()
+        return t.cast(t.Dict[str, str], self._data["releases"][version])
 
 
 def get_github_releases(repo: str) -> t.Generator[dict, None, None]:
@@ -426,13 +603,13 @@ def get_github_releases(repo: str) -> t.Generator[dict, None, None]:
     Returns an iterator for all releases of a Github repository.
     """
 
+    import requests
+
     url: t.Optional[str] = "https://api.github.com/repos/{}/releases".format(repo)
     while url:
         response = requests.get(url)
         link = response.headers.get("Link")
-        assert link
-        links = parse_links_header(link)
-        url = links.get("next")
+        url = parse_links_header(link).get("next") if link else None
         yield from response.json()
 
 
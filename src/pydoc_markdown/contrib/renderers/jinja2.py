@@ -5,8 +5,10 @@ at any point on future Pydoc-Markdown versions.
 
 import dataclasses as D
 import fnmatch
+import json
 import logging
 import os
+import re
 import typing as t
 
 import docspec
@@ -14,29 +16,138 @@ import jinja2
 from docspec_python import format_arglist
 
 from pydoc_markdown.contrib.renderers.markdown import MarkdownReferenceResolver
-from pydoc_markdown.interfaces import Renderer, Resolver
+from pydoc_markdown.interfaces import IncrementalRenderer, Renderer, Resolver
+from pydoc_markdown.util.cache import get_user_cache_dir
 from pydoc_markdown.util.docspec import format_function_signature, get_members_of_type, get_object_description
 
 T = t.TypeVar("T")
 log = logging.getLogger(__name__)
 
 
+class ModuleIndex:
+    """
+    An index of the modules by name and of the members of API objects by kind. It is available to templates
+    as `module_index` and backs the `classes`, `functions` and `attrs` filters, such that templates that query
+    the members of the same objects repeatedly do not traverse them again every time.
+    """
+
+    _KINDS: t.Dict[str, t.Type[docspec.ApiObject]] = {
+        "classes": docspec.Class,
+        "functions": docspec.Function,
+        "attrs": docspec.Variable,
+    }
+
+    def __init__(self, modules: t.List[docspec.Module]) -> None:
+        self.modules = modules
+        self._by_name: t.Dict[str, docspec.Module] = {}
+        for module in modules:
+            self._by_name.setdefault(module.name, module)
+        self._positions = {id(m): i for i, m in enumerate(modules)}
+        self._patterns: t.Dict[str, t.List[docspec.Module]] = {}
+        self._members: t.Dict[t.Tuple[int, str], t.List[docspec.ApiObject]] = {}
+        self._member_lists: t.Dict[t.Tuple[t.Tuple[int, ...], str], t.List[docspec.ApiObject]] = {}
+
+    def get_module(self, name: str) -> t.Optional[docspec.Module]:
+        """
+        Returns the first module with the given *name*, or #None.
+        """
+
+        return self._by_name.get(name)
+
+    def _match(self, pattern: str) -> t.List[docspec.Module]:
+        try:
+            return self._patterns[pattern]
+        except KeyError:
+            regex = re.compile(fnmatch.translate(pattern))
+            result = self._patterns[pattern] = [m for m in self.modules if m.name == pattern or regex.match(m.name)]
+            return result
+
+    def select_modules(self, patterns: t.Union[str, t.List[str]]) -> t.List[docspec.Module]:
+        """
+        Returns the modules whose names match any of the given glob *patterns*, in their original order.
+        """
+
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        selected: t.Dict[int, docspec.Module] = {}
+        for pattern in patterns:
+            for module in self._match(pattern):
+                selected.setdefault(id(module), module)
+        if len(patterns) == 1:
+            return list(selected.values())
+        return sorted(selected.values(), key=lambda m: self._positions[id(m)])
+
+    def _get_members(self, obj: docspec.ApiObject, kind: str) -> t.List[docspec.ApiObject]:
+        key = (id(obj), kind)
+        if key not in self._members:
+            # Partition the members of the object by all kinds in one pass.
+            partitions: t.Dict[str, t.List[docspec.ApiObject]] = {name: [] for name in self._KINDS}
+            for member in obj.members if isinstance(obj, docspec.HasMembers) else []:
+                for name, type_ in self._KINDS.items():
+                    if isinstance(member, type_):
+                        partitions[name].append(member)
+            self._members.update(((id(obj), name), members) for name, members in partitions.items())
+        return self._members[key]
+
+    def get_members(
+        self, objs: t.Union[docspec.ApiObject, t.Iterable[docspec.ApiObject]], kind: str
+    ) -> t.List[docspec.ApiObject]:
+        """
+        Returns the members of the given kind (`classes`, `functions` or `attrs`) of the API object *objs*, or
+        of all API objects in the iterable *objs*.
+        """
+
+        if kind not in self._KINDS:
+            raise ValueError(f"unknown member kind: {kind!r}")
+        if isinstance(objs, docspec.ApiObject):
+            return self._get_members(objs, kind)
+        # Jinja2 filters such as `selectattr` pass generators, which can only be iterated once.
+        objs = list(objs)
+        key = (tuple(map(id, objs)), kind)
+        if key not in self._member_lists:
+            self._member_lists[key] = [x for obj in objs for x in self._get_members(obj, kind)]
+        return self._member_lists[key]
+
+    def classes(self, objs: t.Union[docspec.ApiObject, t.Iterable[docspec.ApiObject]]) -> t.List[docspec.ApiObject]:
+        return self.get_members(objs, "classes")
+
+    def functions(self, objs: t.Union[docspec.ApiObject, t.Iterable[docspec.ApiObject]]) -> t.List[docspec.ApiObject]:
+        return self.get_members(objs, "functions")
+
+    def attrs(self, objs: t.Union[docspec.ApiObject, t.Iterable[docspec.ApiObject]]) -> t.List[docspec.ApiObject]:
+        return self.get_members(objs, "attrs")
+
+
 class Args(t.Dict[str, t.Any]):
-    def get_render_args(self, modules: t.List[docspec.Module]) -> t.Dict[str, t.Any]:
+    def get_render_args(
+        self, modules: t.List[docspec.Module], index: t.Optional[ModuleIndex] = None
+    ) -> t.Dict[str, t.Any]:
+        index = index or ModuleIndex(modules)
         args = dict(self)
+        args.setdefault("module_index", index)
         if "module" in args:
-            try:
-                args["module"] = next((m for m in modules if m.name == args["module"]))
-            except StopIteration:
+            module = index.get_module(args["module"])
+            if module is None:
                 raise ValueError(f'module {args["module"]} not found')
+            args["module"] = module
         if "modules" in args:
-            args["modules"] = [
-                m
-                for m in modules
-                if m.name in args["modules"] or any(fnmatch.fnmatch(m.name, x) for x in args["modules"])
-            ]
+            args["modules"] = index.select_modules(args["modules"])
         return args
 
+    def may_include(self, module_names: t.Set[str]) -> bool:
+        """
+        Returns #True if the output rendered with these arguments may include objects from any of the modules
+        with the given names. Outputs that select no modules may include objects from any module.
+        """
+
+        if "module" not in self and "modules" not in self:
+            return True
+        patterns = self.get("modules", [])
+        patterns = [patterns] if isinstance(patterns, str) else list(patterns)
+        if "module" in self:
+            patterns.append(self["module"])
+        return any(name == p or fnmatch.fnmatch(name, p) for p in patterns for name in module_names)
+
 
 @D.dataclass
 class RenderBlock:
@@ -51,38 +162,108 @@ class RenderBlock:
 
 
 @D.dataclass
-class Jinja2Renderer(Renderer):
+class Jinja2Renderer(Renderer, IncrementalRenderer):
     #: Render instructions.
     renders: t.List[RenderBlock]
 
     #: Build directory where all the files are produced.
     build_directory: str = "build/docs"
 
+    #: The directory in which compiled templates are cached across runs. Defaults to the `jinja2` directory
+    #: in the Pydoc-Markdown user cache directory. Set to an empty string to disable the bytecode cache.
+    bytecode_cache_directory: t.Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self._resolver = MarkdownReferenceResolver()
+        self._environments: t.Dict[str, jinja2.Environment] = {}
+        self._output_files: t.Optional[t.List[str]] = None
+        self._input_files: t.List[str] = []
+
+    def _get_environment(self, settings: t.Dict[str, t.Any]) -> jinja2.Environment:
+        """
+        Returns the Jinja2 environment for the given *settings*. Render blocks with identical settings share
+        the same environment, and the environments are kept across renders (e.g. with `--server`) such that
+        templates are only compiled again if they change.
+        """
+
+        key = json.dumps(settings, sort_keys=True, default=repr)
+        env = self._environments.get(key)
+        if env is None:
+            if self.bytecode_cache_directory is None:
+                cache_dir: t.Optional[str] = os.path.join(get_user_cache_dir(), "jinja2")
+            else:
+                cache_dir = self.bytecode_cache_directory or None
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+                settings = {"bytecode_cache": jinja2.FileSystemBytecodeCache(cache_dir), **settings}
+            env = jinja2.Environment(loader=jinja2.FileSystemLoader("."), **settings)
+            setup_env(env)
+            env.filters["uid"] = self._resolver.generate_object_id
+            self._environments[key] = env
+        return env
+
+    def _render_file(self, template: jinja2.Template, filename: str, args: t.Dict[str, t.Any]) -> None:
+        log.info("Writing %s", filename)
+        with open(filename, "w") as fp:
+            fp.writelines(template.generate(**args))
+
     def render(self, modules: t.List[docspec.Module]) -> None:
+        self._render(modules, None)
+
+    def render_changed(self, modules: t.List[docspec.Module], changed_modules: t.List[docspec.Module]) -> None:
+        self._render(modules, {m.name for m in changed_modules})
+
+    def _render(self, modules: t.List[docspec.Module], changed_names: t.Optional[t.Set[str]]) -> None:
         # TODO (@NiklasRosenstein): Clean render support
 
-        resolver = MarkdownReferenceResolver()
         os.makedirs(self.build_directory, exist_ok=True)
 
+        index = ModuleIndex(modules)
+        output_files = []
+        templates = []
         for render in self.renders:
-            env = jinja2.Environment(loader=jinja2.FileSystemLoader("."), **render.jinja2_environment_settings)
-            setup_env(env)
-            env.filters["uid"] = resolver.generate_object_id
-            template = env.get_template(render.template)
+            template = self._get_environment(render.jinja2_environment_settings).get_template(render.template)
+            templates.append(template)
             for filename, args in render.produces.items():
                 filename = os.path.join(self.build_directory, filename + ".md")
-                log.info("Writing %s", filename)
-                with open(filename, "w") as fp:
-                    fp.write(template.render(**Args(args).get_render_args(modules)))  # TODO
+                output_files.append(filename)
+                args = Args(args)
+                if changed_names is not None and not args.may_include(changed_names) and os.path.isfile(filename):
+                    continue
+                self._render_file(template, filename, args.get_render_args(modules, index))
+
+        self._output_files = output_files
+
+        # Includes the templates that were loaded by other templates (e.g. with `{% include %}`).
+        input_files = {x.filename for env in self._environments.values() for x in (env.cache or {}).values()}
+        input_files.update(x.filename for x in templates)
+        self._input_files = sorted(os.path.abspath(x) for x in input_files if x)
+
+    def get_output_files(self) -> t.Optional[t.List[str]]:
+        return self._output_files
+
+    def get_input_files(self) -> t.List[str]:
+        return self._input_files
 
     def get_resolver(self, modules: t.List[docspec.Module]) -> t.Optional[Resolver]:
         return MarkdownReferenceResolver()
 
 
+def _members_filter(kind: str, type_: t.Type[docspec.ApiObject]) -> t.Callable[..., t.List[docspec.ApiObject]]:
+    @jinja2.pass_context
+    def _filter(context: jinja2.runtime.Context, objs: t.Any) -> t.List[docspec.ApiObject]:
+        index = context.get("module_index")
+        if isinstance(index, ModuleIndex):
+            return index.get_members(objs, kind)
+        return get_members_of_type(objs, type_)
+
+    return _filter
+
+
 def setup_env(env: jinja2.Environment) -> None:
-    env.filters["classes"] = lambda modules: get_members_of_type(modules, docspec.Class)
-    env.filters["functions"] = lambda objs: get_members_of_type(objs, docspec.Function)
-    env.filters["attrs"] = lambda objs: get_members_of_type(objs, docspec.Variable)
+    env.filters["classes"] = _members_filter("classes", docspec.Class)
+    env.filters["functions"] = _members_filter("functions", docspec.Function)
+    env.filters["attrs"] = _members_filter("attrs", docspec.Variable)
     env.filters["indent"] = _indent_filter
     env.filters["blockquote"] = _blockquote_filter
     env.filters["first_line"] = _first_line_filter
@@ -22,26 +22,29 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import io
 import sys
 import typing as t
 from pathlib import Path
 
 import docspec
-from docspec_python import format_arglist
-from yapf.yapflib.yapf_api import FormatCode  # type: ignore[import]
 
 from pydoc_markdown.interfaces import (
     Context,
     Renderer,
     Resolver,
     ResolverV2,
+    Server,
+    ServerProcess,
     SingleObjectRenderer,
     SinglePageRenderer,
     SourceLinker,
 )
 from pydoc_markdown.util.docspec import ApiSuite, format_function_signature, is_method
 from pydoc_markdown.util.misc import escape_except_blockquotes
+from pydoc_markdown.util.pages import Page, Pages
+from pydoc_markdown.util.preview import PreviewPage, PreviewServer
 
 
 def dotted_name(obj: docspec.ApiObject) -> str:
@@ -49,12 +52,17 @@ def dotted_name(obj: docspec.ApiObject) -> str:
 
 
 @dataclasses.dataclass
-class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer):
+class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer, Server):
     """
     Produces Markdown files. This renderer is often used by other renderers, such as
     #MkdocsRenderer and #HugoRenderer. It provides a wide variety of options to customize
     the generated Markdown files.
 
+    With the `pydoc-markdown --server` option, the Markdown is not written to the #filename
+    but served as HTML by a built-in preview server instead. The page is only rendered when
+    it is requested and cached until the source files change. Install the `markdown` package
+    (or the `preview` extra) to convert the Markdown to HTML, otherwise it is displayed as text.
+
     ### Options
     """
 
@@ -222,8 +230,20 @@ class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer):
     #: a file relative to the context directory (usually the working directory).
     format_code_style: str = "pep8"
 
+    #: Port for the built-in preview server when using the `pydoc-markdown --server` option.
+    #: Defaults to `8000`.
+    server_port: int = 8000
+
+    #: A hierarchy of pages to split the preview into when using the `pydoc-markdown --server` option. Each
+    #: page is served at the path of its names (e.g. `/api/module`), the first page also at `/`. If not set,
+    #: all modules are previewed on a single page. This does not affect the rendered #filename.
+    preview_pages: Pages[Page] = dataclasses.field(default_factory=Pages)
+
+    renders_on_demand = True
+
     def __post_init__(self) -> None:
         self._resolver = MarkdownReferenceResolver()
+        self._preview_server: t.Optional[PreviewServer] = None
 
     def _is_method(self, obj: docspec.ApiObject) -> bool:
         return is_method(obj)
@@ -232,6 +252,8 @@ class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer):
         args = func.args[:]
         if self._is_method(func) and args and args[0].name == "self":
             args.pop(0)
+        from docspec_python import format_arglist
+
         return format_arglist(args)
 
     def _render_toc(self, fp: t.TextIO, level: int, obj: docspec.ApiObject):
@@ -287,6 +309,8 @@ class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer):
     def _yapf_code(self, code: str) -> str:
         if not self.format_code:
             return code
+        from yapf.yapflib.yapf_api import FormatCode  # type: ignore[import]
+
         style_file = Path(self._context.directory) / self.format_code_style
         style = str(style_file) if style_file.is_file() else self.format_code_style
         return FormatCode(code, style_config=style)[0]
@@ -478,13 +502,48 @@ class MarkdownRenderer(Renderer, SinglePageRenderer, SingleObjectRenderer):
 
         return self._resolver
 
+    def _get_preview_pages(self, modules: t.List[docspec.Module]) -> t.Dict[str, PreviewPage]:
+        if not self.preview_pages:
+            title = Path(self.filename).stem if self.filename else "API Documentation"
+            return {"/": PreviewPage(title, lambda: self.render_to_string(modules))}
+
+        def _render_page(page: Page) -> str:
+            if page.source:
+                return Path(self._context.directory, page.source).read_text(encoding=self.encoding)
+            fp = io.StringIO()
+            self.render_single_page(fp, page.filtered_modules(modules), page.title)
+            return fp.getvalue()
+
+        result = {}
+        for item in self.preview_pages.iter_hierarchy():
+            if item.page.has_content():
+                path = "/" + "/".join(t.cast(str, p.name) for p in item.parent_chain + [item.page])
+                result[path] = PreviewPage(item.page.title, functools.partial(_render_page, item.page))
+        if result and "/" not in result:
+            result = {"/": next(iter(result.values())), **result}
+        return result
+
     def render(self, modules: t.List[docspec.Module]) -> None:
-        if self.filename is None:
+        if self._preview_server is not None and self._preview_server.poll() is None:
+            self._preview_server.update(self._get_preview_pages(modules))
+        elif self.filename is None:
             self._render_to_stream(modules, sys.stdout)
         else:
             with io.open(self.filename, "w", encoding=self.encoding) as fp:
                 self._render_to_stream(modules, t.cast(t.TextIO, fp))
 
+    def get_output_files(self) -> t.Optional[t.List[str]]:
+        return [self.filename] if self.filename else None
+
+    # Server
+
+    def get_server_url(self) -> str:
+        return "http://localhost:{}/".format(self.server_port)
+
+    def start_server(self) -> ServerProcess:
+        self._preview_server = PreviewServer("localhost", self.server_port)
+        return self._preview_server
+
     # PluginBase
 
     def init(self, context: Context) -> None:
@@ -545,20 +604,14 @@ class MarkdownReferenceResolver(Resolver, ResolverV2):
             return resolved
 
         if self.global_:
-
-            def _recurse(obj: docspec.ApiObject) -> t.Optional[docspec.ApiObject]:
-                resolved = self._resolve_reference_in_members(obj, ref_split)
-                if resolved:
-                    return resolved
-                if isinstance(obj, docspec.HasMembers):
-                    for member in obj.members:
-                        resolved = _recurse(member)
-                        if resolved:
-                            return resolved
-                return None
-
-            for module in suite:
-                resolved = _recurse(module)
+            # Only objects that have a member named like the first part of the reference can resolve it. We try
+            # them in the same order as a pre-order traversal of the suite would.
+            parents: t.Dict[int, docspec.ApiObject] = {}
+            for obj in suite.get_objects_by_name(ref_split[0]):
+                if obj.parent is not None:
+                    parents.setdefault(id(obj.parent), obj.parent)
+            for parent in sorted(parents.values(), key=suite.get_position):
+                resolved = self._resolve_reference_in_members(parent, ref_split)
                 if resolved:
                     return resolved
 
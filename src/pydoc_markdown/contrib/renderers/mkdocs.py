@@ -33,7 +33,7 @@ import yaml
 from databind.core import DeserializeAs
 
 from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
-from pydoc_markdown.interfaces import Builder, Context, Renderer, Resolver, Server
+from pydoc_markdown.interfaces import Builder, Context, IncrementalRenderer, Renderer, Resolver, Server, ServerProcess
 from pydoc_markdown.util.knownfiles import KnownFiles
 from pydoc_markdown.util.pages import Page, Pages
 
@@ -48,7 +48,7 @@ class CustomizedMarkdownRenderer(MarkdownRenderer):
 
 
 @dataclasses.dataclass
-class MkdocsRenderer(Renderer, Server, Builder):
+class MkdocsRenderer(Renderer, IncrementalRenderer, Server, Builder):
     """
     Produces Markdown files in a layout compatible with [MkDocs][0] and can be used with the
     Pydoc-Markdown `--server` option for a live-preview. The `--bootstrap mkdocs` option can
@@ -81,8 +81,8 @@ class MkdocsRenderer(Renderer, Server, Builder):
     #: Name of the content directory (inside the #output_directory). Defaults to "content".
     content_directory_name: str = "content"
 
-    #: Remove files generated in a previous pass by the Mkdocs renderer before rendering
-    #: again. Defaults to `True`.
+    #: Remove files generated in a previous pass by the Mkdocs renderer that are not
+    #: generated again. Defaults to `True`.
     clean_render: bool = True
 
     #: The pages to render into the output directory.
@@ -110,6 +110,11 @@ class MkdocsRenderer(Renderer, Server, Builder):
     #: ```
     server_port: t.Optional[int] = None
 
+    #: Restart the `mkdocs serve` process every time the files are rendered again with the
+    #: `pydoc-markdown --server` option. By default, the process is kept alive and MkDocs picks
+    #: up the changed files with its own file watcher and live reload. Defaults to `False`.
+    server_restart: bool = False
+
     def __post_init__(self) -> None:
         self._context: t.Optional[Context] = None
 
@@ -145,15 +150,15 @@ class MkdocsRenderer(Renderer, Server, Builder):
     # Renderer
 
     def render(self, modules: List[docspec.Module]) -> None:
+        self._render(modules, None)
+
+    def render_changed(self, modules: List[docspec.Module], changed_modules: List[docspec.Module]) -> None:
+        self._render(modules, changed_modules)
+
+    def _render(self, modules: List[docspec.Module], changed_modules: Optional[List[docspec.Module]]) -> None:
         assert self._context
 
-        known_files = KnownFiles(self.output_directory)
-        if self.clean_render:
-            for file_ in known_files.load():
-                try:
-                    os.remove(file_.name)
-                except FileNotFoundError:
-                    pass
+        known_files = KnownFiles(self.output_directory, remove_stale=self.clean_render)
 
         page_to_filename: t.Dict[int, str] = {}
 
@@ -165,9 +170,11 @@ class MkdocsRenderer(Renderer, Server, Builder):
                 page_to_filename[id(item.page)] = filename
                 if not item.page.has_content():
                     continue
+                if item.page.is_up_to_date(filename, changed_modules):
+                    known_files.append(filename)
+                    continue
 
-                item.page.render(filename, modules, self.markdown, self._context.directory)
-                known_files.append(filename)
+                item.page.render(filename, modules, self.markdown, self._context.directory, opener=known_files.open)
 
             config = copy.deepcopy(self.mkdocs_config)
             if self.site_name:
@@ -183,6 +190,13 @@ class MkdocsRenderer(Renderer, Server, Builder):
                 with known_files.open(filename, "w") as fp:
                     yaml.dump(config, fp)
 
+    def get_output_files(self) -> Optional[List[str]]:
+        return [record.name for record in KnownFiles(self.output_directory).load()]
+
+    def get_input_files(self) -> List[str]:
+        assert self._context
+        return self.pages.get_source_files(self._context.directory)
+
     def get_resolver(self, modules: List[docspec.Module]) -> Optional[Resolver]:
         # TODO (@NiklasRosenstein): The resolver returned by the Markdown
         #   renderer does not implement linking across multiple pages.
@@ -197,10 +211,13 @@ class MkdocsRenderer(Renderer, Server, Builder):
         addr = self._get_addr()
         return subprocess.Popen(["mkdocs", "serve", "-a", addr], cwd=self.output_directory)
 
-    def reload_server(self, process: subprocess.Popen):
-        # While MkDocs does support file watching and automatic reloading,
-        # it appears to be a bit quirky. Let's just restart the whole process.
-        process.terminate()
+    def reload_server(self, process: ServerProcess) -> t.Optional[ServerProcess]:
+        # MkDocs watches the output directory and reloads the site itself. Because only the files
+        # whose contents changed are replaced (atomically), it always sees a consistent directory.
+        if self.server_restart or process.poll() is not None:
+            process.terminate()
+            return None
+        return process
 
     # Builder
 
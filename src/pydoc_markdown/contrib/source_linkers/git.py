@@ -22,16 +22,36 @@
 import logging
 import os
 import typing as t
+import weakref
 from pathlib import Path
 
 import docspec
 from databind.core import dataclasses
-from nr.util.git import Git, NoCurrentBranchError
 
 from pydoc_markdown.interfaces import Context, SourceLinker
+from pydoc_markdown.util.git import GitMetadata, get_git_metadata, get_last_commits
 
 logger = logging.getLogger(__name__)
 
+#: Git metadata snapshots per #Context and directory, such that multiple source linkers initialized with the same
+#: context share the same snapshot instead of each inspecting the repository again.
+_git_metadata_cache: "weakref.WeakKeyDictionary[Context, t.Dict[str, t.Optional[GitMetadata]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_git_metadata_for_context(context: Context) -> t.Optional[GitMetadata]:
+    """
+    Returns the #GitMetadata for the repository of the *context* directory. The snapshot is taken only once per
+    context.
+    """
+
+    cache = _git_metadata_cache.setdefault(context, {})
+    directory = os.path.abspath(context.directory)
+    if directory not in cache:
+        cache[directory] = get_git_metadata(directory)
+    return cache[directory]
+
 
 @dataclasses.dataclass
 class BaseGitSourceLinker(SourceLinker):
@@ -48,10 +68,18 @@ class BaseGitSourceLinker(SourceLinker):
     #: Use the branch name instead of the current SHA to generate URLs.
     use_branch: bool = False
 
+    #: Use the SHA of the last commit that modified a file instead of the current SHA to generate URLs, such that
+    #: the links remain stable across commits that do not touch the file. Takes precedence over #use_branch for
+    #: files that are tracked in the repository.
+    use_last_commit: bool = False
+
     def __post_init__(self) -> None:
         self._project_root: t.Optional[str] = None
         self._branch: t.Optional[str] = None
         self._sha: t.Optional[str] = None
+        self._toplevel: t.Optional[str] = None
+        self._last_commits: t.Dict[str, str] = {}
+        self._url_parts: t.Dict[str, t.Optional[t.List[str]]] = {}
 
     def get_context_vars(self) -> t.Dict[str, str]:
         return {}
@@ -71,22 +99,42 @@ class BaseGitSourceLinker(SourceLinker):
         if not obj.location or not obj.location.filename:
             return None
 
+        # The URL only differs in the line number for all objects of the same file, thus we format the template
+        # only once per file and join the parts with the line number.
+        filename = obj.location.filename
+        try:
+            parts = self._url_parts[filename]
+        except KeyError:
+            parts = self._url_parts[filename] = self._get_url_parts(filename)
+        if parts is None:
+            logger.debug("Ignored API object %s, path points outside of project root.", obj.name)
+            return None
+
+        url = str(obj.location.lineno).join(parts)
+        logger.debug("Calculated URL for API object %s is %s", obj.name, url)
+        return url
+
+    def _get_url_parts(self, filename: str) -> t.Optional[t.List[str]]:
+        assert self._project_root is not None
+
         # Compute the path relative to the project root.
         try:
-            rel_path = Path(obj.location.filename).relative_to(self._project_root)
+            rel_path = Path(filename).relative_to(self._project_root)
         except ValueError:
-            logger.debug("Ignored API object %s, path points outside of project root.", obj.name)
             return None
 
         context_vars = self.get_context_vars()
         context_vars["path"] = str(rel_path)
-        context_vars["sha"] = (self._branch if self.use_branch else self._sha) or "?"
-        context_vars["lineno"] = str(obj.location.lineno)
+        context_vars["sha"] = self._get_sha(filename)
+        context_vars["lineno"] = "\0"
+        return self.get_url_template().format(**context_vars).split("\0")
 
-        url = self.get_url_template().format(**context_vars)
-
-        logger.debug("Calculated URL for API object %s is %s", obj.name, url)
-        return url
+    def _get_sha(self, filename: str) -> str:
+        if self._last_commits and self._toplevel:
+            path = os.path.relpath(os.path.abspath(filename), self._toplevel).replace(os.sep, "/")
+            if path in self._last_commits:
+                return self._last_commits[path]
+        return (self._branch if self.use_branch else self._sha) or "?"
 
     # PluginBase
 
@@ -96,25 +144,28 @@ class BaseGitSourceLinker(SourceLinker):
         root and Git SHA at this stage before #get_source_url() is called.
         """
 
-        git = Git(context.directory)
+        metadata = get_git_metadata_for_context(context)
+        self._url_parts = {}
 
         if self.root:
             self._project_root = os.path.join(context.directory, self.root)
         else:
-            project_root = git.get_toplevel()
-            if not project_root:
-                raise RuntimeError(f'Path "%s" is not in a Git repository', context.directory)
-            self._project_root = project_root
+            if not metadata:
+                raise RuntimeError(f'Path "{context.directory}" is not in a Git repository')
+            self._project_root = metadata.toplevel
 
-        self._sha = git.rev_parse("HEAD")
+        self._sha = metadata.sha if metadata else None
+        self._toplevel = metadata.toplevel if metadata else None
         self._branch = None
+        self._last_commits = {}
+
+        if self.use_last_commit and metadata and metadata.sha:
+            self._last_commits = get_last_commits(metadata.toplevel, metadata.sha)
 
         if self.use_branch:
-            try:
-                self._branch = git.get_current_branch_name()
-                if "(" in self._branch:
-                    raise NoCurrentBranchError  # For older versions of nr.util which returned the detached HEAD branch
-            except NoCurrentBranchError:
+            if metadata and metadata.branch:
+                self._branch = metadata.branch
+            else:
                 logger.warning("Repository is not currently on a branch, falling back to SHA")
                 self.use_branch = False
 
@@ -0,0 +1,348 @@
+"""
+Implements `pydoc-markdown daemon`, a long-running process that serves the invocations of the `pydoc-markdown`
+command in a directory. The daemon keeps the imported modules, the loaded configuration with its initialized
+plugins and their caches (such as the parsed Python modules) warm across invocations.
+
+The `pydoc-markdown` command forwards its invocation to the daemon of the current directory if one is running,
+and otherwise runs in-process. The standard input, output and error of the command are passed to the daemon via
+the Unix socket, so the output of the invocation (including that of hooks) ends up where it would otherwise.
+"""
+
+from __future__ import annotations
+
+import array
+import collections
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import traceback
+import typing as t
+
+from pydoc_markdown import __version__
+
+if t.TYPE_CHECKING:
+    from pydoc_markdown import PydocMarkdown
+    from pydoc_markdown.main import RenderSession
+
+logger = logging.getLogger(__name__)
+
+#: The file descriptors that are passed from the client to the daemon (stdin, stdout and stderr).
+_STDIO_FDS = (0, 1, 2)
+_HEADER = struct.Struct("!I")
+
+
+def is_supported() -> bool:
+    """
+    Returns #True if the daemon is supported on the current platform. It requires Unix sockets that can pass
+    file descriptors.
+    """
+
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "SCM_RIGHTS")
+
+
+def get_socket_path(directory: t.Optional[str] = None) -> str:
+    """
+    Returns the path of the socket of the daemon for *directory* (defaults to the current directory). The path
+    depends on the Python installation as well, such that the daemon is only used from the same environment.
+    """
+
+    directory = os.path.abspath(directory or os.getcwd())
+    key = hashlib.sha1(f"{directory}\0{sys.prefix}".encode("utf-8")).hexdigest()[:16]
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"pydoc-markdown-{os.getuid()}", key + ".sock")
+
+
+def _ensure_private_directory(path: str) -> None:
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.stat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f'the daemon socket directory "{path}" must only be accessible by the current user')
+
+
+def _send(sock: socket.socket, message: t.Dict[str, t.Any], fds: t.Sequence[int] = ()) -> None:
+    data = json.dumps(message).encode("utf-8")
+    data = _HEADER.pack(len(data)) + data
+    ancdata = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))] if fds else []
+    sent = sock.sendmsg([data], ancdata)
+    if sent < len(data):
+        sock.sendall(data[sent:])
+
+
+def _recv(sock: socket.socket) -> t.Tuple[t.Dict[str, t.Any], t.List[int]]:
+    fds = array.array("i")
+    data, ancdata, _flags, _addr = sock.recvmsg(2**16, socket.CMSG_SPACE(len(_STDIO_FDS) * fds.itemsize))
+    for level, type_, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+    while len(data) < _HEADER.size:
+        chunk = sock.recv(2**16)
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    (size,) = _HEADER.unpack_from(data)
+    while len(data) < _HEADER.size + size:
+        chunk = sock.recv(2**16)
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return json.loads(data[_HEADER.size : _HEADER.size + size].decode("utf-8")), list(fds)
+
+
+def _connect(path: str) -> t.Optional[socket.socket]:
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        # No daemon is listening on the socket anymore.
+        sock.close()
+        return None
+    return sock
+
+
+def forward(params: t.Dict[str, t.Any]) -> t.Optional[int]:
+    """
+    Forwards an invocation of the `pydoc-markdown` command with the given command-line *params* to the daemon of
+    the current directory. Returns the exit code of the invocation, or #None if no daemon is running or it could
+    not accept the invocation, in which case the command should run in-process.
+    """
+
+    if not is_supported():
+        return None
+    sock = _connect(get_socket_path())
+    if sock is None:
+        return None
+
+    request = {
+        "command": "run",
+        "version": __version__,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "params": params,
+    }
+    with sock:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            _send(sock, request, _STDIO_FDS)
+            response, _ = _recv(sock)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not forward to pydoc-markdown daemon, running in-process (%s)", exc)
+            return None
+
+    if response.get("error"):
+        logger.warning("pydoc-markdown daemon rejected the request, running in-process (%s)", response["error"])
+        return None
+    logger.debug("Invocation was handled by the pydoc-markdown daemon")
+    return int(response["exit_code"])
+
+
+def stop_daemon(directory: t.Optional[str] = None) -> bool:
+    """
+    Stops the daemon for *directory*. Returns #False if no daemon is running.
+    """
+
+    sock = _connect(get_socket_path(directory))
+    if sock is None:
+        return False
+    with sock:
+        _send(sock, {"command": "stop"})
+        _recv(sock)
+    return True
+
+
+class ConfigCache:
+    """
+    Keeps the configurations loaded by the daemon such that the plugins, and the caches they keep, are reused by
+    subsequent invocations with the same configuration. A configuration is loaded again if the configuration
+    file, the command-line overrides or the environment variables that the configuration file references changed.
+    """
+
+    def __init__(self, max_size: int = 8) -> None:
+        self.max_size = max_size
+        self._entries: t.OrderedDict[str, t.Tuple[t.Any, PydocMarkdown]] = collections.OrderedDict()
+
+    @staticmethod
+    def _get_stamp(session: RenderSession, config: t.Optional[PydocMarkdown]) -> t.Any:
+        stamp = None
+        if isinstance(session.config, str):
+            try:
+                st = os.stat(session.config)
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        env = sorted((k, os.environ.get(k)) for k in config.env_vars) if config else None
+
+        # Source linkers read the Git HEAD only when they are initialized, which happens when the configuration
+        # is loaded.
+        git = None
+        if config is not None and session._uses_source_linker(config):
+            from pydoc_markdown.util.git import get_git_metadata
+
+            metadata = get_git_metadata(os.getcwd())
+            git = (metadata.sha, metadata.branch) if metadata else None
+
+        return (stamp, env, git)
+
+    def load(self, session: RenderSession) -> PydocMarkdown:
+        key = hashlib.sha1(
+            json.dumps(
+                [
+                    os.getcwd(),
+                    session.config,
+                    session.render_toc,
+                    session.search_path,
+                    session.modules,
+                    session.packages,
+                    session.py2,
+                    session.targets,
+                ],
+                default=list,
+            ).encode("utf-8")
+        ).hexdigest()
+
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0] == self._get_stamp(session, entry[1]):
+            logger.debug("Reusing configuration loaded by a previous invocation")
+            config = session.reload(entry[1], ())
+        else:
+            config = session.load()
+            session.keep_parsed_modules(config)
+        self._entries[key] = (self._get_stamp(session, config), config)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return config
+
+
+@contextlib.contextmanager
+def _redirect_stdio(fds: t.Sequence[int]) -> t.Iterator[None]:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(fd) for fd in _STDIO_FDS]
+    try:
+        for fd, target in zip(fds, _STDIO_FDS):
+            os.dup2(fd, target)
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd, target in zip(saved, _STDIO_FDS):
+            os.dup2(fd, target)
+            os.close(fd)
+
+
+@contextlib.contextmanager
+def _environ(env: t.Dict[str, str]) -> t.Iterator[None]:
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+class Daemon:
+    """
+    Accepts the invocations forwarded by #forward() on the socket for the current directory and runs them one
+    after another in this process.
+    """
+
+    def __init__(self, idle_timeout: t.Optional[float] = None) -> None:
+        self.idle_timeout = idle_timeout
+        self.socket_path = get_socket_path()
+        self.cache = ConfigCache()
+
+    def serve(self) -> None:
+        _ensure_private_directory(os.path.dirname(self.socket_path))
+        sock = _connect(self.socket_path)
+        if sock is not None:
+            sock.close()
+            raise RuntimeError("a pydoc-markdown daemon is already running for this directory")
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        server.listen()
+        server.settimeout(self.idle_timeout)
+        previous_handler = signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        logger.info('Listening on "%s".', self.socket_path)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    logger.info("No requests within %s seconds, stopping.", self.idle_timeout)
+                    break
+                with conn:
+                    if not self._handle(conn):
+                        break
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            server.close()
+            os.remove(self.socket_path)
+
+    def _handle(self, conn: socket.socket) -> bool:
+        conn.settimeout(None)
+        try:
+            request, fds = _recv(conn)
+        except (OSError, ValueError):
+            logger.exception("Received an invalid request.")
+            return True
+
+        try:
+            if request.get("command") == "stop":
+                logger.info("Received stop request.")
+                _send(conn, {"exit_code": 0})
+                return False
+            elif request.get("command") != "run":
+                _send(conn, {"error": "unknown command: {!r}".format(request.get("command"))})
+            elif request.get("version") != __version__:
+                _send(conn, {"error": f"daemon runs pydoc-markdown {__version__}, got {request.get('version')}"})
+            elif request.get("cwd") != os.getcwd() or len(fds) != len(_STDIO_FDS):
+                _send(conn, {"error": "invalid request"})
+            else:
+                _send(conn, {"exit_code": self._run(request["params"], request["env"], fds)})
+        except OSError:
+            logger.exception("Could not respond to request.")
+        finally:
+            for fd in fds:
+                os.close(fd)
+        return True
+
+    def _run(self, params: t.Dict[str, t.Any], env: t.Dict[str, str], fds: t.Sequence[int]) -> int:
+        import click
+
+        from pydoc_markdown.main import cli
+
+        log_level = logging.root.level
+        with _redirect_stdio(fds), _environ(env):
+            try:
+                with click.Context(cli, obj=self.cache) as ctx:
+                    ctx.invoke(cli, **{**params, "no_daemon": True})
+                return 0
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    return exc.code or 0
+                print(exc.code, file=sys.stderr)
+                return 1
+            except click.ClickException as exc:
+                exc.show()
+                return exc.exit_code
+            except Exception:
+                traceback.print_exc()
+                return 1
+            finally:
+                logging.root.setLevel(log_level)
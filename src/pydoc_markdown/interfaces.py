@@ -26,7 +26,6 @@ processors or renderers.
 """
 
 import abc
-import subprocess
 import typing as t
 
 import docspec
@@ -108,6 +107,11 @@ class Processor(PluginBase):
     various documentation syntaxes to plain Markdown.
     """
 
+    #: Set to `True` if the result depends on the resolver passed to #process(). If multiple renderers use
+    #: different resolvers, such processors (and the ones that follow them) run once per resolver, while the
+    #: processors before them run only once with the resolver of the first renderer.
+    uses_resolver: t.ClassVar[bool] = False
+
     @abc.abstractmethod
     def process(self, modules: t.List[docspec.Module], resolver: t.Optional[Resolver]) -> None:
         ...
@@ -141,6 +145,40 @@ class Renderer(PluginBase):
     def render(self, modules: t.List[docspec.Module]) -> None:
         ...
 
+    def get_output_files(self) -> t.Optional[t.List[str]]:
+        """
+        Returns the files produced by the last call to #render(). This is used to record the outputs in the
+        build manifest (see the `--manifest` option). The default implementation returns #None, which means
+        the outputs are unknown (e.g. because the renderer writes to stdout) and no manifest can be written.
+        """
+
+        return None
+
+    def get_input_files(self) -> t.List[str]:
+        """
+        Returns the files other than the source files of the loaded modules that were read by the last call to
+        #render() (e.g. templates). They are recorded in the build manifest next to the source files, and are
+        watched for changes with `--server`. The default implementation returns an empty list.
+        """
+
+        return []
+
+
+class IncrementalRenderer(abc.ABC):
+    """
+    This interface can be implemented additionally to the #Renderer interface to indicate that the renderer
+    can update the outputs of a previous render, which is used by `pydoc-markdown --changed-since`.
+    """
+
+    @abc.abstractmethod
+    def render_changed(self, modules: t.List[docspec.Module], changed_modules: t.List[docspec.Module]) -> None:
+        """
+        Renders only the outputs that include API objects from the *changed_modules*. The outputs of the
+        previous render are in place already. The *changed_modules* include both the previous and the current
+        version of a module that changed, such that outputs which included objects that were removed from it
+        are found as well, and modules that are not in *modules* anymore because they were removed.
+        """
+
 
 class SinglePageRenderer(PluginBase):
     """
@@ -164,6 +202,23 @@ class SingleObjectRenderer(PluginBase):
         ...
 
 
+class ServerProcess(t.Protocol):
+    """
+    A handle for a server started with #Server.start_server(). A #subprocess.Popen object implements this
+    interface, but a server may also run in the current process.
+    """
+
+    def poll(self) -> t.Optional[int]:
+        """
+        Returns #None while the server is running, otherwise its exit code.
+        """
+
+    def terminate(self) -> None:
+        """
+        Stops the server.
+        """
+
+
 class Server(abc.ABC):
     """
     This interface describes an object that can start a server process for
@@ -173,15 +228,20 @@ class Server(abc.ABC):
     CLI.
     """
 
+    #: If `True`, the server is started before the initial render and renders the pages
+    #: on demand. The #Renderer.render() method is then only expected to pass the updated
+    #: modules to the server instead of producing the output files.
+    renders_on_demand: t.ClassVar[bool] = False
+
     @abc.abstractmethod
     def get_server_url(self) -> str:
         ...
 
     @abc.abstractmethod
-    def start_server(self) -> subprocess.Popen:
+    def start_server(self) -> ServerProcess:
         ...
 
-    def reload_server(self, process: subprocess.Popen) -> subprocess.Popen:
+    def reload_server(self, process: ServerProcess) -> t.Optional[ServerProcess]:
         """
         Called when the files generated by pydoc-markdown have been updated.
         This gives the implementation a chance to reload the server process.
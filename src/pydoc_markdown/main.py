@@ -29,6 +29,11 @@ or a YAML formatted object for the configuration.
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import json
 import logging
 import os
 import sys
@@ -37,16 +42,12 @@ import webbrowser
 from pathlib import Path
 
 import click
-import yaml
-from databind.core import convert_dataclass_to_schema
-from docspec import dump_module
-from typeapi import ClassTypeHint
 
 from pydoc_markdown import PydocMarkdown, __version__, static
-from pydoc_markdown.contrib.loaders.python import PythonLoader
-from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
-from pydoc_markdown.interfaces import Context, Server
-from pydoc_markdown.util.watchdog import watch_paths
+from pydoc_markdown.interfaces import Context, Server, ServerProcess
+
+if t.TYPE_CHECKING:
+    import docspec
 
 config_filenames = ["pydoc-markdown.yml", "pydoc-markdown.yaml", "pyproject.toml"]
 default_config_notice = "Using this option will disable loading the default configuration file."
@@ -67,6 +68,12 @@ class RenderSession:
         modules: t.List[str] | None = None,  #: Override the modules in the Python loader
         packages: t.List[str] | None = None,  #: Override the packages in the Python loader
         py2: bool | None = None,  #: Override Python2 compatibility in the Python loader
+        manifest: str | None = None,  #: The build manifest to write after rendering
+        changed_since: str | None = None,  #: The Git ref that the #previous_build was made from
+        previous_build: str | None = None,  #: The build artifact directory to reuse unchanged modules and outputs from
+        save_build: str | None = None,  #: The build artifact directory to save the build to
+        checkpoint: str | None = None,  #: The checkpoint directory to keep the processed modules in
+        targets: t.List[str] | None = None,  #: The names of the renderers to render with
     ) -> None:
         self.config = config
         self.render_toc = render_toc
@@ -74,38 +81,66 @@ class RenderSession:
         self.modules = modules
         self.packages = packages
         self.py2 = py2
+        self.manifest = manifest
+        self.changed_since = changed_since
+        self.previous_build = previous_build
+        self.save_build = save_build
+        self.checkpoint = checkpoint
+        self.targets = targets
+
+        #: The configuration, the modules and the renderer input files of the last #render(), to determine the
+        #: changed modules from.
+        self._last_render: t.Tuple[PydocMarkdown, t.List[docspec.Module], t.Set[str]] | None = None
 
     def _apply_overrides(self, config: PydocMarkdown):
         """
         Applies overrides to the configuration.
         """
 
+        from databind.core import convert_dataclass_to_schema
+        from typeapi import ClassTypeHint
+
+        from pydoc_markdown.contrib.loaders.python import PythonLoader
+        from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
+
         # Update configuration per command-line options.
         if self.modules or self.packages or self.search_path or self.py2 is not None:
             loader = next((l for l in config.loaders if isinstance(l, PythonLoader)), None)
             if not loader:
                 error("no python loader found")
             if self.modules:
-                loader.modules = self.modules
+                loader.modules = list(self.modules)
             if self.packages:
-                loader.packages = self.packages
+                loader.packages = list(self.packages)
             if self.search_path:
-                loader.search_path = self.search_path
+                loader.search_path = list(self.search_path)
             if self.py2 is not None:
                 loader.parser.print_function = not self.py2
 
+        if self.targets:
+            if not config.renderers:
+                error("--target can only be used if the configuration specifies renderers")
+            unknown = [x for x in self.targets if x not in config.renderers]
+            if unknown:
+                error("unknown target(s) {}, available are {}".format(", ".join(unknown), ", ".join(config.renderers)))
+            config.renderers = {name: config.renderers[name] for name in self.targets}
+
         if self.render_toc is not None:
-            # Find the #MarkdownRenderer field for this renderer.
-            for field_name, field in convert_dataclass_to_schema(type(config.renderer)).fields.items():
-                if isinstance(field.datatype, ClassTypeHint) and field.datatype.type == MarkdownRenderer:
-                    markdown: MarkdownRenderer = getattr(config.renderer, field_name)
-                    break
-            else:
-                if isinstance(config.renderer, MarkdownRenderer):
-                    markdown = config.renderer
+            markdown_renderers: t.List[MarkdownRenderer] = []
+            for renderer in config.get_renderers().values():
+                # Find the #MarkdownRenderer field for this renderer.
+                for field_name, field in convert_dataclass_to_schema(type(renderer)).fields.items():
+                    if isinstance(field.datatype, ClassTypeHint) and field.datatype.type == MarkdownRenderer:
+                        markdown_renderers.append(getattr(renderer, field_name))
+                        break
                 else:
-                    error("renderer {!r} does not expose a MarkdownRenderer".format(type(config.renderer).__name__))
-            markdown.render_toc = self.render_toc
+                    if isinstance(renderer, MarkdownRenderer):
+                        markdown_renderers.append(renderer)
+            if not markdown_renderers:
+                names = ", ".join(type(r).__name__ for r in config.get_renderers().values())
+                error("renderer {!r} does not expose a MarkdownRenderer".format(names))
+            for markdown in markdown_renderers:
+                markdown.render_toc = self.render_toc
 
     def load(self) -> PydocMarkdown:
         """
@@ -125,16 +160,325 @@ class RenderSession:
 
         return config
 
-    def render(self, config: PydocMarkdown) -> t.List[str]:
+    def reload(self, config: PydocMarkdown, changed_files: t.Collection[str]) -> PydocMarkdown:
+        """
+        Returns the configuration to use for re-rendering after the *changed_files* changed. The configuration is
+        only loaded again if the configuration file changed, otherwise the already initialized plugins (and their
+        caches) are kept. Only the resolver is reset as it may depend on the loaded modules.
+        """
+
+        if isinstance(self.config, str) and os.path.abspath(self.config) in changed_files:
+            logger.info('Configuration file "%s" changed, reloading.', self.config)
+            return self.load()
+
+        config.resolver = None
+        return config
+
+    @staticmethod
+    def keep_parsed_modules(config: PydocMarkdown) -> None:
+        """
+        Lets the Python loaders of *config* keep the parsed modules, for processes that load the modules of the
+        same configuration repeatedly (`--server` and `pydoc-markdown daemon`).
+        """
+
+        from pydoc_markdown.contrib.loaders.python import PythonLoader
+
+        for loader in config.loaders:
+            if isinstance(loader, PythonLoader):
+                loader.keep_parsed_modules()
+
+    def get_config_digest(self) -> str:
+        """
+        Returns a hash of the configuration and the overrides that is recorded in the build manifest.
+        """
+
+        from pydoc_markdown.util.knownfiles import hash_file
+
+        config = hash_file(self.config, "blake2b") if isinstance(self.config, str) else self.config
+        data = [config, self.render_toc, self.search_path, self.modules, self.packages, self.py2]
+        if self.targets:
+            data.append(self.targets)
+        return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get_checkpoint_digest(self, config: PydocMarkdown) -> str:
+        """
+        Returns a hash of the loader and processor configuration of *config* that is recorded in the #checkpoint.
+        The names of the renderers and the type of the first renderer are included as the processors use the
+        resolver of that renderer. The resolver itself is compared with #get_resolver_key() when the checkpoint
+        is loaded, as it may depend on the modules.
+        """
+
+        import databind.json
+
+        from pydoc_markdown.interfaces import Loader, Processor
+
+        renderers = config.get_renderers()
+        renderer = next(iter(renderers.values()))
+        data = [
+            databind.json.dump(config.loaders, t.List[Loader]),
+            databind.json.dump(config.processors, t.List[Processor]),
+            list(renderers),
+            type(renderer).__module__ + "." + type(renderer).__qualname__,
+        ]
+        return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_resolver_key(config: PydocMarkdown, modules: t.List[docspec.Module]) -> str:
+        """
+        Returns a hash of the settings of the resolvers that the processors of *config* use for the *modules* (see
+        #PydocMarkdown.get_resolver_groups()). Resolvers that are not dataclasses are identified by the
+        configuration of the renderer that returns them.
+        """
+
+        import databind.json
+
+        from pydoc_markdown.interfaces import Renderer
+
+        renderers = config.get_renderers()
+        data = []
+        for resolver, names in config.get_resolver_groups(modules):
+            settings: t.Any = None
+            if resolver is not None:
+                name = type(resolver).__module__ + "." + type(resolver).__qualname__
+                if dataclasses.is_dataclass(resolver):
+                    settings = [name, dataclasses.asdict(resolver)]
+                else:
+                    settings = [name, databind.json.dump(renderers[names[0]], Renderer)]
+            data.append([settings, names])
+        return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_search_path(config: PydocMarkdown) -> t.List[str]:
+        """
+        Returns the search path of the Python loaders of *config* that discover the modules, where added modules
+        would be picked up.
+        """
+
+        from pydoc_markdown.contrib.loaders.python import PythonLoader
+
+        config.ensure_initialized()
+        result = []
+        for loader in config.loaders:
+            if isinstance(loader, PythonLoader) and loader.modules is None and loader.packages is None:
+                result += loader.get_effective_search_path()
+        return result
+
+    @staticmethod
+    def get_output_files(config: PydocMarkdown) -> t.Optional[t.List[str]]:
+        """
+        Returns the output files of all renderers of *config*, or #None if a renderer does not report its output
+        files (a warning is logged in that case).
+        """
+
+        result: t.List[str] = []
+        for renderer in config.get_renderers().values():
+            outputs = renderer.get_output_files()
+            if outputs is None:
+                logger.warning("Renderer %r does not report its output files", type(renderer).__name__)
+                return None
+            result += outputs
+        return result
+
+    @staticmethod
+    def get_input_files(config: PydocMarkdown) -> t.List[str]:
+        """
+        Returns the absolute paths of the files other than the module source files that the renderers of *config*
+        read in the last render (see #Renderer.get_input_files()).
+        """
+
+        return sorted({os.path.abspath(x) for r in config.get_renderers().values() for x in r.get_input_files()})
+
+    @staticmethod
+    def _uses_source_linker(config: PydocMarkdown) -> bool:
+        from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
+
+        for renderer in config.get_renderers().values():
+            markdown = getattr(renderer, "markdown", renderer)
+            if isinstance(markdown, MarkdownRenderer) and markdown.source_linker is not None:
+                return True
+        return False
+
+    def is_up_to_date(self) -> bool:
         """
-        Kicks off the rendering process and returns a list of files to watch.
+        Returns #True if the build #manifest shows that neither the configuration, nor the input or output files
+        changed since the last render. This does not load the configuration or any of the modules.
         """
 
-        modules = config.load_modules()
-        config.process(modules)
-        config.render(modules)
+        from pydoc_markdown.util.manifest import BuildManifest
+
+        return self.manifest is not None and BuildManifest(self.manifest).is_up_to_date(self.get_config_digest())
+
+    def _load_incremental(
+        self, config: PydocMarkdown
+    ) -> t.Optional[t.Tuple[t.List[docspec.Module], t.List[docspec.Module]]]:
+        """
+        Loads the modules, reusing the modules of the #previous_build that were not changed #changed_since. Returns
+        the loaded modules and the modules that changed (the previous and the current versions, and removed modules),
+        or #None if the #previous_build was not made from the #changed_since commit.
+        """
+
+        from pydoc_markdown.contrib.loaders.python import PythonLoader
+        from pydoc_markdown.util.git import get_changed_files
+        from pydoc_markdown.util.incremental import BuildArtifact
+
+        assert self.changed_since is not None and self.previous_build is not None
+        artifact = BuildArtifact(self.previous_build)
+        sha, changed_files = get_changed_files(os.getcwd(), self.changed_since)
+        if (artifact.get_metadata() or {}).get("sha") not in (None, sha):
+            logger.warning("Build artifact was not made from %s (%s)", self.changed_since, sha)
+            return None
+
+        previous_modules = artifact.load_modules()
+        unchanged_modules = [m for m in previous_modules if m.location.filename not in changed_files]
+        with contextlib.ExitStack() as stack:
+            for loader in config.loaders:
+                if isinstance(loader, PythonLoader):
+                    stack.enter_context(loader.use_parsed_modules(unchanged_modules))
+            modules = config.load_modules()
+
+        previous_keys = {(m.name, m.location.filename) for m in unchanged_modules}
+        current_keys = set()
+        changed_modules = []
+        for module in modules:
+            key = (module.name, os.path.realpath(module.location.filename))
+            current_keys.add(key)
+            if key not in previous_keys:
+                changed_modules.append(module)
+        # The previous versions are needed to find the outputs that included objects which were removed.
+        changed_modules += [
+            m
+            for m in previous_modules
+            if m.location.filename in changed_files or (m.name, m.location.filename) not in current_keys
+        ]
+        logger.info("%d of %d module(s) changed since %s", len(changed_modules), len(modules), self.changed_since)
+
+        artifact.restore_outputs()
+        return modules, changed_modules
+
+    @staticmethod
+    def _get_changed_modules(
+        previous_modules: t.List[docspec.Module], modules: t.List[docspec.Module], changed_files: t.Collection[str]
+    ) -> t.List[docspec.Module]:
+        """
+        Returns the *modules* that were loaded from one of the *changed_files* or that are new compared to the
+        *previous_modules*, and the *previous_modules* that were loaded from one of the *changed_files* or that
+        were removed.
+        """
+
+        changed_files = {os.path.abspath(x) for x in changed_files}
+        previous_keys = {(m.name, os.path.abspath(m.location.filename)) for m in previous_modules}
+        current_keys = set()
+        changed_modules = []
+        for module in modules:
+            key = (module.name, os.path.abspath(module.location.filename))
+            current_keys.add(key)
+            if key not in previous_keys or key[1] in changed_files:
+                changed_modules.append(module)
+        for module in previous_modules:
+            key = (module.name, os.path.abspath(module.location.filename))
+            if key not in current_keys or key[1] in changed_files:
+                changed_modules.append(module)
+        return changed_modules
+
+    def render(self, config: PydocMarkdown, changed_files: t.Collection[str] | None = None) -> t.List[str]:
+        """
+        Kicks off the rendering process and returns a list of files to watch. If a build #manifest is set, it is
+        updated with the input and output files afterwards.
+
+        If *changed_files* are specified and the same *config* was rendered before (e.g. with `--server`), only
+        the outputs that include objects from modules of these files are rendered again, if the renderer supports
+        it.
+
+        If #changed_since and #previous_build are set, only the modules that changed since the given Git ref are
+        parsed again and, if the renderer supports it, only the outputs that include objects from them are rendered
+        again. If #save_build is set, the build is saved for use as a #previous_build afterwards.
+
+        If a #checkpoint is set and neither the loader and processor configuration nor the input files changed
+        since it was saved, the processed modules are taken from the checkpoint.
+        """
+
+        from pydoc_markdown.util.checkpoint import Checkpoint
+        from pydoc_markdown.util.incremental import BuildArtifact
+
+        changed_modules = None
+        dumped_modules = None
+        checkpoint = Checkpoint(self.checkpoint) if self.checkpoint else None
+        checkpoint_digest = self.get_checkpoint_digest(config) if checkpoint else ""
+        modules = (
+            checkpoint.load(checkpoint_digest, functools.partial(self.get_resolver_key, config)) if checkpoint else None
+        )
+        if modules is not None:
+            logger.info('Using the processed modules from checkpoint "%s".', self.checkpoint)
+        else:
+            incremental = None
+            if self.previous_build and BuildArtifact(self.previous_build).is_compatible(self.get_config_digest()):
+                incremental = self._load_incremental(config)
+            if incremental is not None:
+                modules, changed_modules = incremental
+            else:
+                if self.previous_build:
+                    logger.warning("Cannot use the previous build, rendering everything.")
+                modules = config.load_modules()
+                if (
+                    changed_files is not None
+                    and self._last_render
+                    and self._last_render[0] is config
+                    # If a renderer input (e.g. a template) changed, everything needs to be rendered again.
+                    and not self._last_render[2].intersection(os.path.abspath(x) for x in changed_files)
+                ):
+                    changed_modules = self._get_changed_modules(self._last_render[1], modules, changed_files)
+                    logger.info("%d of %d module(s) changed", len(changed_modules), len(modules))
+            dumped_modules = BuildArtifact.dump_modules(modules) if self.save_build else None
+            config.process(modules)
+            if checkpoint and len(config.get_resolver_groups(modules)) > 1:
+                # Only the modules processed with the resolver of the first renderer could be restored.
+                logger.warning("Cannot save checkpoint, the renderers use different resolvers")
+            elif checkpoint:
+                checkpoint.save(
+                    checkpoint_digest, modules, self.get_resolver_key(config, modules), self.get_search_path(config)
+                )
+        config.render(modules, changed_modules=changed_modules)
+        renderer_inputs = self.get_input_files(config)
+        self._last_render = (config, modules, set(renderer_inputs))
+
+        if self.save_build:
+            from pydoc_markdown.util.git import get_git_metadata
+
+            assert dumped_modules is not None
+            outputs = self.get_output_files(config)
+            if outputs is None:
+                logger.warning("The build only contains the modules")
+            git = get_git_metadata(os.getcwd())
+            BuildArtifact(self.save_build).save(
+                self.get_config_digest(), git.sha if git else None, dumped_modules, outputs or []
+            )
 
         watch_files = set(m.location.filename for m in modules)
+
+        if self.manifest:
+            from pydoc_markdown.util.manifest import BuildManifest
+
+            manifest = BuildManifest(self.manifest)
+            outputs = self.get_output_files(config)
+            if outputs is None:
+                logger.warning("Cannot write build manifest")
+                manifest.remove()
+            elif not all(os.path.isfile(x) for x in watch_files):
+                # E.g. modules loaded from a snapshot, their source files may not exist.
+                logger.warning("Modules were not loaded from source files, cannot write build manifest")
+                manifest.remove()
+            else:
+                manifest.write(
+                    self.get_config_digest(),
+                    watch_files,
+                    outputs,
+                    renderer_inputs,
+                    self._uses_source_linker(config),
+                    self.get_search_path(config),
+                    config.env_vars,
+                )
+
+        watch_files.update(renderer_inputs)
         if isinstance(self.config, str):
             watch_files.add(self.config)
 
@@ -143,46 +487,72 @@ class RenderSession:
     def build(self, config: PydocMarkdown, site_dir: str) -> None:
         config.build(site_dir)
 
-    def run_server(self, config: PydocMarkdown, open_browser: bool = False):
+    def run_server(self, config: PydocMarkdown, open_browser: bool = False, debounce: float = 0.2):
         """
         Watches files for changes and (re-) starts a server process that
-        serves an HTML page from the renderer output on the fly.
+        serves an HTML page from the renderer output on the fly. Changes that
+        occur within *debounce* seconds of each other are coalesced into a
+        single re-render.
         """
 
-        if not isinstance(config.renderer, Server):
-            error("renderer {!r} cannot be used with --server".format(type(config.renderer).__name__))
-
-        observer, event, process = None, None, None
-        watch_files = []
-
-        try:
-            while True:
-                # Initial render or re-render if a file changed.
-                if not event or event.is_set():
-                    if event:
-                        config = self.load()
-                    logger.info("Rendering.")
-                    watch_files = self.render(config)
-                    if observer:
-                        observer.stop()
-                    observer, event = watch_paths(watch_files)
-                    if process:
-                        process = config.renderer.reload_server(process)
-
-                # If the process doesn't exist, start it.
-                if process is None:
-                    logger.info("Starting MkDocs serve.")
-                    process = config.renderer.start_server()
+        from pydoc_markdown.util.watchdog import FileWatcher
+
+        renderers = list(config.get_renderers().values())
+        if len(renderers) != 1:
+            error("--server can only be used with a single renderer, select one with --target")
+        if not isinstance(renderers[0], Server):
+            error("renderer {!r} cannot be used with --server".format(type(renderers[0]).__name__))
+
+        process = None
+        changed_files: t.Optional[t.Set[str]] = None
+
+        def _server() -> Server:
+            (renderer,) = config.get_renderers().values()
+            assert isinstance(renderer, Server)
+            return renderer
+
+        def _start_server() -> ServerProcess:
+            logger.info("Starting server.")
+            return _server().start_server()
+
+        with FileWatcher(debounce) as watcher:
+            try:
+                while True:
+                    # Initial render or re-render if a file changed.
+                    if changed_files is None or changed_files:
+                        if changed_files:
+                            logger.info("Detected changes in %s", ", ".join(sorted(changed_files)))
+                            new_config = self.reload(config, changed_files)
+                            if new_config is not config and process and _server().renders_on_demand:
+                                # The server belongs to the previous renderer instance.
+                                process.terminate()
+                                process = None
+                            config = new_config
+
+                        self.keep_parsed_modules(config)
+                        # Renderers that render on demand need their server before rendering.
+                        if process is None and _server().renders_on_demand:
+                            process = _start_server()
+
+                        logger.info("Rendering.")
+                        watcher.set_paths(self.render(config, changed_files))
+                        if process:
+                            process = _server().reload_server(process)
+
+                    # If the process doesn't exist, start it.
+                    if process is None:
+                        process = _start_server()
+
+                    # Only open the browser once the first render finished, such that it does not show a missing
+                    # page.
                     if open_browser:
                         open_browser = False
-                        webbrowser.open(config.renderer.get_server_url())
+                        webbrowser.open(_server().get_server_url())
 
-                event.wait(0.5)
-        finally:
-            if observer:
-                observer.stop()
-            if process:
-                process.terminate()
+                    changed_files = watcher.wait(0.5)
+            finally:
+                if process:
+                    process.terminate()
 
 
 def error(*args) -> t.NoReturn:
@@ -240,6 +610,15 @@ def error(*args) -> t.NoReturn:
     default=None,
     help='Enable/disable the rendering of the TOC in the "markdown" renderer.',
 )
+@click.option(
+    "--target",
+    "-t",
+    "targets",
+    metavar="NAME",
+    multiple=True,
+    help="The name of a renderer in the `renderers` of the configuration to render with. Can be specified multiple "
+    "times. By default, all renderers are used.",
+)
 @click.option(
     "--server",
     "-s",
@@ -250,12 +629,25 @@ def error(*args) -> t.NoReturn:
 @click.option(
     "--open", "-o", "open_browser", is_flag=True, help="Open the browser after starting the server with -s,--server."
 )
+@click.option(
+    "--debounce",
+    type=float,
+    metavar="SECONDS",
+    help="The time to wait for further file changes before re-rendering with -s,--server. Default: 0.2",
+)
 @click.option(
     "--dump", is_flag=True, help="Dump the loaded modules in Docspec JSON format to stdout, after the processors."
 )
 @click.option(
     "--with-processors/--without-processors", default=None, help="Enable/disable processors. Only with --dump."
 )
+@click.option(
+    "--dump-format",
+    type=click.Choice(["json", "snapshot", "snapshot-gzip", "snapshot-zstd"]),
+    help="The format for --dump. `json` writes every module in Docspec JSON format (the default), `snapshot` writes "
+    "a compact binary snapshot of all modules that can be loaded with the `snapshot` loader, optionally compressed "
+    "with gzip or zstd (requires the `zstandard` package).",
+)
 @click.option(
     "--build",
     is_flag=True,
@@ -263,6 +655,41 @@ def error(*args) -> t.NoReturn:
     'not support this option (e.g. the "markdown" renderer).',
 )
 @click.option("--site-dir", help="Set the output directory when using --build.")
+@click.option(
+    "--manifest",
+    metavar="FILE",
+    help="Record the configuration, input and output files of the render in a build manifest. If nothing "
+    "changed since the manifest was written, rendering is skipped. Cannot be used with --server or --dump.",
+)
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Only parse the Python files that changed since the Git ref REF and, if the renderer supports it, only "
+    "render the outputs that include objects from them. The modules and outputs of the other files are reused "
+    "from the build given with --previous-build, which must have been made from REF.",
+)
+@click.option(
+    "--previous-build",
+    metavar="DIR",
+    help="The build artifact directory saved with --save-build to use with --changed-since.",
+)
+@click.option(
+    "--save-build",
+    metavar="DIR",
+    help="Save the loaded modules and the outputs to a build artifact directory for use with --previous-build.",
+)
+@click.option(
+    "--checkpoint",
+    metavar="DIR",
+    help="Keep the processed modules in a checkpoint directory and reuse them as long as the loader and processor "
+    "configuration and the loaded files do not change, such that changes to the renderer configuration are "
+    "rendered without loading and processing the modules again.",
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="Run in this process even if a `pydoc-markdown daemon` is running for the current directory.",
+)
 def cli(
     config,
     bootstrap,
@@ -273,12 +700,21 @@ def cli(
     search_path,
     render_toc,
     py2,
+    targets,
     server,
     open_browser,
+    debounce,
     dump,
     with_processors,
+    dump_format,
     build,
     site_dir,
+    manifest,
+    changed_since,
+    previous_build,
+    save_build,
+    checkpoint,
+    no_daemon,
 ):
     """
     Command-line entrypoint for Pydoc-Markdown.
@@ -286,12 +722,24 @@ def cli(
 
     if with_processors is not None and not dump:
         error("--with-processors/--without-processors can only be used with --dump")
+    if dump_format and not dump:
+        error("--dump-format can only be used with --dump")
     if open_browser and not server:
         error("--open can only be used with --server")
+    if debounce is not None and not server:
+        error("--debounce can only be used with --server")
     if server and build:
         error("--server and --build are incompatible options")
     if site_dir and not build:
         error("--site-dir can only be used with --build")
+    if manifest and (server or dump):
+        error("--manifest cannot be used with --server or --dump")
+    if bool(changed_since) != bool(previous_build):
+        error("--changed-since and --previous-build must be used together")
+    if (previous_build or save_build) and (server or dump):
+        error("--changed-since, --previous-build and --save-build cannot be used with --server or --dump")
+    if checkpoint and (server or dump or previous_build or save_build):
+        error("--checkpoint cannot be used with --server, --dump, --previous-build or --save-build")
 
     if bootstrap:
         if (
@@ -301,12 +749,21 @@ def cli(
             or search_path
             or render_toc
             or py2
+            or targets
             or server
             or open_browser
+            or debounce is not None
             or dump
             or with_processors is not None
+            or dump_format
             or build
             or site_dir
+            or manifest
+            or changed_since
+            or previous_build
+            or save_build
+            or checkpoint
+            or no_daemon
         ):
             error("--bootstrap must be used as a sole argument")
 
@@ -354,9 +811,20 @@ def cli(
     else:
         level = 0
     logging.basicConfig(format="[%(levelname)s - %(name)s]: %(message)s", level=level)
+    logging.root.setLevel(level)
+
+    # Let the daemon of the current directory handle the invocation if one is running.
+    if not server and not no_daemon:
+        from pydoc_markdown.daemon import forward
+
+        exit_code = forward(click.get_current_context().params)
+        if exit_code is not None:
+            sys.exit(exit_code)
 
     # Load the configuration.
     if config and (config.lstrip().startswith("{") or "\n" in config):
+        import yaml
+
         config = yaml.safe_load(config)
     if config is None and load_implicit_config:
         try:
@@ -365,26 +833,109 @@ def cli(
             error("config file not found.")
 
     session = RenderSession(
-        config=config, render_toc=render_toc, search_path=search_path, modules=modules, packages=packages, py2=py2
+        config=config,
+        render_toc=render_toc,
+        search_path=search_path,
+        modules=modules,
+        packages=packages,
+        py2=py2,
+        manifest=manifest,
+        changed_since=changed_since,
+        previous_build=previous_build,
+        save_build=save_build,
+        checkpoint=checkpoint,
+        targets=list(targets),
     )
 
-    pydocmd = session.load()
+    # Skip loading anything if the build manifest shows that the render would produce the same outputs.
+    up_to_date = session.is_up_to_date()
+    if up_to_date:
+        logger.info('Nothing changed since the build manifest "%s" was written, skipping render.', manifest)
+        if not build:
+            return
+
+    from pydoc_markdown.daemon import ConfigCache
+
+    cache = click.get_current_context().find_object(ConfigCache)
+    pydocmd = cache.load(session) if cache else session.load()
 
     if dump:
+        if dump_format and dump_format.startswith("snapshot") and sys.stdout.isatty():
+            error("refusing to write a binary snapshot to a terminal")
+
         modules = pydocmd.load_modules()
         if with_processors is None or with_processors is True:
             pydocmd.process(modules)
-        for module in modules:
-            dump_module(module, sys.stdout)
+        if dump_format and dump_format.startswith("snapshot"):
+            from pydoc_markdown.util.snapshot import SnapshotError, dump_snapshot
+
+            try:
+                dump_snapshot(modules, sys.stdout.buffer, dump_format.partition("-")[2] or "none")
+            except SnapshotError as exc:
+                error(exc)
+            sys.stdout.buffer.flush()
+        else:
+            from docspec import dump_module
+
+            for module in modules:
+                dump_module(module, sys.stdout)
         sys.exit(0)
 
     if server:
-        session.run_server(pydocmd, open_browser)
+        session.run_server(pydocmd, open_browser, 0.2 if debounce is None else debounce)
     else:
-        session.render(pydocmd)
+        if not up_to_date:
+            session.render(pydocmd)
         if build:
             session.build(pydocmd, site_dir)
 
 
+@click.command(help="Keep a process running that handles the invocations of pydoc-markdown in this directory.")
+@click.option("--stop", is_flag=True, help="Stop the daemon that is running for the current directory.")
+@click.option(
+    "--idle-timeout",
+    type=float,
+    metavar="SECONDS",
+    help="Stop the daemon if it received no invocations for the given number of seconds.",
+)
+@click.option("--verbose", "-v", count=True, help="Increase log verbosity.")
+def daemon_cli(stop, idle_timeout, verbose):
+    """
+    Command-line entrypoint for `pydoc-markdown daemon`.
+    """
+
+    from pydoc_markdown import daemon
+
+    if not daemon.is_supported():
+        error("pydoc-markdown daemon is not supported on this platform")
+    if stop:
+        if idle_timeout is not None:
+            error("--stop and --idle-timeout are incompatible options")
+        if not daemon.stop_daemon():
+            error("no daemon is running for the current directory")
+        return
+
+    logging.basicConfig(
+        format="[%(levelname)s - %(name)s]: %(message)s", level=logging.DEBUG if verbose else logging.INFO
+    )
+    try:
+        daemon.Daemon(idle_timeout).serve()
+    except RuntimeError as exc:
+        error(exc)
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    """
+    Entrypoint for the `pydoc-markdown` command. Dispatches `pydoc-markdown daemon` to #daemon_cli.
+    """
+
+    if sys.argv[1:2] == ["daemon"]:
+        daemon_cli(sys.argv[2:], prog_name="pydoc-markdown daemon")  # type: ignore
+    else:
+        cli()  # type: ignore  # https://github.com/pallets/click/issues/2227
+
+
 if __name__ == "__main__":
-    cli()  # type: ignore  # https://github.com/pallets/click/issues/2227
+    main()
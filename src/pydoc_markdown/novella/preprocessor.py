@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+import io
+import json
 import logging
+import os
 import re
 import typing as t
 from pathlib import Path
 
+import databind.json
+import docspec
 from novella.markdown.preprocessor import MarkdownFile, MarkdownFiles, MarkdownPreprocessor
 from novella.markdown.tagparser import Tag, parse_block_tags, parse_inline_tags, replace_tags
 from novella.repository import RepositoryType, detect_repository
@@ -22,6 +29,9 @@ from pydoc_markdown.util.docspec import ApiSuite
 
 logger = logging.getLogger(__name__)
 
+#: The FQN, the tag options, the object hash, the renderer digest and the source URL of a rendered fragment.
+_FragmentKey = t.Tuple[str, str, str, str, t.Optional[str]]
+
 
 def autodetect_source_linker() -> t.Optional[SourceLinker]:
     repo = detect_repository(Path.cwd())
@@ -42,6 +52,47 @@ def autodetect_source_linker() -> t.Optional[SourceLinker]:
     return None
 
 
+def get_sources_fingerprint(filenames: t.Iterable[str]) -> t.List[t.Tuple[str, int, int]]:
+    """
+    Returns the modification time and size of the specified files and of the directories that contain them.
+    Including the directories allows to detect that files have been added or removed.
+    """
+
+    filenames = sorted(set(filenames))
+    paths = filenames + sorted(set(os.path.dirname(x) for x in filenames))
+    result = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            result.append((path, -1, -1))
+        else:
+            result.append((path, stat.st_mtime_ns, stat.st_size))
+    return result
+
+
+def get_renderer_digest(renderer: SingleObjectRenderer) -> str:
+    """
+    Returns a hash of the configuration of *renderer*, which includes the configuration of its source linker.
+    """
+
+    data = [type(renderer).__module__ + "." + type(renderer).__qualname__]
+    if dataclasses.is_dataclass(renderer):
+        data.append(databind.json.dump(renderer, type(renderer)))
+    else:
+        data.append(repr(renderer))
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_object_hash(obj: docspec.ApiObject) -> str:
+    """
+    Returns a hash of the full content of *obj*, including its location, docstring and members.
+    """
+
+    data = databind.json.dump(obj, type(obj))
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
 class PydocTagPreprocessor(MarkdownPreprocessor):
     """Implements the `@pydoc` and `@pylink` tag when using Novella for Markdown preprocessing
 
@@ -53,7 +104,18 @@ class PydocTagPreprocessor(MarkdownPreprocessor):
     _renderer: SingleObjectRenderer
     _suite: ApiSuite | None = None
 
+    #: The fingerprint of the source files that the #_suite was loaded from.
+    _suite_fingerprint: t.List[t.Tuple[str, int, int]] | None = None
+
     def __post_init__(self) -> None:
+        #: Rendered fragments by FQN, options, object hash, renderer digest and source URL. Persists between
+        #: builds in watch mode. Fragments that are used are moved to #_used_fragments, the rest is discarded
+        #: when the suite is reloaded.
+        self._fragments: t.Dict[_FragmentKey, str] = {}
+        self._used_fragments: t.Dict[_FragmentKey, str] = {}
+        self._object_hashes: t.Dict[int, str] = {}
+        self._renderer_digest = ""
+
         # Heuristic to provide a sensible default configuration of the plugin.
         if Path.cwd().name.lower() in ("docs", "documentation"):
             search_path = ["../src", ".."]
@@ -116,11 +178,27 @@ class PydocTagPreprocessor(MarkdownPreprocessor):
             return self._renderer
 
     def _load_api_suite(self) -> ApiSuite:
-        if self._suite is None:
-            modules = list(self._loader.load())
-            for processor in self._processors:
-                processor.process(modules, self)
-            self._suite = ApiSuite(modules)
+        """
+        Loads and processes the API suite. A suite that was loaded in a previous build is reused if none of the
+        source files it was loaded from changed.
+        """
+
+        if self._suite is not None and self._suite_fingerprint is not None:
+            filenames = [m.location.filename for m in self._suite]
+            if get_sources_fingerprint(filenames) == self._suite_fingerprint:
+                logger.info("  reusing API objects, sources are unchanged")
+                return self._suite
+
+        modules = list(self._loader.load())
+        for processor in self._processors:
+            processor.process(modules, self)
+        self._suite = ApiSuite(modules)
+        self._suite_fingerprint = get_sources_fingerprint(m.location.filename for m in modules)
+        self._object_hashes = {}
+
+        # Keep only the fragments that were used since the suite was last loaded.
+        self._fragments = self._used_fragments
+        self._used_fragments = {}
         return self._suite
 
     def _replace_pylink_tag(self, tag: Tag) -> str | None:
@@ -136,26 +214,67 @@ class PydocTagPreprocessor(MarkdownPreprocessor):
         context = Context(str(Path.cwd()))
         self._loader.init(context)
         self._renderer.init(context)
-        suite = self._load_api_suite()
+        self._renderer_digest = get_renderer_digest(self._renderer)
+        self._load_api_suite()
 
+        # Resolve the objects of all tags in the order of the files, such that messages are logged in that order.
+        file_tags: t.List[t.Tuple[MarkdownFile, t.List[Tag], t.List[_FragmentKey | None]]] = []
+        objects: t.Dict[_FragmentKey, t.Tuple[docspec.ApiObject, t.Dict[str, t.Any]]] = {}
         for file in files:
             tags = [t for t in parse_block_tags(file.content) if t.name == "pydoc"]
-            file.content = replace_tags(file.content, tags, lambda t: self._replace_pydoc_tag(file, t))
+            keys = [self._resolve_pydoc_tag(tag, objects) for tag in tags]
+            file_tags.append((file, tags, keys))
+
+        # Render each fragment that is not cached once, even if multiple files use it.
+        for key, (obj, options) in objects.items():
+            if key not in self._used_fragments:
+                fragment = self._fragments.get(key)
+                self._used_fragments[key] = self._render_fragment(obj, options) if fragment is None else fragment
+
+        for file, tags, keys in file_tags:
+            replacements = {id(tag): key for tag, key in zip(tags, keys)}
+            file.content = replace_tags(
+                file.content, tags, lambda t: self._replace_pydoc_tag(file, replacements[id(t)])
+            )
             tags = [t for t in parse_inline_tags(file.content) if t.name == "pylink"]
             file.content = replace_tags(file.content, tags, lambda t: self._replace_pylink_tag(t))
 
-    def _replace_pydoc_tag(self, file: MarkdownFile, tag: Tag) -> str | None:
+    def _resolve_pydoc_tag(
+        self, tag: Tag, objects: t.Dict[_FragmentKey, t.Tuple[docspec.ApiObject, t.Dict[str, t.Any]]]
+    ) -> _FragmentKey | None:
+        """
+        Returns the key of the fragment for a `@pydoc` *tag* and adds the object and options to render it with to
+        *objects*.
+        """
+
         assert self._suite is not None
         fqn = tag.args.strip()
-        objects = self._suite.resolve_fqn(fqn)
-        if len(objects) > 1:
+        matches = self._suite.resolve_fqn(fqn)
+        if len(matches) > 1:
             logger.warning("  found multiple matches for Python FQN <fg=cyan>%s</fg>", fqn)
-        elif not objects:
+        elif not matches:
             logger.warning("  found no match for Python FQN <fg=cyan>%s</fg>", fqn)
             return None
 
-        import io
+        obj = matches[0]
+        object_hash = self._object_hashes.get(id(obj))
+        if object_hash is None:
+            object_hash = self._object_hashes[id(obj)] = get_object_hash(obj)
 
+        # The source URL changes with the Git revision that the source linker links to.
+        source_linker: SourceLinker | None = getattr(self._renderer, "source_linker", None)
+        source_url = source_linker.get_source_url(obj) if source_linker else None
+        options = json.dumps(tag.options, sort_keys=True, default=str)
+        key = (fqn, options, object_hash, self._renderer_digest, source_url)
+        objects[key] = (obj, tag.options)
+        return key
+
+    def _render_fragment(self, obj: docspec.ApiObject, options: t.Dict[str, t.Any]) -> str:
         fp = io.StringIO()
-        self._renderer.render_object(fp, objects[0], tag.options)
-        return self.action.repeat(file.path, file.output_path, fp.getvalue())
+        self._renderer.render_object(fp, obj, options)
+        return fp.getvalue()
+
+    def _replace_pydoc_tag(self, file: MarkdownFile, key: _FragmentKey | None) -> str | None:
+        if key is None:
+            return None
+        return self.action.repeat(file.path, file.output_path, self._used_fragments[key])
@@ -0,0 +1,19 @@
+import os
+import sys
+
+
+def get_user_cache_dir() -> str:
+    """
+    Returns the directory in which Pydoc-Markdown caches data that can be shared across projects and builds. The
+    directory can be overwritten with the `PYDOC_MARKDOWN_CACHE_DIR` environment variable.
+    """
+
+    if os.getenv("PYDOC_MARKDOWN_CACHE_DIR"):
+        return os.environ["PYDOC_MARKDOWN_CACHE_DIR"]
+    if sys.platform.startswith("win32"):
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform.startswith("darwin"):
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pydoc-markdown")
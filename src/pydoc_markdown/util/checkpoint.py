@@ -0,0 +1,104 @@
+"""
+A checkpoint stores the modules after they were loaded and processed, such that subsequent runs that only differ
+in the renderer configuration can skip the loaders and processors.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import typing as t
+import weakref
+
+import docspec
+
+from pydoc_markdown.util.manifest import BuildManifest
+
+logger = logging.getLogger(__name__)
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickles Docspec objects without the weak references to their parents, which are restored by
+    #docspec.HasMembers.sync_hierarchy() after unpickling.
+    """
+
+    def persistent_id(self, obj: t.Any) -> t.Optional[str]:
+        return "weakref" if isinstance(obj, weakref.ref) else None
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid: t.Any) -> None:
+        return None
+
+
+class Checkpoint:
+    """
+    A checkpoint directory.
+
+    * `modules.pickle` &ndash; the processed modules and the key of the resolver they were processed with
+    * `manifest.json` &ndash; a #BuildManifest that records the digest of the loader and processor configuration,
+      the input files of the modules and the loader search paths (such that added modules are detected)
+
+    The modules are pickled because loading them from Docspec JSON takes about as long as parsing the files
+    again. The checkpoint is meant as a local cache, do not use a checkpoint from an untrusted source.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @property
+    def _modules_file(self) -> str:
+        return os.path.join(self.directory, "modules.pickle")
+
+    @property
+    def _manifest(self) -> BuildManifest:
+        return BuildManifest(os.path.join(self.directory, "manifest.json"))
+
+    def load(
+        self, digest: str, get_resolver_key: t.Callable[[t.List[docspec.Module]], str]
+    ) -> t.Optional[t.List[docspec.Module]]:
+        """
+        Returns the modules stored in the checkpoint, or #None if there is no checkpoint for the *digest*, the
+        input files changed since it was saved or *get_resolver_key* returns a different key for the modules than
+        the one they were saved with.
+        """
+
+        if not self._manifest.is_up_to_date(digest):
+            return None
+        try:
+            with open(self._modules_file, "rb") as fp:
+                resolver_key, modules = _Unpickler(fp).load()
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError) as exc:
+            logger.warning('Ignoring invalid checkpoint "%s" (%s)', self.directory, exc)
+            return None
+        for module in modules:
+            module.sync_hierarchy()
+        if get_resolver_key(modules) != resolver_key:
+            logger.debug("The resolver changed since the checkpoint was saved")
+            return None
+        return modules
+
+    def save(
+        self, digest: str, modules: t.List[docspec.Module], resolver_key: str, search_path: t.Iterable[str] = ()
+    ) -> None:
+        """
+        Saves the processed *modules* to the checkpoint. Nothing is saved if a module was not loaded from a file,
+        as the checkpoint could not tell when it changes. The *resolver_key* identifies the resolver that the
+        modules were processed with, and the directories of the *search_path* are checked for added modules.
+        """
+
+        manifest = self._manifest
+        inputs = {m.location.filename for m in modules}
+        missing = sorted(x for x in inputs if not os.path.isfile(x))
+        if missing:
+            logger.warning("Cannot save checkpoint, modules were not loaded from files: %s", ", ".join(missing))
+            manifest.remove()
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        manifest.remove()
+        with open(self._modules_file, "wb") as fp:
+            _Pickler(fp, pickle.HIGHEST_PROTOCOL).dump((resolver_key, modules))
+        manifest.write(digest, inputs, [], directories=search_path)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import threading
 import typing as t
+import weakref
 
 import docspec
-import docspec_python
 import typing_extensions as te
 from nr.util import Stream
 from nr.util.generic import T
@@ -23,7 +24,9 @@ def format_function_signature(func: docspec.Function, exclude_self: bool = False
     args = func.args[:]
     if exclude_self and args and args[0].name == "self":
         args.pop(0)
-    sig = f"({docspec_python.format_arglist(args)})"
+    from docspec_python import format_arglist
+
+    sig = f"({format_arglist(args)})"
     if func.return_type:
         sig += f" -> {func.return_type}"
     return sig
@@ -84,24 +87,98 @@ def get_object_description(obj: docspec.ApiObject) -> str:
         assert False, type(obj)
 
 
+class _ApiSuiteIndex:
+    """
+    Lookup tables for the API objects in an #ApiSuite. All lists are in pre-order of the API object tree.
+    """
+
+    def __init__(self, modules: t.List[docspec.Module]) -> None:
+        self.size = len(modules)
+        self.by_fqn: t.Dict[str, t.List[docspec.ApiObject]] = {}
+        self.by_name: t.Dict[str, t.List[docspec.ApiObject]] = {}
+        self.by_type: t.Dict[t.Type[docspec.ApiObject], t.List[docspec.ApiObject]] = {}
+        self.positions: t.Dict[int, int] = {}
+
+        # Build the dotted names incrementally instead of joining the path of every object.
+        stack: t.List[t.Tuple[str, docspec.ApiObject]] = [("", m) for m in reversed(modules)]
+        while stack:
+            prefix, obj = stack.pop()
+            fqn = prefix + obj.name
+            self.by_fqn.setdefault(fqn, []).append(obj)
+            self.by_name.setdefault(obj.name, []).append(obj)
+            self.by_type.setdefault(type(obj), []).append(obj)
+            self.positions[id(obj)] = len(self.positions)
+            if isinstance(obj, docspec.HasMembers):
+                prefix = fqn + "."
+                stack.extend((prefix, x) for x in reversed(obj.members))
+
+
 class ApiSuite:
-    """Container for all loaded API objects."""
+    """Container for all loaded API objects.
+
+    Lookups are served from an index that is built on first use. The index is rebuilt automatically if the
+    number of modules in the suite's module list changes, and after #invalidate_modules() was called for its
+    modules, which happens after each processor ran. If the modules are modified in any other way after the
+    index was built, #invalidate() must be called.
+    """
+
+    #: The suites that exist, such that #invalidate_modules() can find the ones that contain the modules.
+    _instances: t.ClassVar[weakref.WeakSet[ApiSuite]] = weakref.WeakSet()
+    _instances_lock: t.ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, modules: t.List[docspec.Module]) -> None:
         self._modules = modules
+        self._index: _ApiSuiteIndex | None = None
+        with ApiSuite._instances_lock:
+            ApiSuite._instances.add(self)
+
+    def _get_index(self) -> _ApiSuiteIndex:
+        index = self._index
+        if index is None or index.size != len(self._modules):
+            index = self._index = _ApiSuiteIndex(self._modules)
+        return index
+
+    def invalidate(self) -> None:
+        """Discard the index. It will be rebuilt on the next lookup."""
+
+        self._index = None
+
+    @staticmethod
+    def invalidate_modules(modules: t.Iterable[docspec.Module]) -> None:
+        """Discard the index of all suites that contain any of the *modules*, e.g. after a processor modified
+        them. The suites of other module trees keep their index."""
+
+        ids = set(map(id, modules))
+        with ApiSuite._instances_lock:
+            suites = list(ApiSuite._instances)
+        for suite in suites:
+            if suite._index is not None and any(id(m) in ids for m in suite._modules):
+                suite.invalidate()
 
     def resolve_fqn(self, fqn: str) -> t.List[docspec.ApiObject]:
-        def _match(results: list[docspec.ApiObject]) -> t.Callable[[docspec.ApiObject], t.Any]:
-            def matcher(obj: docspec.ApiObject) -> None:
-                current_fqn = ".".join(y.name for y in obj.path)
-                if current_fqn == fqn:
-                    results.append(obj)
+        """Returns all API objects with the fully qualified name *fqn*."""
+
+        return list(self._get_index().by_fqn.get(fqn, ()))
+
+    def get_objects_by_name(self, name: str) -> t.List[docspec.ApiObject]:
+        """Returns all API objects with the given (unqualified) *name*."""
+
+        return list(self._get_index().by_name.get(name, ()))
+
+    def get_objects_by_type(self, type_: t.Type[T]) -> t.List[T]:
+        """Returns all API objects that are instances of *type_*, e.g. #docspec.Class."""
+
+        index = self._get_index()
+        types = [x for x in index.by_type if issubclass(x, type_)]  # type: ignore[arg-type]
+        if len(types) == 1:
+            return list(index.by_type[types[0]])  # type: ignore[arg-type]
+        objects = Stream(index.by_type[x] for x in types).concat().collect()
+        return sorted(objects, key=self.get_position)  # type: ignore[arg-type]
 
-            return matcher
+    def get_position(self, obj: docspec.ApiObject) -> int:
+        """Returns the position of *obj* in a pre-order traversal of the suite."""
 
-        results: list[docspec.ApiObject] = []
-        docspec.visit(self._modules, _match(results))
-        return results
+        return self._get_index().positions[id(obj)]
 
     def __iter__(self) -> t.Iterator[docspec.Module]:
         return iter(self._modules)
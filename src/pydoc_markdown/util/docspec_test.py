@@ -0,0 +1,88 @@
+import typing as t
+
+import docspec
+
+from pydoc_markdown.contrib.renderers.markdown import MarkdownReferenceResolver
+from pydoc_markdown.util.docspec import ApiSuite
+
+
+def _make_modules() -> t.List[docspec.Module]:
+    loc = docspec.Location("<string>", 0)
+    method = docspec.Function(loc, "Foo", None, None, [], None, None)
+    bar = docspec.Class(loc, "Bar", None, [method], None, [], None)
+    foo = docspec.Class(loc, "Foo", None, [], None, [], None)
+    module = docspec.Module(loc, "a", None, [bar, foo])
+    module.sync_hierarchy()
+    other = docspec.Module(loc, "a.b", None, [docspec.Variable(loc, "Foo", None, None, "1")])
+    other.sync_hierarchy()
+    return [module, other]
+
+
+def _fqn(obj: t.Optional[docspec.ApiObject]) -> t.Optional[str]:
+    return ".".join(x.name for x in obj.path) if obj else None
+
+
+def test__ApiSuite__lookups() -> None:
+    modules = _make_modules()
+    suite = ApiSuite(modules)
+
+    assert [_fqn(x) for x in suite.resolve_fqn("a.Bar.Foo")] == ["a.Bar.Foo"]
+    assert suite.resolve_fqn("a.b") == [modules[1]]
+    assert suite.resolve_fqn("a.Baz") == []
+    assert [_fqn(x) for x in suite.get_objects_by_name("Foo")] == ["a.Bar.Foo", "a.Foo", "a.b.Foo"]
+    assert [x.name for x in suite.get_objects_by_type(docspec.Class)] == ["Bar", "Foo"]
+    assert [x.name for x in suite.get_objects_by_type(docspec.HasMembers)] == ["a", "Bar", "Foo", "a.b"]
+
+
+def test__ApiSuite__invalidate() -> None:
+    modules = _make_modules()
+    suite = ApiSuite(modules)
+    assert suite.resolve_fqn("a.Foo")
+    modules[0].members = [modules[0].members[0]]
+    assert suite.resolve_fqn("a.Foo")
+    suite.invalidate()
+    assert not suite.resolve_fqn("a.Foo")
+
+
+def test__ApiSuite__invalidated_automatically() -> None:
+    modules = _make_modules()
+    suite = ApiSuite(modules)
+    assert suite.resolve_fqn("a.b")
+    modules.pop()
+    assert not suite.resolve_fqn("a.b")
+
+    other_modules = _make_modules()
+    other_suite = ApiSuite(other_modules)
+    assert suite.resolve_fqn("a.Foo")
+    assert other_suite.resolve_fqn("a.Foo")
+    modules[0].members = [modules[0].members[0]]
+    other_modules[0].members = [other_modules[0].members[0]]
+    ApiSuite.invalidate_modules(modules)
+    assert not suite.resolve_fqn("a.Foo")
+
+    # Suites of other modules keep their index.
+    assert other_suite.resolve_fqn("a.Foo")
+
+
+def test__PydocMarkdown__process__invalidates_api_suites() -> None:
+    from pydoc_markdown import PydocMarkdown
+    from pydoc_markdown.contrib.processors.filter import FilterProcessor
+
+    modules = _make_modules()
+    suite = ApiSuite(modules)
+    assert suite.resolve_fqn("a.Foo")
+    config = PydocMarkdown(processors=[FilterProcessor(documented_only=False, expression="name != 'Foo'")])
+    config.process(modules)
+    assert not suite.resolve_fqn("a.Foo")
+
+
+def test__MarkdownReferenceResolver__global_resolution_prefers_preorder_of_parent() -> None:
+    modules = _make_modules()
+    suite = ApiSuite(modules)
+    resolver = MarkdownReferenceResolver(global_=True)
+    (foo_class,) = suite.resolve_fqn("a.Foo")
+    other_module = docspec.Module(modules[0].location, "c", None, [])
+
+    assert _fqn(resolver.resolve_reference(suite, modules[1], "Foo")) == "a.b.Foo"
+    assert _fqn(resolver.resolve_reference(suite, foo_class, "Bar.Foo")) == "a.Bar.Foo"
+    assert _fqn(resolver.resolve_reference(suite, other_module, "Foo")) == "a.Foo"
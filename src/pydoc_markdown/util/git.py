@@ -0,0 +1,250 @@
+"""
+Helpers to read metadata of a Git repository. Where possible, the metadata is read directly from the files in
+the `.git` directory, which is a lot faster than spawning Git subprocesses. The Git CLI is used as a fallback.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import logging
+import os
+import subprocess
+import typing as t
+
+from nr.util.git import Git, NoCurrentBranchError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class GitMetadata:
+    """
+    A snapshot of the state of a Git repository.
+    """
+
+    #: The toplevel directory of the working tree.
+    toplevel: str
+
+    #: The Git directory of the working tree (usually `.git` in the #toplevel).
+    git_dir: str
+
+    #: The SHA of the `HEAD` commit, or #None if there is no commit yet.
+    sha: t.Optional[str]
+
+    #: The name of the current branch, or #None if `HEAD` is detached.
+    branch: t.Optional[str]
+
+
+def find_git_dir(directory: str) -> t.Optional[t.Tuple[str, str]]:
+    """
+    Finds the toplevel and Git directory of the working tree that contains *directory*. Supports `.git` files
+    as used by worktrees and submodules. Returns #None if no Git directory is found.
+    """
+
+    current = os.path.realpath(directory)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return current, dot_git
+        if os.path.isfile(dot_git):
+            with open(dot_git) as fp:
+                content = fp.read().strip()
+            if content.startswith("gitdir:"):
+                return current, os.path.normpath(os.path.join(current, content[7:].strip()))
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _get_common_dir(git_dir: str) -> str:
+    try:
+        with open(os.path.join(git_dir, "commondir")) as fp:
+            return os.path.normpath(os.path.join(git_dir, fp.read().strip()))
+    except FileNotFoundError:
+        return git_dir
+
+
+def read_ref(git_dir: str, ref: str) -> t.Optional[str]:
+    """
+    Resolves *ref* (e.g. `HEAD` or `refs/heads/main`) to a SHA by reading the loose and packed refs in *git_dir*.
+    Returns #None if the ref cannot be resolved from the files.
+    """
+
+    common_dir = _get_common_dir(git_dir)
+    for _ in range(10):  # Guard against symbolic ref loops.
+        content = None
+        for base in (git_dir, common_dir):
+            try:
+                with open(os.path.join(base, ref)) as fp:
+                    content = fp.read().strip()
+                break
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                continue
+        if content is None:
+            return _read_packed_ref(common_dir, ref)
+        if not content.startswith("ref:"):
+            return content or None
+        ref = content[4:].strip()
+    return None
+
+
+def _read_packed_ref(common_dir: str, ref: str) -> t.Optional[str]:
+    try:
+        with open(os.path.join(common_dir, "packed-refs")) as fp:
+            for line in fp:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def read_head(git_dir: str) -> t.Tuple[t.Optional[str], t.Optional[str]]:
+    """
+    Returns the SHA and the branch name of `HEAD` in *git_dir*. The branch is #None if `HEAD` is detached.
+    """
+
+    with open(os.path.join(git_dir, "HEAD")) as fp:
+        head = fp.read().strip()
+    branch = None
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        if ref.startswith("refs/heads/"):
+            branch = ref[len("refs/heads/") :]
+    return read_ref(git_dir, "HEAD"), branch
+
+
+def get_git_metadata(directory: str) -> t.Optional[GitMetadata]:
+    """
+    Returns the #GitMetadata of the repository that contains *directory*, or #None if it is not in a Git
+    repository. Falls back to the Git CLI for information that cannot be read from the `.git` directory.
+    """
+
+    found = None if "GIT_DIR" in os.environ else find_git_dir(directory)
+    if found is None:
+        return _get_git_metadata_from_cli(directory)
+
+    toplevel, git_dir = found
+    try:
+        sha, branch = read_head(git_dir)
+    except OSError:
+        logger.debug("Could not read HEAD from %r, falling back to Git CLI", git_dir, exc_info=True)
+        return _get_git_metadata_from_cli(directory)
+
+    if sha is None:
+        # The ref may be stored in a format that we can't read (e.g. reftables), or there is no commit yet.
+        sha = Git(directory).rev_parse("HEAD")
+
+    return GitMetadata(toplevel, git_dir, sha, branch)
+
+
+def _get_git_metadata_from_cli(directory: str) -> t.Optional[GitMetadata]:
+    git = Git(directory)
+    toplevel = git.get_toplevel()
+    if not toplevel:
+        return None
+    git_dir = git.check_output(["git", "rev-parse", "--absolute-git-dir"]).decode().strip()
+    try:
+        branch: t.Optional[str] = git.get_current_branch_name()
+        if branch and "(" in branch:
+            branch = None  # For older versions of nr.util which returned the detached HEAD branch
+    except NoCurrentBranchError:
+        branch = None
+    return GitMetadata(toplevel, git_dir, git.rev_parse("HEAD"), branch)
+
+
+#: The number of #get_last_commits() results that are kept in the user cache directory.
+LAST_COMMITS_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=8)
+def get_last_commits(toplevel: str, sha: str) -> t.Dict[str, str]:
+    """
+    Returns a mapping of every file path (relative to *toplevel*, using forward slashes) that is reachable in the
+    history of the commit *sha* to the SHA of the last commit that modified it. The mapping is computed with a
+    single `git log` invocation and cached by the commit SHA in the user cache directory, such that subsequent
+    runs do not need to walk the history again.
+
+    Only the first parent of merge commits is followed, so files that were changed in a merged branch map to
+    the merge commit.
+    """
+
+    from pydoc_markdown.util.cache import get_user_cache_dir
+
+    cache_dir = os.path.join(get_user_cache_dir(), "git-last-commits")
+    cache_file = os.path.join(cache_dir, sha + ".json")
+    try:
+        with open(cache_file, encoding="utf-8") as fp:
+            cached = json.load(fp)
+        if isinstance(cached, dict):
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    result = _get_last_commits(toplevel, sha)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file + ".tmp", "w", encoding="utf-8") as fp:
+            json.dump(result, fp)
+        os.replace(cache_file + ".tmp", cache_file)
+        files = sorted(
+            (os.path.join(cache_dir, x) for x in os.listdir(cache_dir) if x.endswith(".json")), key=os.path.getmtime
+        )
+        for filename in files[:-LAST_COMMITS_CACHE_SIZE]:
+            os.remove(filename)
+    except OSError:
+        logger.warning('Could not cache the last commits in "%s"', cache_dir, exc_info=True)
+    return result
+
+
+def _get_last_commits(toplevel: str, sha: str) -> t.Dict[str, str]:
+    output = subprocess.check_output(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "log",
+            "--format=%x00%H",
+            "--name-only",
+            "--first-parent",
+            "-m",
+            sha,
+            "--",
+        ],
+        cwd=toplevel,
+    ).decode("utf-8", errors="surrogateescape")
+
+    result: t.Dict[str, str] = {}
+    commit = None
+    for line in output.splitlines():
+        if line.startswith("\0"):
+            commit = line[1:]
+        elif line and commit:
+            # The log is ordered from the newest to the oldest commit.
+            result.setdefault(line, commit)
+    return result
+
+
+def get_changed_files(directory: str, ref: str) -> t.Tuple[str, t.Set[str]]:
+    """
+    Returns the SHA of the commit *ref* and the real paths of the files in the working tree that contains
+    *directory* that differ from that commit, including uncommitted changes and untracked files. Files that were
+    deleted or renamed are included with their old path.
+    """
+
+    def _git(cwd: str, *args: str) -> str:
+        return subprocess.check_output(["git", "-c", "core.quotePath=false", *args], cwd=cwd).decode(
+            "utf-8", errors="surrogateescape"
+        )
+
+    sha = _git(directory, "rev-parse", "--verify", ref + "^{commit}").strip()
+    toplevel = _git(directory, "rev-parse", "--show-toplevel").strip()
+    names = _git(toplevel, "diff", "--name-only", "--no-renames", "-z", sha, "--").split("\0")
+    names += _git(toplevel, "ls-files", "--others", "--exclude-standard", "-z").split("\0")
+    return sha, {os.path.realpath(os.path.join(toplevel, name)) for name in names if name}
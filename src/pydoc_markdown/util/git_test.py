@@ -0,0 +1,155 @@
+import json
+import subprocess
+import typing as t
+from pathlib import Path
+
+import docspec
+import pytest
+
+from pydoc_markdown.contrib.source_linkers.git import GithubSourceLinker, get_git_metadata_for_context
+from pydoc_markdown.interfaces import Context
+from pydoc_markdown.util.git import get_git_metadata, get_last_commits
+
+
+def _git(path: Path, *args: str) -> str:
+    env = {
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.org",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.org",
+        "HOME": str(path),
+        "PATH": "/usr/bin:/bin:/usr/local/bin",
+    }
+    return subprocess.check_output(["git", *args], cwd=path, env=env).decode().strip()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch) -> Path:
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("PYDOC_MARKDOWN_CACHE_DIR", str(path))
+    get_last_commits.cache_clear()
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q", "-b", "develop")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text("x = 42\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def test__get_git_metadata__loose_ref(repo: Path) -> None:
+    metadata = get_git_metadata(str(repo / "src"))
+    assert metadata is not None
+    assert metadata.toplevel == _git(repo, "rev-parse", "--show-toplevel")
+    assert metadata.sha == _git(repo, "rev-parse", "HEAD")
+    assert metadata.branch == "develop"
+
+
+def test__get_git_metadata__packed_ref(repo: Path) -> None:
+    _git(repo, "pack-refs", "--all")
+    assert not (repo / ".git" / "refs" / "heads" / "develop").exists()
+    metadata = get_git_metadata(str(repo))
+    assert metadata is not None
+    assert metadata.sha == _git(repo, "rev-parse", "HEAD")
+    assert metadata.branch == "develop"
+
+
+def test__get_git_metadata__detached_head(repo: Path) -> None:
+    _git(repo, "checkout", "-q", "--detach")
+    metadata = get_git_metadata(str(repo))
+    assert metadata is not None
+    assert metadata.sha == _git(repo, "rev-parse", "HEAD")
+    assert metadata.branch is None
+
+
+def test__get_git_metadata__worktree(repo: Path) -> None:
+    _git(repo, "worktree", "add", "-q", "-b", "feature", str(repo / "wt"))
+    metadata = get_git_metadata(str(repo / "wt"))
+    assert metadata is not None
+    assert metadata.toplevel == str((repo / "wt").resolve())
+    assert metadata.sha == _git(repo, "rev-parse", "HEAD")
+    assert metadata.branch == "feature"
+
+
+def test__get_git_metadata__not_a_repository(tmp_path: Path) -> None:
+    assert get_git_metadata(str(tmp_path)) is None
+
+
+def test__GithubSourceLinker__shares_metadata_and_formats_urls(repo: Path) -> None:
+    context = Context(str(repo))
+    sha = _git(repo, "rev-parse", "HEAD")
+    toplevel = Path(_git(repo, "rev-parse", "--show-toplevel"))
+
+    linker_type: t.Any = GithubSourceLinker  # Mypy does not understand the databind dataclass fields.
+    linker = linker_type(repo="foo/bar")
+    linker.init(context)
+    branch_linker = linker_type(repo="foo/bar", use_branch=True)
+    branch_linker.init(context)
+    assert get_git_metadata_for_context(context) is get_git_metadata_for_context(context)
+
+    def _obj(filename: str, lineno: int) -> t.Any:
+        return docspec.Variable(docspec.Location(filename, lineno), "x", None, None, "42")
+
+    filename = str(toplevel / "src" / "mod.py")
+    assert linker.get_source_url(_obj(filename, 1)) == f"https://github.com/foo/bar/blob/{sha}/src/mod.py#L1"
+    assert linker.get_source_url(_obj(filename, 12)) == f"https://github.com/foo/bar/blob/{sha}/src/mod.py#L12"
+    assert branch_linker.get_source_url(_obj(filename, 3)) == "https://github.com/foo/bar/blob/develop/src/mod.py#L3"
+    assert linker.get_source_url(_obj("/elsewhere/mod.py", 1)) is None
+
+
+def test__get_last_commits(repo: Path) -> None:
+    first = _git(repo, "rev-parse", "HEAD")
+    (repo / "other.py").write_text("y = 1\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "second")
+    second = _git(repo, "rev-parse", "HEAD")
+
+    assert get_last_commits(str(repo), second) == {"src/mod.py": first, "other.py": second}
+    assert get_last_commits(str(repo), first) == {"src/mod.py": first}
+
+
+def test__get_last_commits__merge(repo: Path) -> None:
+    _git(repo, "checkout", "-q", "-b", "feature")
+    (repo / "src" / "mod.py").write_text("x = 43\n")
+    _git(repo, "commit", "-q", "-am", "change")
+    _git(repo, "checkout", "-q", "develop")
+    _git(repo, "merge", "-q", "--no-ff", "-m", "merge", "feature")
+    merge = _git(repo, "rev-parse", "HEAD")
+
+    assert get_last_commits(str(repo), merge) == {"src/mod.py": merge}
+
+
+def test__get_last_commits__persistent_cache(repo: Path, cache_dir: Path) -> None:
+    sha = _git(repo, "rev-parse", "HEAD")
+    assert get_last_commits(str(repo), sha) == {"src/mod.py": sha}
+    cache_file = cache_dir / "git-last-commits" / (sha + ".json")
+    assert json.loads(cache_file.read_text()) == {"src/mod.py": sha}
+
+    # A subsequent run reads the result from the cache instead of running `git log`.
+    cache_file.write_text(json.dumps({"src/mod.py": "cached"}))
+    get_last_commits.cache_clear()
+    assert get_last_commits(str(repo), sha) == {"src/mod.py": "cached"}
+
+
+def test__GithubSourceLinker__use_last_commit(repo: Path) -> None:
+    first = _git(repo, "rev-parse", "HEAD")
+    (repo / "other.py").write_text("y = 1\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "second")
+    second = _git(repo, "rev-parse", "HEAD")
+    toplevel = Path(_git(repo, "rev-parse", "--show-toplevel"))
+
+    linker_type: t.Any = GithubSourceLinker
+    linker = linker_type(repo="foo/bar", use_last_commit=True)
+    linker.init(Context(str(repo)))
+
+    def _url(filename: Path) -> str:
+        return linker.get_source_url(docspec.Variable(docspec.Location(str(filename), 1), "x", None, None, "42"))
+
+    assert _url(toplevel / "src" / "mod.py") == f"https://github.com/foo/bar/blob/{first}/src/mod.py#L1"
+    assert _url(toplevel / "other.py") == f"https://github.com/foo/bar/blob/{second}/other.py#L1"
+    assert _url(toplevel / "untracked.py") == f"https://github.com/foo/bar/blob/{second}/untracked.py#L1"
@@ -0,0 +1,158 @@
+"""
+Support for incremental builds with `pydoc-markdown --changed-since`. A build artifact stores the modules that
+were loaded in a build (before they were processed) and a copy of the files that the renderer produced, such that
+a later build only needs to parse the files that changed and render the outputs that include objects from them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import typing as t
+
+import docspec
+
+from pydoc_markdown import __version__
+
+logger = logging.getLogger(__name__)
+
+
+def _map_filenames(data: t.Any, func: t.Callable[[str], str]) -> None:
+    """
+    Applies *func* to the filenames of all locations in the Docspec JSON *data*.
+    """
+
+    if isinstance(data, dict):
+        location = data.get("location")
+        if isinstance(location, dict) and isinstance(location.get("filename"), str):
+            location["filename"] = func(location["filename"])
+        for value in data.values():
+            _map_filenames(value, func)
+    elif isinstance(data, list):
+        for value in data:
+            _map_filenames(value, func)
+
+
+class BuildArtifact:
+    """
+    A build artifact directory. The paths in the artifact are relative to the current working directory at the
+    time the artifact was saved, which is expected to be the same (e.g. the repository root) when it is used.
+
+    * `build.json` &ndash; the Pydoc-Markdown version, the configuration digest, the Git commit and the outputs
+    * `modules.json` &ndash; the loaded modules in Docspec JSON format
+    * `files/` &ndash; a copy of the outputs
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @property
+    def _metadata_file(self) -> str:
+        return os.path.join(self.directory, "build.json")
+
+    @property
+    def _modules_file(self) -> str:
+        return os.path.join(self.directory, "modules.json")
+
+    @property
+    def _files_dir(self) -> str:
+        return os.path.join(self.directory, "files")
+
+    @staticmethod
+    def _relpath(path: str) -> str:
+        relpath = os.path.relpath(os.path.abspath(path))
+        return os.path.abspath(path) if relpath.startswith(os.pardir) else relpath
+
+    def get_metadata(self) -> t.Optional[t.Dict[str, t.Any]]:
+        """
+        Returns the metadata of the artifact, or #None if the directory does not contain an artifact.
+        """
+
+        try:
+            with open(self._metadata_file) as fp:
+                return t.cast(t.Dict[str, t.Any], json.load(fp))
+        except FileNotFoundError:
+            return None
+
+    def is_compatible(self, config_digest: str) -> bool:
+        """
+        Returns #True if the artifact was saved by the same version of Pydoc-Markdown with the same configuration.
+        """
+
+        metadata = self.get_metadata()
+        if metadata is None:
+            logger.warning('No build artifact found in "%s"', self.directory)
+            return False
+        if metadata.get("version") != __version__:
+            logger.warning("Build artifact was saved by Pydoc-Markdown %s", metadata.get("version"))
+            return False
+        if metadata.get("config") != config_digest:
+            logger.warning("Build artifact was saved with a different configuration")
+            return False
+        return True
+
+    def save(
+        self,
+        config_digest: str,
+        sha: t.Optional[str],
+        modules: t.List[t.Dict[str, t.Any]],
+        outputs: t.List[str],
+    ) -> None:
+        """
+        Saves the artifact. The *modules* are the modules in Docspec JSON format as returned by
+        #docspec.dump_module(), with the filenames of their locations relative to the current directory.
+        """
+
+        if os.path.isdir(self._files_dir):
+            shutil.rmtree(self._files_dir)
+        os.makedirs(self._files_dir)
+        relpaths = []
+        for filename in outputs:
+            relpath = self._relpath(filename)
+            if os.path.isabs(relpath):
+                logger.warning('Output "%s" is outside of the current directory, not saved in build artifact', filename)
+                continue
+            target = os.path.join(self._files_dir, relpath)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(filename, target)
+            relpaths.append(relpath)
+
+        with open(self._modules_file, "w") as fp:
+            json.dump(modules, fp)
+        with open(self._metadata_file, "w") as fp:
+            json.dump({"version": __version__, "config": config_digest, "sha": sha, "outputs": relpaths}, fp)
+
+    @classmethod
+    def dump_modules(cls, modules: t.List[docspec.Module]) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Converts the *modules* to the format expected by #save().
+        """
+
+        result = []
+        for module in modules:
+            data = t.cast(t.Dict[str, t.Any], docspec.dump_module(module))
+            _map_filenames(data, cls._relpath)
+            result.append(data)
+        return result
+
+    def load_modules(self) -> t.List[docspec.Module]:
+        """
+        Loads the modules saved in the artifact, with the filenames of their locations converted to real paths.
+        """
+
+        with open(self._modules_file) as fp:
+            data = json.load(fp)
+        _map_filenames(data, os.path.realpath)
+        return [docspec.load_module(item) for item in data]
+
+    def restore_outputs(self) -> None:
+        """
+        Copies the outputs saved in the artifact to their original location.
+        """
+
+        metadata = self.get_metadata() or {}
+        for relpath in metadata.get("outputs", []):
+            os.makedirs(os.path.dirname(os.path.abspath(relpath)), exist_ok=True)
+            shutil.copy2(os.path.join(self._files_dir, relpath), relpath)
@@ -23,16 +23,18 @@ import collections
 import contextlib
 import csv
 import hashlib
+import io
 import os
 import typing as t
+import uuid
 from pathlib import Path
 
-from nr.util.fs import is_relative_to
+#: A record in the known files list. The *size* and *mtime* (in nanoseconds) are #None for records that were written
+#: by older versions of Pydoc-Markdown.
+FilenameAndHash = collections.namedtuple("FilenameAndHash", "algorithm,hash,name,size,mtime", defaults=(None, None))
 
-FilenameAndHash = collections.namedtuple("FilenameAndHash", "algorithm,hash,name")
 
-
-def hash_file(filename: str, algorithm: str, chunksize: int = 2**13) -> str:
+def hash_file(filename: str, algorithm: str, chunksize: int = 2**16) -> str:
     hash_ = hashlib.new(algorithm)
     with open(filename, "rb") as fp:
         while True:
@@ -43,68 +45,194 @@ def hash_file(filename: str, algorithm: str, chunksize: int = 2**13) -> str:
     return hash_.hexdigest()
 
 
+class _HashingWriter(io.RawIOBase):
+    """
+    A raw binary stream that updates a hash with all the bytes written to the underlying file.
+    """
+
+    def __init__(self, fp: t.BinaryIO, hash_: "hashlib._Hash") -> None:
+        self._fp = fp
+        self._hash = hash_
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: t.Any) -> int:
+        written = self._fp.write(data)
+        self._hash.update(memoryview(data)[:written])
+        self.size += written
+        return written
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fp.close()
+        super().close()
+
+
 class KnownFiles:
     """
     A helper class to keep track of the files that you write so you can get back the
     list of files at a later point.
+
+    The hash of files written with #open() is computed while writing. For files that are only registered with
+    #append(), the hash of the previous run is reused if the size and modification time of the file did not change.
+
+    Files written with #open() are first written to a temporary file that atomically replaces the target file only
+    if its contents changed, otherwise the target file is left untouched. If *remove_stale* is enabled, files that
+    were known from the previous run but were not written again are removed when the context is exited.
     """
 
-    def __init__(self, directory: str, filename: str = ".generated-files.txt", hash_algorithm: str = "md5") -> None:
+    def __init__(
+        self,
+        directory: str,
+        filename: str = ".generated-files.txt",
+        hash_algorithm: str = "blake2b",
+        remove_stale: bool = False,
+    ) -> None:
         self._directory = directory
         self._filename = filename
         self._hash_algorithm = hash_algorithm
+        self._remove_stale = remove_stale
         self._files: t.Optional[t.List[str]] = None
+        self._hashes: t.Dict[str, str] = {}
+        self._previous: t.Dict[str, FilenameAndHash] = {}
 
     def __enter__(self) -> "KnownFiles":
         assert self._files is None, "Context already entered."
         self._files = []
+        self._hashes = {}
+        self._previous = {os.path.relpath(record.name, self._directory): record for record in self.load()}
         return self
 
-    def __exit__(self, *args) -> None:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         assert self._files is not None
+        files = list(dict.fromkeys(self._files))
+        stale = [filename for filename in self._previous if filename not in set(files)]
+        if exc_type is not None:
+            # Keep track of the files from the previous run so they can still be cleaned up in the next run.
+            files += stale
+        elif self._remove_stale:
+            for filename in stale:
+                try:
+                    os.remove(os.path.join(self._directory, filename))
+                except FileNotFoundError:
+                    pass
+
         with open(os.path.join(self._directory, self._filename), "w") as fp:
             writer = csv.writer(fp, delimiter=" ")
-            for filename in self._files:
+            for filename in files:
+                size: t.Union[int, str] = "-"
+                mtime: t.Union[int, str] = "-"
                 try:
-                    hash_ = hash_file(os.path.join(self._directory, filename), self._hash_algorithm)
+                    stat = os.stat(os.path.join(self._directory, filename))
+                    size, mtime = stat.st_size, stat.st_mtime_ns
+                    hash_ = self._hashes.get(filename) or self._get_previous_hash(filename, stat) or ""
+                    if not hash_:
+                        hash_ = hash_file(os.path.join(self._directory, filename), self._hash_algorithm)
                 except OSError:
                     hash_ = "-"
-                writer.writerow([self._hash_algorithm, hash_, filename])
+                writer.writerow([self._hash_algorithm, hash_, size, mtime, filename])
         self._files = None
 
+    def _get_previous_hash(self, filename: str, stat: os.stat_result) -> t.Optional[str]:
+        record = self._previous.get(filename)
+        if (
+            record
+            and record.algorithm == self._hash_algorithm
+            and record.size == stat.st_size
+            and record.mtime == stat.st_mtime_ns
+        ):
+            return t.cast(str, record.hash)
+        return None
+
+    def _has_content(self, filename: str, hash_: str, size: int) -> bool:
+        """
+        Returns #True if the file *filename* exists and has the specified *hash_* and *size*.
+        """
+
+        path = os.path.join(self._directory, filename)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != size:
+            return False
+        existing_hash = self._get_previous_hash(filename, stat) or hash_file(path, self._hash_algorithm)
+        return existing_hash == hash_
+
     def load(self) -> t.Iterable[FilenameAndHash]:
         try:
             with open(os.path.join(self._directory, self._filename), "r") as fp:
                 reader = csv.reader(fp, delimiter=" ")
                 for row in reader:
-                    if len(row) != 3:
+                    size: t.Optional[int] = None
+                    mtime: t.Optional[int] = None
+                    if len(row) == 3:
+                        algorithm, hash_, filename = row
+                    elif len(row) == 5:
+                        algorithm, hash_, size_str, mtime_str, filename = row
+                        if size_str.isdigit() and mtime_str.isdigit():
+                            size, mtime = int(size_str), int(mtime_str)
+                    else:
                         continue
-                    algorithm, hash_, filename = row
                     filename = os.path.join(self._directory, filename)
-                    yield FilenameAndHash(algorithm, hash_, filename)
+                    yield FilenameAndHash(algorithm, hash_, filename, size, mtime)
         except FileNotFoundError:
             return
             yield
 
     def _check_filename(self, filename: str) -> str:
+        from nr.util.fs import is_relative_to
+
         if not is_relative_to(filename, self._directory):
             raise ValueError("filename must point inside directory {!r}, got {!r}".format(self._directory, filename))
         return str(Path(filename).relative_to(self._directory))
 
     @contextlib.contextmanager
     def open(self, filename: str, mode: str = "r", **kwargs) -> t.Generator[t.TextIO, None, None]:
+        """
+        Opens a file in the known files directory. When the file is opened for writing, it is registered as a known
+        file. Files opened with mode `w` or `x` are hashed as they are written and only replace the existing file
+        if the contents changed.
+        """
+
         assert self._files is not None
         filename = self._check_filename(filename)
         assert "b" not in mode, "does not support binary file modes"
-        if "w" in mode or "a" in mode:
-            if self._files is None:
-                raise RuntimeError("KnownFiles.__enter__() was not called")
-            with open(os.path.join(self._directory, filename), mode, **kwargs) as fp:
+        path = os.path.join(self._directory, filename)
+        if "w" in mode or "x" in mode:
+            if "x" in mode and os.path.exists(path):
+                raise FileExistsError(path)
+            hash_ = hashlib.new(self._hash_algorithm)
+            tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex[:8]}.tmp")
+            raw = _HashingWriter(t.cast(t.BinaryIO, open(tmp_path, "xb", buffering=0)), hash_)
+            try:
+                with io.TextIOWrapper(io.BufferedWriter(raw), **kwargs) as fp:
+                    yield t.cast(t.TextIO, fp)
+                digest = hash_.hexdigest()
+                if self._has_content(filename, digest, raw.size):
+                    os.remove(tmp_path)
+                else:
+                    os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._files.append(filename)
+            self._hashes[filename] = digest
+        elif "a" in mode:
+            with open(path, mode, **kwargs) as fp:
                 yield t.cast(t.TextIO, fp)
             self._files.append(filename)
+            self._hashes.pop(filename, None)
+        else:
+            with open(path, mode, **kwargs) as fp:
+                yield t.cast(t.TextIO, fp)
 
     def append(self, filename: str) -> None:
         assert self._files is not None
         filename = self._check_filename(filename)
         open(os.path.join(self._directory, filename), "r").close()  # Ensure the file exists.
         self._files.append(filename)
+        self._hashes.pop(filename, None)
@@ -0,0 +1,86 @@
+import os
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from pydoc_markdown.util import knownfiles
+from pydoc_markdown.util.knownfiles import KnownFiles, hash_file
+
+
+def test__KnownFiles__hashes_while_writing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(knownfiles, "hash_file", lambda *a: pytest.fail("file should not be hashed again"))
+    known_files = KnownFiles(str(tmp_path))
+    with known_files:
+        with known_files.open(str(tmp_path / "a.md"), "w") as fp:
+            fp.write("Hello\n")
+            fp.buffer.write(b"World\n")
+
+    (record,) = known_files.load()
+    stat = os.stat(tmp_path / "a.md")
+    assert record.algorithm == "blake2b"
+    assert record.hash == hash_file(str(tmp_path / "a.md"), "blake2b")
+    assert record.name == str(tmp_path / "a.md")
+    assert (record.size, record.mtime) == (stat.st_size, stat.st_mtime_ns)
+
+
+def test__KnownFiles__skips_hashing_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "b.md").write_text("b")
+    known_files = KnownFiles(str(tmp_path), hash_algorithm="md5")
+    with known_files:
+        known_files.append(str(tmp_path / "a.md"))
+        known_files.append(str(tmp_path / "b.md"))
+
+    hashed: t.List[str] = []
+
+    def _hash_file(filename: str, algorithm: str) -> str:
+        hashed.append(os.path.basename(filename))
+        return hash_file(filename, algorithm)
+
+    monkeypatch.setattr(knownfiles, "hash_file", _hash_file)
+    (tmp_path / "b.md").write_text("bb")
+    with known_files:
+        known_files.append(str(tmp_path / "a.md"))
+        known_files.append(str(tmp_path / "b.md"))
+
+    assert hashed == ["b.md"]
+    assert [x.hash for x in known_files.load()] == [hash_file(str(tmp_path / x), "md5") for x in ("a.md", "b.md")]
+
+
+def test__KnownFiles__loads_legacy_format(tmp_path: Path) -> None:
+    (tmp_path / ".generated-files.txt").write_text("md5 abc a.md\n")
+    (record,) = KnownFiles(str(tmp_path)).load()
+    assert record == ("md5", "abc", str(tmp_path / "a.md"), None, None)
+
+
+def test__KnownFiles__replaces_only_changed_files_and_removes_stale_files(tmp_path: Path) -> None:
+    def _render(contents: t.Dict[str, str]) -> None:
+        with KnownFiles(str(tmp_path), remove_stale=True) as known_files:
+            for name, content in contents.items():
+                with known_files.open(str(tmp_path / name), "w") as fp:
+                    fp.write(content)
+
+    _render({"a.md": "a", "b.md": "b", "c.md": "c"})
+    inodes = {name: os.stat(tmp_path / name).st_ino for name in ("a.md", "b.md")}
+
+    _render({"a.md": "a", "b.md": "bb"})
+    assert os.stat(tmp_path / "a.md").st_ino == inodes["a.md"]
+    assert os.stat(tmp_path / "b.md").st_ino != inodes["b.md"]
+    assert (tmp_path / "b.md").read_text() == "bb"
+    assert sorted(os.listdir(tmp_path)) == [".generated-files.txt", "a.md", "b.md"]
+
+
+def test__KnownFiles__keeps_track_of_stale_files_on_error(tmp_path: Path) -> None:
+    (tmp_path / "a.md").write_text("a")
+    with KnownFiles(str(tmp_path)) as known_files:
+        known_files.append(str(tmp_path / "a.md"))
+
+    with pytest.raises(RuntimeError):
+        with KnownFiles(str(tmp_path), remove_stale=True) as known_files:
+            with known_files.open(str(tmp_path / "b.md"), "w") as fp:
+                fp.write("b")
+            raise RuntimeError
+
+    assert (tmp_path / "a.md").exists()
+    assert sorted(os.path.basename(x.name) for x in known_files.load()) == ["a.md", "b.md"]
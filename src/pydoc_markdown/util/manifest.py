@@ -0,0 +1,176 @@
+"""
+A build manifest records the inputs and outputs of a render, such that a subsequent run can tell that rendering
+again would produce the same outputs without loading or processing anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import typing as t
+
+from pydoc_markdown import __version__
+from pydoc_markdown.util.knownfiles import hash_file
+
+logger = logging.getLogger(__name__)
+
+#: The hash algorithm used for the files recorded in the manifest.
+HASH_ALGORITHM = "blake2b"
+
+#: A file record in the manifest: the size, modification time (in nanoseconds) and hash of the file.
+_FileRecord = t.Tuple[int, int, str]
+
+
+def _record_file(path: str) -> _FileRecord:
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, hash_file(path, HASH_ALGORITHM))
+
+
+def _check_file(path: str, record: t.Sequence[t.Any]) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    size, mtime, hash_ = record
+    if st.st_size != size:
+        return False
+    # The modification time changes e.g. after a fresh checkout, in which case we compare the contents.
+    return st.st_mtime_ns == mtime or hash_file(path, HASH_ALGORITHM) == hash_
+
+
+def _hash_directory(path: str) -> t.Optional[str]:
+    """
+    Hashes the names of the Python source files and subdirectories in *path*, such that adding or removing modules
+    and packages changes the hash.
+    """
+
+    try:
+        with os.scandir(path) as it:
+            names = sorted(x.name for x in it if x.name.endswith((".py", ".pyi")) or x.is_dir())
+    except OSError:
+        return None
+    return hashlib.new(HASH_ALGORITHM, "\0".join(names).encode("utf-8")).hexdigest()
+
+
+def _get_git_head() -> t.Optional[t.List[t.Optional[str]]]:
+    from pydoc_markdown.util.git import get_git_metadata
+
+    git = get_git_metadata(os.getcwd())
+    return [git.sha, git.branch] if git else None
+
+
+class BuildManifest:
+    """
+    Records the hashes of the configuration, the input files, the Pydoc-Markdown version and the output files of a
+    render in *filename*. The paths in the manifest are relative to the directory that contains it.
+
+    In addition to the input files, the manifest records which Python source files and directories exist next to
+    the input files and in their parent directories (up to the directory of the manifest), so that it can tell
+    when a module was added that would be picked up by the loader. If the outputs depend on the Git commit (e.g.
+    because they link to the source code), the SHA and branch of `HEAD` in the current directory are recorded too.
+    The values of the environment variables that the configuration references are recorded as well, as the
+    configuration digest only covers the configuration file itself.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.directory = os.path.dirname(os.path.abspath(filename))
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.directory)
+
+    def _abspath(self, path: str) -> str:
+        return os.path.normpath(os.path.join(self.directory, path))
+
+    def _get_directories(self, inputs: t.Iterable[str]) -> t.Set[str]:
+        directories = set()
+        for path in inputs:
+            directory = os.path.dirname(os.path.abspath(path))
+            directories.add(directory)
+            while directory.startswith(self.directory + os.sep):
+                directory = os.path.dirname(directory)
+                directories.add(directory)
+        return directories
+
+    def is_up_to_date(self, config_digest: str) -> bool:
+        """
+        Returns #True if the manifest exists and the version, the *config_digest*, the input files, the output
+        files and the environment variables match the ones recorded in the manifest.
+        """
+
+        try:
+            with open(self.filename) as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            logger.warning('Ignoring invalid build manifest "%s"', self.filename)
+            return False
+
+        if data.get("version") != __version__:
+            logger.debug("Build manifest was written by Pydoc-Markdown %s", data.get("version"))
+            return False
+        if data.get("config") != config_digest:
+            logger.debug("Configuration changed since the last render")
+            return False
+        for key in ("inputs", "outputs"):
+            for path, record in data.get(key, {}).items():
+                if not _check_file(self._abspath(path), record):
+                    logger.debug('File "%s" changed since the last render', path)
+                    return False
+        for path, hash_ in data.get("directories", {}).items():
+            if _hash_directory(self._abspath(path)) != hash_:
+                logger.debug('Directory "%s" changed since the last render', path)
+                return False
+        for name, value in data.get("env", {}).items():
+            if os.environ.get(name) != value:
+                logger.debug('Environment variable "%s" changed since the last render', name)
+                return False
+        if "git" in data and data["git"] != _get_git_head():
+            logger.debug("Git HEAD changed since the last render")
+            return False
+        return True
+
+    def write(
+        self,
+        config_digest: str,
+        inputs: t.Iterable[str],
+        outputs: t.Iterable[str],
+        renderer_inputs: t.Iterable[str] = (),
+        record_git_head: bool = False,
+        directories: t.Iterable[str] = (),
+        env_vars: t.Iterable[str] = (),
+    ) -> None:
+        """
+        Writes the manifest for a render with the given *config_digest* that loaded the modules from the *inputs*,
+        read the *renderer_inputs* (e.g. templates) and produced the *outputs*. If *record_git_head* is enabled,
+        the manifest is only up to date as long as the Git `HEAD` does not change. The *directories* (e.g. the
+        loader search path) are recorded in addition to the directories of the *inputs*. The current values of
+        the *env_vars* (e.g. the ones referenced by the configuration) are recorded and compared with
+        `os.environ` by #is_up_to_date().
+        """
+
+        inputs = list(inputs)
+        all_directories = self._get_directories(inputs) | {os.path.abspath(x) for x in directories}
+        data: t.Dict[str, t.Any] = {
+            "version": __version__,
+            "config": config_digest,
+            "inputs": {self._relpath(x): _record_file(x) for x in sorted(set(inputs) | set(renderer_inputs))},
+            "directories": {self._relpath(x): _hash_directory(x) for x in sorted(all_directories)},
+            "outputs": {self._relpath(x): _record_file(x) for x in sorted(set(outputs))},
+            "env": {x: os.environ.get(x) for x in sorted(set(env_vars))},
+        }
+        if record_git_head:
+            data["git"] = _get_git_head()
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w") as fp:
+            json.dump(data, fp, indent=2)
+        os.replace(tmp_filename, self.filename)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
@@ -73,6 +73,13 @@ class Pages(t.List[T_Page]):
         for page in self:
             yield from page.iter_hierarchy()
 
+    def get_source_files(self, context_directory: str) -> t.List[str]:
+        """
+        Returns the paths of the #GenericPage.source files of all pages in the hierarchy.
+        """
+
+        return [os.path.join(context_directory, item.page.source) for item in self.iter_hierarchy() if item.page.source]
+
 
 @dataclasses.dataclass
 class GenericPage(t.Generic[T_Page]):
@@ -119,6 +126,34 @@ class GenericPage(t.Generic[T_Page]):
         for child in self.children:
             yield from child.iter_hierarchy(parent_chain + [self])
 
+    def includes_objects_of(self, modules: t.List[docspec.Module]) -> bool:
+        """
+        Returns #True if any API object of the *modules* is selected via #Page.contents.
+        """
+
+        contents = self.contents or []
+
+        def _match(obj: docspec.ApiObject, path: str) -> bool:
+            if any(fnmatch.fnmatch(path, x) for x in contents):
+                return True
+            return any(_match(member, path + "." + member.name) for member in getattr(obj, "members", []))
+
+        return bool(contents) and any(_match(module, module.name) for module in modules)
+
+    def is_up_to_date(self, filename: str, changed_modules: t.Optional[t.List[docspec.Module]]) -> bool:
+        """
+        Returns #True if the page does not need to be rendered again because the file from a previous render
+        exists and the page includes no API objects of the *changed_modules*. Pages with a #source are always
+        rendered again.
+        """
+
+        return (
+            changed_modules is not None
+            and not self.source
+            and not self.includes_objects_of(changed_modules)
+            and os.path.isfile(filename)
+        )
+
     def filtered_modules(self, modules: t.List[docspec.Module]) -> t.List[docspec.Module]:
         """
         Creates a copy of the module graph where only the API objects selected
@@ -159,18 +194,21 @@ class GenericPage(t.Generic[T_Page]):
         renderer: SinglePageRenderer,
         context_directory: str,
         write_prefix: t.Optional[t.Callable[[t.TextIO], None]] = None,
+        opener: t.Optional[t.Callable[[str, str], t.ContextManager[t.TextIO]]] = None,
     ) -> None:
         """
         Renders the page by either copying the *source* to the specified *filename* or by
         rendering the *contents* from the *modules* using the specified *renderer*.
 
-        Note that the *renderer* should be pre-configured to output to *filename*.
+        Note that the *renderer* should be pre-configured to output to *filename*. The *opener*
+        can be used to replace the builtin #open() function, e.g. with #KnownFiles.open().
         """
 
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "w") as fp:
+        with (opener or open)(filename, "w") as fp:
             if write_prefix:
                 write_prefix(fp)
+                fp.flush()
             if self.source:
                 src_path = os.path.join(context_directory, self.source)
                 logger.info('Writing "%s" (source: "%s")', filename, src_path)
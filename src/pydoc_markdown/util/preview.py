@@ -0,0 +1,194 @@
+"""
+A minimal HTTP server to preview Markdown output in the browser without a static site generator. Pages are
+rendered when they are requested and cached until the pages are updated. The other pages are rendered in the
+background only after the first requested page was served.
+"""
+
+from __future__ import annotations
+
+import html
+import http.server
+import logging
+import threading
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 60em; margin: 2em auto; padding: 0 1em; line-height: 1.5; }}
+pre {{ background: #f5f5f5; padding: 0.5em; overflow-x: auto; }}
+code {{ background: #f5f5f5; }}
+</style>
+</head>
+<body>
+{nav}
+{body}
+</body>
+</html>
+"""
+
+#: Served for all paths until the pages were set with #PreviewServer.update(). It reloads itself until then.
+_BUILDING_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta http-equiv="refresh" content="1">
+<title>Building...</title>
+</head>
+<body>
+<p>Building the documentation...</p>
+</body>
+</html>
+"""
+
+
+def markdown_to_html(text: str) -> str:
+    """
+    Converts Markdown to HTML using the `markdown` package if it is installed. Otherwise, the Markdown is
+    displayed as preformatted text.
+    """
+
+    try:
+        import markdown  # type: ignore[import]
+    except ImportError:
+        return "<pre>{}</pre>".format(html.escape(text))
+    return t.cast(str, markdown.markdown(text, extensions=["fenced_code", "tables", "toc"]))
+
+
+class PreviewPage(t.NamedTuple):
+    #: The title of the page.
+    title: str
+
+    #: A function that renders the page to Markdown. It is only called when the page is requested.
+    render: t.Callable[[], str]
+
+
+class PreviewServer:
+    """
+    Serves the pages set with #update() on `http://{host}:{port}/`. The HTML for a page is rendered on the first
+    request and cached until the pages are updated. Until the pages were set the first time, every request is served
+    a page that reloads itself, such that the server can be started before the first render finished. Once a page was rendered for a request, the remaining pages are
+    rendered in a background thread if *prerender* is enabled, such that the page being viewed is always rendered
+    first. The server implements the #ServerProcess interface, such that it can be returned from
+    #Server.start_server().
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 8000, prerender: bool = True) -> None:
+        self._host = host
+        self._prerender = prerender
+        self._prerendering: t.Optional[t.Dict[str, PreviewPage]] = None
+        self._pages: t.Optional[t.Dict[str, PreviewPage]] = None
+        self._cache: t.Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._render_locks: t.Dict[str, threading.Lock] = {}
+        self._server = http.server.ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return "http://{}:{}/".format(self._host, self._server.server_port)
+
+    def update(self, pages: t.Dict[str, PreviewPage]) -> None:
+        """
+        Replaces the served pages. The keys are the URL paths of the pages (e.g. `/` or `/api/module`). The
+        cached HTML of all pages is discarded.
+        """
+
+        with self._lock:
+            self._pages = dict(pages)
+            self._cache = {}
+
+    def get_html(self, path: str) -> t.Optional[bytes]:
+        """
+        Returns the HTML for the page at *path*, rendering it if it is not cached. Returns #None if there is no
+        page at that path, or a page that reloads itself if #update() was not called yet.
+        """
+
+        with self._lock:
+            if self._pages is None:
+                return _BUILDING_HTML.encode("utf-8")
+            page = self._pages.get(path)
+            if page is None:
+                return None
+            if path in self._cache:
+                return self._cache[path]
+            render_lock = self._render_locks.setdefault(path, threading.Lock())
+            pages = self._pages
+
+        # Render outside of the global lock such that other pages can still be served, but make sure that
+        # concurrent requests for the same page render it only once.
+        with render_lock:
+            with self._lock:
+                if self._pages is pages and path in self._cache:
+                    return self._cache[path]
+            logger.info('Rendering preview of "%s"', path)
+            nav = " | ".join(
+                '<a href="{}">{}</a>'.format(html.escape(p), html.escape(x.title)) for p, x in sorted(pages.items())
+            )
+            data = _HTML_TEMPLATE.format(
+                title=html.escape(page.title),
+                nav="<nav>{}</nav>".format(nav) if len(pages) > 1 else "",
+                body=markdown_to_html(page.render()),
+            ).encode("utf-8")
+            with self._lock:
+                if self._pages is pages:
+                    self._cache[path] = data
+                start_prerender = self._prerender and self._prerendering is not pages
+                if start_prerender:
+                    self._prerendering = pages
+
+        if start_prerender:
+            threading.Thread(target=self._prerender_pages, args=(pages,), daemon=True).start()
+        return data
+
+    def _prerender_pages(self, pages: t.Dict[str, PreviewPage]) -> None:
+        for path in pages:
+            with self._lock:
+                if self._pages is not pages or not self._thread.is_alive():
+                    return
+            try:
+                self.get_html(path)
+            except Exception:
+                logger.exception('Failed to render preview of "%s"', path)
+
+    def _make_handler(self) -> t.Type[http.server.BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                try:
+                    data = server.get_html(self.path.partition("?")[0])
+                except Exception:
+                    logger.exception('Failed to render preview of "%s"', self.path)
+                    self.send_error(500)
+                    return
+                if data is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: t.Any) -> None:
+                logger.debug(format, *args)
+
+        return Handler
+
+    # ServerProcess
+
+    def poll(self) -> t.Optional[int]:
+        return None if self._thread.is_alive() else 0
+
+    def terminate(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
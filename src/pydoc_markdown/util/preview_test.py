@@ -0,0 +1,148 @@
+import sys
+import time
+import typing as t
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import docspec
+import pytest
+
+from pydoc_markdown.contrib.renderers.markdown import MarkdownRenderer
+from pydoc_markdown.interfaces import Context
+from pydoc_markdown.util.pages import Page, Pages
+from pydoc_markdown.util.preview import PreviewPage, PreviewServer, markdown_to_html
+
+
+def _get(url: str) -> str:
+    with urllib.request.urlopen(url) as response:
+        return t.cast(str, response.read().decode("utf-8"))
+
+
+def _make_page(name: str, rendered: t.List[str]) -> PreviewPage:
+    def _render() -> str:
+        rendered.append(name)
+        return f"# {name}"
+
+    return PreviewPage(name, _render)
+
+
+def test__markdown_to_html() -> None:
+    pytest.importorskip("markdown")
+    assert "index</h1>" in markdown_to_html("# index")
+
+
+def test__markdown_to_html__fallback(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "markdown", None)
+    assert markdown_to_html("# <index>") == "<pre># &lt;index&gt;</pre>"
+
+
+def test__PreviewServer__serves_building_page_before_first_update() -> None:
+    rendered: t.List[str] = []
+    server = PreviewServer("localhost", 0, prerender=False)
+    try:
+        for path in ("", "other"):
+            html = _get(server.url + path)
+            assert "<title>Building...</title>" in html
+            assert '<meta http-equiv="refresh"' in html
+
+        server.update({"/": _make_page("index", rendered)})
+        assert "<title>index</title>" in _get(server.url)
+        with pytest.raises(urllib.error.HTTPError):
+            _get(server.url + "other")
+    finally:
+        server.terminate()
+
+
+def test__PreviewServer__renders_pages_on_demand() -> None:
+    rendered: t.List[str] = []
+    server = PreviewServer("localhost", 0, prerender=False)
+    try:
+        server.update({"/": _make_page("index", rendered), "/other": _make_page("other", rendered)})
+        assert rendered == []
+        assert "<title>index</title>" in _get(server.url)
+        assert "<title>index</title>" in _get(server.url)
+        assert rendered == ["index"]
+
+        server.update({"/": _make_page("index", rendered)})
+        assert "<title>index</title>" in _get(server.url)
+        assert rendered == ["index", "index"]
+
+        with pytest.raises(urllib.error.HTTPError):
+            _get(server.url + "other")
+    finally:
+        server.terminate()
+    assert server.poll() == 0
+
+
+def test__PreviewServer__renders_viewed_page_first() -> None:
+    rendered: t.List[str] = []
+    server = PreviewServer("localhost", 0)
+    try:
+        server.update({f"/{x}": _make_page(x, rendered) for x in ("a", "b", "c")})
+        time.sleep(0.1)
+        assert rendered == []
+        assert "<title>c</title>" in _get(server.url + "c")
+        assert rendered[0] == "c"
+
+        # The other pages are rendered in the background afterwards.
+        deadline = time.monotonic() + 5
+        while len(rendered) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(rendered) == ["a", "b", "c"]
+    finally:
+        server.terminate()
+
+
+def test__MarkdownRenderer__serves_preview_instead_of_writing_file(tmp_path: Path) -> None:
+    loc = docspec.Location("<string>", 0)
+    modules = [docspec.Module(loc, "mymodule", None, [docspec.Function(loc, "foo", None, None, [], None, None)])]
+    renderer = MarkdownRenderer(filename=str(tmp_path / "api.md"), server_port=0)
+    renderer.init(Context(str(tmp_path)))
+    assert renderer.renders_on_demand
+
+    process = renderer.start_server()
+    try:
+        renderer.render(modules)
+        assert not (tmp_path / "api.md").exists()
+        assert renderer._preview_server is not None
+        assert "foo" in _get(renderer._preview_server.url)
+    finally:
+        process.terminate()
+
+    renderer.render(modules)
+    assert "foo" in (tmp_path / "api.md").read_text()
+
+
+def test__MarkdownRenderer__serves_preview_pages(tmp_path: Path) -> None:
+    loc = docspec.Location("<string>", 0)
+    doc = docspec.Docstring(loc, "Documented.")
+    modules = [
+        docspec.Module(loc, "a", None, [docspec.Function(loc, "foo", doc, None, [], None, None)]),
+        docspec.Module(loc, "b", None, [docspec.Function(loc, "bar", doc, None, [], None, None)]),
+    ]
+    for module in modules:
+        module.sync_hierarchy()
+    (tmp_path / "README.md").write_text("Read me!")
+    pages = Pages(
+        [
+            Page(title="Home", source="README.md"),
+            Page(title="API", children=[Page(title="A", contents=["a", "a.*"]), Page(title="B", contents=["b.*"])]),
+        ]
+    )
+    renderer = MarkdownRenderer(server_port=0, preview_pages=pages)
+    renderer.init(Context(str(tmp_path)))
+
+    process = renderer.start_server()
+    try:
+        renderer.render(modules)
+        assert renderer._preview_server is not None
+        url = renderer._preview_server.url
+        assert "Read me!" in _get(url)
+        assert "Read me!" in _get(url + "home")
+        assert "foo" in _get(url + "api/a") and "bar" not in _get(url + "api/a")
+        assert "bar" in _get(url + "api/b") and "foo" not in _get(url + "api/b")
+        with pytest.raises(urllib.error.HTTPError):
+            _get(url + "api")
+    finally:
+        process.terminate()
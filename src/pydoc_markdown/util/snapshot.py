@@ -0,0 +1,377 @@
+"""
+A compact binary format for Docspec module trees. Snapshots are a lot smaller and faster to write and read than
+Docspec JSON, which makes them suitable to pass the loaded modules between the stages of a pipeline (see
+`pydoc-markdown --dump --dump-format snapshot`).
+
+A snapshot starts with a header that names the Docspec classes and their fields in the order in which they are
+encoded, followed by a sequence of frames. Every frame starts with its kind and length, such that a reader can
+skip frames it is not interested in.
+
+* A string frame (`S`) adds strings to the string table of the snapshot. Strings are only stored once and
+  referenced by their index in the table.
+* A module frame (`M`) contains the name of the module followed by the encoded module. The strings it references
+  are added by the string frames that precede it.
+
+The snapshot may be compressed with gzip or zstd (the latter requires the `zstandard` package). The compression
+is detected when reading a snapshot.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import enum
+import gzip
+import io
+import json
+import typing as t
+
+import docspec
+
+#: The magic bytes that every (uncompressed) snapshot starts with.
+MAGIC = b"PDMSNAP"
+
+#: The version of the snapshot format.
+VERSION = 1
+
+#: The supported compressions.
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+#: The Docspec classes that can be encoded in a snapshot.
+_CLASSES: t.List[t.Type[t.Any]] = [
+    docspec.Location,
+    docspec.Docstring,
+    docspec.Decoration,
+    docspec.Argument,
+    docspec.Indirection,
+    docspec.Variable,
+    docspec.Function,
+    docspec.Class,
+    docspec.Module,
+]
+
+#: The Docspec enumerations that can be encoded in a snapshot.
+_ENUMS: t.List[t.Type[enum.Enum]] = [
+    docspec.Argument.Type,
+    docspec.ClassSemantic,
+    docspec.FunctionSemantic,
+    docspec.VariableSemantic,
+]
+
+_FRAME_STRINGS = b"S"
+_FRAME_MODULE = b"M"
+
+# Value tags.
+_NONE, _FALSE, _TRUE, _INT, _STR, _LIST, _OBJECT, _ENUM = range(8)
+
+
+class SnapshotError(Exception):
+    """
+    Raised when a snapshot cannot be read.
+    """
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _get_schema() -> t.Dict[str, t.Any]:
+    return {
+        "version": VERSION,
+        "classes": [[cls.__qualname__, [f.name for f in dataclasses.fields(cls)]] for cls in _CLASSES],
+        "enums": [[cls.__qualname__, [m.name for m in cls]] for cls in _ENUMS],
+    }
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: t.Dict[str, int] = {}
+        self.new_strings: t.List[str] = []
+        self.class_ids = {cls: (idx, [f.name for f in dataclasses.fields(cls)]) for idx, cls in enumerate(_CLASSES)}
+        self.enum_ids = {cls: (idx, {m: i for i, m in enumerate(cls)}) for idx, cls in enumerate(_ENUMS)}
+
+    def _get_class_id(self, type_: t.Type[t.Any]) -> t.Tuple[int, t.List[str]]:
+        # Subclasses of the Docspec classes are encoded as the Docspec class that they inherit from.
+        for base in type_.__mro__:
+            if base in self.class_ids:
+                self.class_ids[type_] = self.class_ids[base]
+                return self.class_ids[base]
+        raise TypeError(f"cannot encode object of type {type_.__name__!r} in a snapshot")
+
+    def intern(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+            self.new_strings.append(str(value))
+        return index
+
+    def encode(self, buf: bytearray, value: t.Any) -> None:
+        if value is None:
+            buf.append(_NONE)
+        elif value is True:
+            buf.append(_TRUE)
+        elif value is False:
+            buf.append(_FALSE)
+        elif isinstance(value, str):
+            buf.append(_STR)
+            _write_varint(buf, self.intern(value))
+        elif isinstance(value, enum.Enum):
+            enum_id, members = self.enum_ids[type(value)]
+            buf.append(_ENUM)
+            _write_varint(buf, enum_id)
+            _write_varint(buf, members[value])
+        elif isinstance(value, int):
+            buf.append(_INT)
+            _write_varint(buf, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, (list, tuple)):
+            buf.append(_LIST)
+            _write_varint(buf, len(value))
+            for item in value:
+                self.encode(buf, item)
+        else:
+            class_id, fields = self.class_ids.get(type(value)) or self._get_class_id(type(value))
+            buf.append(_OBJECT)
+            _write_varint(buf, class_id)
+            for name in fields:
+                self.encode(buf, getattr(value, name))
+
+
+class SnapshotWriter:
+    """
+    Writes modules to a snapshot in the binary file-like object *fp*, optionally compressed.
+    """
+
+    def __init__(self, fp: t.BinaryIO, compression: str = "none") -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"unknown compression: {compression!r}")
+        self._exit_stack = contextlib.ExitStack()
+        self._fp = _open_compressed_writer(fp, compression, self._exit_stack)
+        self._encoder = _Encoder()
+        header = json.dumps(_get_schema()).encode("utf-8")
+        buf = bytearray(MAGIC)
+        _write_varint(buf, len(header))
+        self._fp.write(bytes(buf) + header)
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def _write_frame(self, kind: bytes, payload: bytearray) -> None:
+        buf = bytearray(kind)
+        _write_varint(buf, len(payload))
+        self._fp.write(bytes(buf))
+        self._fp.write(payload)
+
+    def write(self, module: docspec.Module) -> None:
+        """
+        Writes a module to the snapshot.
+        """
+
+        payload = bytearray()
+        _write_varint(payload, self._encoder.intern(module.name))
+        self._encoder.encode(payload, module)
+
+        new_strings, self._encoder.new_strings = self._encoder.new_strings, []
+        if new_strings:
+            strings = bytearray()
+            _write_varint(strings, len(new_strings))
+            for string in new_strings:
+                data = string.encode("utf-8", errors="surrogatepass")
+                _write_varint(strings, len(data))
+                strings += data
+            self._write_frame(_FRAME_STRINGS, strings)
+        self._write_frame(_FRAME_MODULE, payload)
+
+    def close(self) -> None:
+        self._exit_stack.close()
+
+
+def _open_compressed_writer(fp: t.BinaryIO, compression: str, exit_stack: contextlib.ExitStack) -> t.BinaryIO:
+    if compression == "gzip":
+        return t.cast(t.BinaryIO, exit_stack.enter_context(gzip.GzipFile(fileobj=fp, mode="wb")))
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        writer = zstandard.ZstdCompressor().stream_writer(fp, closefd=False)
+        return t.cast(t.BinaryIO, exit_stack.enter_context(writer))
+    return fp
+
+
+def _import_zstandard() -> t.Any:
+    try:
+        import zstandard  # type: ignore[import]
+    except ImportError:
+        raise SnapshotError("zstd compression requires the `zstandard` package")
+    return zstandard
+
+
+class _Decoder:
+    def __init__(self, schema: t.Dict[str, t.Any]) -> None:
+        classes = {cls.__qualname__: cls for cls in _CLASSES}
+        enums = {cls.__qualname__: cls for cls in _ENUMS}
+        try:
+            self.classes = [(classes[name], fields) for name, fields in schema["classes"]]
+            self.enums = [[enums[name][member] for member in members] for name, members in schema["enums"]]
+        except (KeyError, TypeError, ValueError) as exc:
+            raise SnapshotError(f"incompatible snapshot schema ({exc})")
+        self.strings: t.List[str] = []
+
+    def decode(self, data: bytes, pos: int) -> t.Tuple[t.Any, int]:
+        tag = data[pos]
+        pos += 1
+        if tag == _STR or tag == _INT or tag == _LIST:
+            value = 0
+            shift = 0
+            while True:
+                byte = data[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            if tag == _STR:
+                return self.strings[value], pos
+            elif tag == _INT:
+                return (value >> 1) ^ -(value & 1), pos
+            items = []
+            for _ in range(value):
+                item, pos = self.decode(data, pos)
+                items.append(item)
+            return items, pos
+        elif tag == _OBJECT:
+            class_id, pos = _read_varint(data, pos)
+            cls, fields = self.classes[class_id]
+            kwargs = {}
+            for name in fields:
+                kwargs[name], pos = self.decode(data, pos)
+            return cls(**kwargs), pos
+        elif tag == _NONE:
+            return None, pos
+        elif tag == _TRUE:
+            return True, pos
+        elif tag == _FALSE:
+            return False, pos
+        elif tag == _ENUM:
+            enum_id, pos = _read_varint(data, pos)
+            index, pos = _read_varint(data, pos)
+            return self.enums[enum_id][index], pos
+        raise SnapshotError(f"invalid value tag {tag}")
+
+
+def _read_varint(data: bytes, pos: int) -> t.Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _read_varint_from(fp: t.BinaryIO) -> t.Optional[int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = fp.read(1)
+        if not byte:
+            if shift:
+                raise SnapshotError("unexpected end of snapshot")
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def _read_exactly(fp: t.BinaryIO, size: int) -> bytes:
+    data = fp.read(size)
+    if len(data) != size:
+        raise SnapshotError("unexpected end of snapshot")
+    return data
+
+
+def _open_decompressed_reader(fp: t.BinaryIO, exit_stack: contextlib.ExitStack) -> t.BinaryIO:
+    if not hasattr(fp, "peek"):
+        # Detach the buffer afterwards, otherwise it closes the caller's file when it is garbage collected.
+        buffered = io.BufferedReader(t.cast(t.Any, fp))
+        exit_stack.callback(buffered.detach)
+        fp = t.cast(t.BinaryIO, buffered)
+    magic = fp.peek(4)[:4]  # type: ignore[attr-defined]
+    if magic.startswith(_GZIP_MAGIC):
+        return t.cast(t.BinaryIO, exit_stack.enter_context(gzip.GzipFile(fileobj=fp, mode="rb")))
+    if magic == _ZSTD_MAGIC:
+        zstandard = _import_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(fp, closefd=False)
+        return t.cast(t.BinaryIO, io.BufferedReader(exit_stack.enter_context(reader)))
+    return fp
+
+
+def iter_snapshot(fp: t.BinaryIO, select: t.Optional[t.Callable[[str], bool]] = None) -> t.Iterator[docspec.Module]:
+    """
+    Reads the modules from a snapshot in the binary file-like object *fp* one by one. If *select* is specified,
+    only the modules for whose name it returns #True are decoded, the others are skipped.
+    """
+
+    with contextlib.ExitStack() as exit_stack:
+        fp = _open_decompressed_reader(fp, exit_stack)
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise SnapshotError("not a snapshot")
+        header_size = _read_varint_from(fp)
+        if header_size is None:
+            raise SnapshotError("unexpected end of snapshot")
+        schema = json.loads(_read_exactly(fp, header_size).decode("utf-8"))
+        if schema.get("version") != VERSION:
+            raise SnapshotError(f"unsupported snapshot version {schema.get('version')}")
+        decoder = _Decoder(schema)
+
+        while True:
+            kind = fp.read(1)
+            if not kind:
+                break
+            size = _read_varint_from(fp)
+            if size is None:
+                raise SnapshotError("unexpected end of snapshot")
+            data = _read_exactly(fp, size)
+            if kind == _FRAME_STRINGS:
+                count, pos = _read_varint(data, 0)
+                for _ in range(count):
+                    length, pos = _read_varint(data, pos)
+                    decoder.strings.append(data[pos : pos + length].decode("utf-8", errors="surrogatepass"))
+                    pos += length
+            elif kind == _FRAME_MODULE:
+                name_index, pos = _read_varint(data, 0)
+                if select is not None and not select(decoder.strings[name_index]):
+                    continue
+                module, _ = decoder.decode(data, pos)
+                module.sync_hierarchy()
+                yield module
+            else:
+                raise SnapshotError(f"invalid frame kind {kind!r}")
+
+
+def dump_snapshot(modules: t.Iterable[docspec.Module], fp: t.BinaryIO, compression: str = "none") -> None:
+    """
+    Writes the *modules* to a snapshot in the binary file-like object *fp*.
+    """
+
+    with SnapshotWriter(fp, compression) as writer:
+        for module in modules:
+            writer.write(module)
+
+
+def load_snapshot(filename: str) -> t.List[docspec.Module]:
+    """
+    Loads all modules from the snapshot file *filename*.
+    """
+
+    with open(filename, "rb") as fp:
+        return list(iter_snapshot(fp))
@@ -0,0 +1,80 @@
+import gc
+import io
+import itertools
+import typing as t
+
+import docspec
+import pytest
+
+from pydoc_markdown.util.snapshot import SnapshotError, dump_snapshot, iter_snapshot
+
+
+def _make_modules() -> t.List[docspec.Module]:
+    loc = docspec.Location("pkg/a.py", 1, 10)
+    docstring = docspec.Docstring(loc, "Ünïcödé docstring.")
+    function = docspec.Function(
+        location=loc,
+        name="foo",
+        docstring=docstring,
+        modifiers=["async"],
+        args=[
+            docspec.Argument(loc, "a", docspec.Argument.Type.POSITIONAL, None, "int", "-12345678901234567890"),
+            docspec.Argument(loc, "kw", docspec.Argument.Type.KEYWORD_REMAINDER, None, None, None),
+        ],
+        return_type="None",
+        decorations=[docspec.Decoration(loc, "deco", None, ["1", "2"])],
+        semantic_hints=[docspec.FunctionSemantic.COROUTINE],
+    )
+    variable = docspec.Variable(
+        docspec.Location("pkg/a.py", -1, None), "x", None, "int", "42", [], [docspec.VariableSemantic.CONSTANT]
+    )
+    cls = docspec.Class(loc, "A", None, [function, variable], None, ["object"], None, [], [])
+    return [
+        docspec.Module(loc, "pkg.a", docstring, [cls, docspec.Indirection(loc, "os", None, "os")]),
+        docspec.Module(docspec.Location("pkg/b.py", 0, None), "pkg.b", None, []),
+    ]
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test__snapshot__roundtrip(compression: str) -> None:
+    modules = _make_modules()
+    fp = io.BytesIO()
+    dump_snapshot(modules, fp, compression)
+    fp.seek(0)
+    loaded = list(iter_snapshot(fp))
+    assert loaded == modules
+    cls = loaded[0].members[0]
+    assert isinstance(cls, docspec.Class)
+    assert cls.members[0].parent is cls
+
+    # The file is not closed when the modules were read, even though io.BytesIO needs to be buffered.
+    gc.collect()
+    assert not fp.closed
+    fp.seek(0)
+    assert [m.name for m in itertools.islice(iter_snapshot(fp), 1)] == ["pkg.a"]
+    gc.collect()
+    assert not fp.closed
+
+
+def test__snapshot__interns_strings() -> None:
+    modules = [docspec.Module(docspec.Location("a.py", 0, None), "a" * 10000, None, [])] * 10
+    fp = io.BytesIO()
+    dump_snapshot(modules, fp)
+    assert 10000 < len(fp.getvalue()) < 12000
+
+
+def test__snapshot__invalid() -> None:
+    with pytest.raises(SnapshotError):
+        list(iter_snapshot(io.BytesIO(b'{"name": "a"}')))
+
+    fp = io.BytesIO()
+    dump_snapshot(_make_modules(), fp)
+    with pytest.raises(SnapshotError):
+        list(iter_snapshot(io.BytesIO(fp.getvalue()[:-1])))
+
+
+def test__iter_snapshot__select() -> None:
+    fp = io.BytesIO()
+    dump_snapshot(_make_modules(), fp)
+    fp.seek(0)
+    assert [m.name for m in iter_snapshot(fp, lambda name: name.endswith(".b"))] == ["pkg.b"]
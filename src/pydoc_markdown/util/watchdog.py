@@ -24,7 +24,8 @@
 import logging
 import os
 import threading
-from typing import List, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from watchdog.events import FileSystemEventHandler  # type: ignore
 from watchdog.observers import Observer  # type: ignore
@@ -61,3 +62,94 @@ def watch_paths(paths: List[str], recursive: bool = False) -> Tuple[BaseObserver
     observer.start()
 
     return observer, event
+
+
+class FileWatcher:
+    """
+    A persistent file watcher with a single observer whose set of watched files can be updated with
+    #set_paths(). Bursts of events are coalesced with a debounce delay such that #wait() returns all files that
+    changed in the burst at once. New Python files and directories that are created in the directories of the
+    watched files are reported as well, such that new modules can be picked up.
+    """
+
+    def __init__(self, debounce: float = 0.2) -> None:
+        self.debounce = debounce
+        self._files: Set[str] = set()
+        self._directories: Set[str] = set()
+        self._changes: Set[str] = set()
+        self._last_event = 0.0
+        self._cond = threading.Condition()
+
+        # The observer calls #_on_event() while it holds its own lock, so the observer must not be called while
+        # holding #_cond. Scheduling is instead serialized with a separate lock that #_on_event() never takes.
+        self._schedule_lock = threading.Lock()
+        self._watches: Dict[str, object] = {}
+        self._handler = _CallbackEventHandler(self._on_event)
+        self._observer = Observer()
+        self._observer.start()
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _is_relevant(self, path: str, is_directory: bool, created: bool) -> bool:
+        if path in self._files:
+            return True
+        return created and (is_directory or path.endswith(".py")) and os.path.dirname(path) in self._directories
+
+    def _on_event(self, event) -> None:
+        created = event.event_type in ("created", "moved")
+        paths = [event.src_path] + ([event.dest_path] if event.event_type == "moved" else [])
+        paths = [os.path.abspath(os.fsdecode(x)) for x in paths]
+        with self._cond:
+            changed = [x for x in paths if self._is_relevant(x, event.is_directory, created)]
+            if not changed:
+                return
+            self._changes.update(changed)
+            self._last_event = time.monotonic()
+            self._cond.notify_all()
+
+    def set_paths(self, paths: Iterable[str]) -> None:
+        """
+        Updates the set of watched files. Only the directories that are not already watched are scheduled with
+        the observer, and directories that contain no more watched files are unscheduled.
+        """
+
+        files = set(os.path.abspath(os.path.normpath(x)) for x in paths)
+        directories = set(os.path.dirname(x) for x in files)
+        with self._schedule_lock:
+            with self._cond:
+                self._files = files
+                self._directories = directories
+            for directory in list(self._watches):
+                if directory not in directories:
+                    self._observer.unschedule(self._watches.pop(directory))
+            for directory in directories:
+                if directory not in self._watches and os.path.isdir(directory):
+                    self._watches[directory] = self._observer.schedule(self._handler, directory, False)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Waits up to *timeout* seconds for a change and returns the set of changed files. After the first change,
+        this waits until no more changes occurred for #debounce seconds. Returns an empty set if no change
+        occurred within the *timeout*.
+        """
+
+        with self._cond:
+            if not self._changes:
+                self._cond.wait(timeout)
+            if not self._changes:
+                return set()
+            while True:
+                remaining = self._last_event + self.debounce - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            changes, self._changes = self._changes, set()
+            return changes
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join()
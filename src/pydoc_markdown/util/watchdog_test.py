@@ -0,0 +1,80 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pydoc_markdown.util.watchdog import FileWatcher
+
+
+def test__FileWatcher__coalesces_changes(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    a.write_text("")
+    b.write_text("")
+    (tmp_path / "other.txt").write_text("")
+
+    with FileWatcher(debounce=0.3) as watcher:
+        watcher.set_paths([str(a), str(b)])
+        time.sleep(0.1)
+        assert watcher.wait(0.1) == set()
+
+        a.write_text("a = 1")
+        time.sleep(0.1)
+        b.write_text("b = 1")
+        (tmp_path / "other.txt").write_text("changed")
+        assert watcher.wait(2) == {str(a), str(b)}
+        assert watcher.wait(0.1) == set()
+
+        # New modules in the watched directories are detected.
+        (tmp_path / "c.py").write_text("")
+        assert str(tmp_path / "c.py") in watcher.wait(2)
+
+
+def test__FileWatcher__set_paths(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    a, b = tmp_path / "a.py", tmp_path / "sub" / "b.py"
+    a.write_text("")
+    b.write_text("")
+
+    with FileWatcher(debounce=0.05) as watcher:
+        watcher.set_paths([str(a)])
+        watcher.set_paths([str(b)])
+        time.sleep(0.1)
+        a.write_text("a = 1")
+        b.write_text("b = 1")
+        assert watcher.wait(2) == {str(b)}
+
+
+def test__FileWatcher__set_paths_while_events_are_dispatched(tmp_path: Path) -> None:
+    directories = [tmp_path / str(i) for i in range(4)]
+    files = [d / "a.py" for d in directories]
+    for d, f in zip(directories, files):
+        d.mkdir()
+        f.write_text("")
+
+    stop = threading.Event()
+
+    def _write() -> None:
+        while not stop.is_set():
+            for f in files:
+                f.write_text(str(time.time()))
+
+    def _update() -> None:
+        for i in range(50):
+            watcher.set_paths(map(str, files[: 1 + i % len(files)]))
+
+    # Not used as a context manager, stopping the observer would block forever after a deadlock.
+    watcher = FileWatcher(debounce=0.01)
+    writer = threading.Thread(target=_write)
+    writer.start()
+    updater = threading.Thread(target=_update, daemon=True)
+    updater.start()
+    updater.join(10)
+    stop.set()
+    writer.join()
+    if updater.is_alive():
+        pytest.fail("set_paths() deadlocked with the observer")
+    try:
+        assert watcher.wait(2)
+    finally:
+        watcher.stop()
@@ -29,7 +29,7 @@ from __future__ import annotations
 
 import json
 import textwrap
-from typing import Any, Dict, Mapping, TextIO, Type, Union
+from typing import Any, Dict, Mapping, Set, TextIO, Type, Union
 
 import yaml
 
@@ -84,6 +84,9 @@ class Attributor:
     def __init__(self, data: Mapping, default: Any = None) -> None:
         self._data = data
         self._default = default
+        #: The names of the attributes that were accessed.
+        self.accessed: Set[str] = set()
 
     def __getattr__(self, name: str) -> Any:
+        self.accessed.add(name)
         return self._data.get(name)
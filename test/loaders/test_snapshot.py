@@ -0,0 +1,60 @@
+import subprocess
+import sys
+import typing as t
+from pathlib import Path
+
+import docspec
+import pytest
+
+from pydoc_markdown.contrib.loaders.snapshot import SnapshotLoader
+from pydoc_markdown.interfaces import Context, LoaderError
+from pydoc_markdown.util.snapshot import dump_snapshot
+
+
+def _make_module(name: str) -> docspec.Module:
+    loc = docspec.Location(name + ".py", 0, None)
+    return docspec.Module(loc, name, docspec.Docstring(loc, f"Module {name}."), [])
+
+
+def _load(directory: Path, **kwargs: t.Any) -> t.Iterator[docspec.Module]:
+    loader = SnapshotLoader(**kwargs)
+    loader.init(Context(directory=str(directory)))
+    return iter(loader.load())
+
+
+def test__SnapshotLoader__loads_dump(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text('def foo():\n    """Does foo."""\n')
+    for dump_format in ("snapshot-gzip", "json"):
+        result = subprocess.run(
+            [sys.executable, "-m", "pydoc_markdown.main", "--no-daemon", "-I", str(tmp_path), "-m", "mod"]
+            + ["--dump", "--dump-format", dump_format],
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        (tmp_path / "mod.dump").write_bytes(result.stdout)
+
+        (module,) = _load(tmp_path, path="mod.dump")
+        assert module.name == "mod"
+        assert module.members[0].docstring == docspec.Docstring(module.members[0].location, "Does foo.")
+
+
+def test__SnapshotLoader__loads_directory_lazily(tmp_path: Path) -> None:
+    (tmp_path / "dumps").mkdir()
+    with open(tmp_path / "dumps" / "1.snapshot", "wb") as fp:
+        dump_snapshot([_make_module("a"), _make_module("b")], fp, "gzip")
+    with open(tmp_path / "dumps" / "2.snapshot", "wb") as fp:
+        dump_snapshot([_make_module("c")], fp)
+    (tmp_path / "dumps" / ".hidden").write_text("ignored")
+
+    assert [m.name for m in _load(tmp_path, path="dumps")] == ["a", "b", "c"]
+    assert [m.name for m in _load(tmp_path, path="dumps", modules=["a", "c*"])] == ["a", "c"]
+
+    # Files are only read when the modules are consumed.
+    (tmp_path / "dumps" / "3.snapshot").write_text("invalid")
+    modules = _load(tmp_path, path="dumps")
+    assert [next(modules).name for _ in range(3)] == ["a", "b", "c"]
+    with pytest.raises(LoaderError):
+        next(modules)
+
+    with pytest.raises(LoaderError):
+        list(_load(tmp_path, path="missing.snapshot"))
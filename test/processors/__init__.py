@@ -4,11 +4,11 @@ from test.utils import assert_text_equals
 import docspec
 
 
-def assert_processor_result(processor, docstring, expected_output):
+def assert_processor_result(processor, docstring, expected_output, resolver=None):
     loc = docspec.Location("<string>", 0)
     module = docspec.Module(
         name="test", location=loc, docstring=docspec.Docstring(loc, textwrap.dedent(docstring)), members=[]
     )
-    processor.process([module], None)
+    processor.process([module], resolver)
     assert module.docstring
     assert_text_equals(module.docstring.content, textwrap.dedent(expected_output))
@@ -1,4 +1,9 @@
+import typing as t
+
+import docspec
+
 from pydoc_markdown.contrib.processors.crossref import CrossrefProcessor
+from pydoc_markdown.interfaces import Resolver
 
 from . import assert_processor_result
 
@@ -13,3 +18,24 @@ def test__CrossrefProcessor__does_not_disrupt_local_markdown_anchor_references()
         Refer to [flowchart](#flowchart), [another](help.md#charts) and check out the `Chart` class.
         """,
     )
+
+
+def test__CrossrefProcessor__resolves_each_unique_reference_once() -> None:
+    calls = []
+
+    class _Resolver(Resolver):
+        def resolve_ref(self, scope: docspec.ApiObject, ref: str) -> t.Optional[str]:
+            calls.append(ref)
+            return "#" + ref if ref != "Unknown" else None
+
+    assert_processor_result(
+        CrossrefProcessor(),
+        """
+        See #Chart, #Chart.draw() and #Chart#s. Also #Unknown.
+        """,
+        """
+        See [`Chart`](#Chart), [`Chart.draw()`](#Chart.draw) and [`Charts`](#Chart). Also `Unknown`.
+        """,
+        _Resolver(),
+    )
+    assert calls == ["Chart", "Chart.draw", "Unknown"]
@@ -0,0 +1,77 @@
+import typing as t
+
+import docspec
+
+from pydoc_markdown.contrib.processors.filter import FilterProcessor, FilterRule
+from pydoc_markdown.interfaces import Context
+
+
+def _make_module() -> docspec.Module:
+    loc = docspec.Location("<string>", 0)
+    doc = docspec.Docstring(loc, "Documented.")
+    return docspec.Module(
+        name="test",
+        location=loc,
+        docstring=None,
+        members=[
+            docspec.Function(loc, "public", doc, None, [], None, None),
+            docspec.Function(loc, "_private", doc, None, [], None, None),
+            docspec.Function(loc, "undocumented", None, None, [], None, None),
+            docspec.Function(loc, "test_something", doc, None, [], None, None),
+            docspec.Function(loc, "exported", None, None, [], None, [docspec.Decoration(loc, "api", None)]),
+            docspec.Variable(loc, "test_data", doc, None, "42"),
+            docspec.Class(loc, "Foo", doc, [], None, [], None),
+        ],
+    )
+
+
+def _process(processor: FilterProcessor) -> t.List[str]:
+    module = _make_module()
+    processor.init(Context("."))
+    processor.process([module], None)
+    return [x.name for x in module.members]
+
+
+def test__FilterProcessor__default() -> None:
+    assert _process(FilterProcessor()) == ["public", "test_something", "test_data", "Foo"]
+
+
+def test__FilterProcessor__expression() -> None:
+    processor = FilterProcessor(expression="name.startswith('test_') and default()")
+    assert _process(processor) == ["test_something", "test_data"]
+
+    # The compiled expression is updated when the expression changes.
+    processor.expression = "not name.startswith('test_') and default()"
+    assert _process(processor) == ["public", "Foo"]
+
+
+def test__FilterProcessor__rules() -> None:
+    processor = FilterProcessor(
+        rules=[
+            FilterRule(names=["test_*"], kinds=["function"], keep=False),
+            FilterRule(name_regexes=["test_.*|Foo"], documented=True, keep=False),
+            FilterRule(decorators=["api"]),
+        ]
+    )
+    assert _process(processor) == ["public", "exported"]
+
+
+def test__FilterProcessor__rules_are_part_of_the_default() -> None:
+    processor = FilterProcessor(
+        expression="name != 'public' and default()",
+        rules=[FilterRule(names=["_private"])],
+    )
+    assert _process(processor) == ["_private", "test_something", "test_data", "Foo"]
+
+
+def test__FilterProcessor__rules__regexes_with_flags_and_groups() -> None:
+    processor = FilterProcessor(
+        rules=[
+            FilterRule(name_regexes=["(?i)foo"], keep=False),
+            FilterRule(name_regexes=["(?P<prefix>test)_(?P=prefix)"], keep=False),
+            FilterRule(name_regexes=["(_)private"], keep=True),
+            FilterRule(name_regexes=["(t)est_something", "(?P<prefix>x)"], keep=False),
+            FilterRule(name_regexes=["(?x) public  # comment"], kinds=["function"]),
+        ]
+    )
+    assert _process(processor) == ["public", "_private", "test_data"]
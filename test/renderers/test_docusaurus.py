@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from pydoc_markdown import PydocMarkdown
@@ -169,3 +170,29 @@ def test_full_processing_custom_top_level_names():
         "label": "My test package",
         "type": "category",
     }
+
+
+def test_render_skips_unchanged_files(tmp_path: Path):
+    config = PydocMarkdown(
+        loaders=[PythonLoader(search_path=[str(DOCUSAURUS_TESTCASES_DIR)], packages=["a_test_package"])],
+        processors=[FilterProcessor(skip_empty_modules=True), CrossrefProcessor(), SmartProcessor()],
+        renderer=DocusaurusRenderer(docs_base_path=str(tmp_path)),
+    )
+    modules = config.load_modules()
+    config.process(modules)
+    config.render(modules)
+
+    files = sorted(tmp_path.rglob("*.md")) + [tmp_path / "reference" / "sidebar.json"]
+    assert len(files) == 4
+    for path in files:
+        os.utime(path, ns=(0, 0))
+
+    config.render(modules)
+    assert [path.stat().st_mtime_ns for path in files] == [0] * len(files)
+
+    # Only the changed module is written again.
+    stuff = next(m for m in modules if m.name == "a_test_package.module.stuff")
+    assert stuff.docstring is not None
+    stuff.docstring.content = "Changed."
+    config.render(modules)
+    assert [path.name for path in files if path.stat().st_mtime_ns != 0] == ["stuff.md"]
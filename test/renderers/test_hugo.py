@@ -1,6 +1,17 @@
+import hashlib
+import http.server
+import io
+import json
+import os
+import tarfile
+import threading
+import typing as t
+from pathlib import Path
+
+import pytest
 from databind.json import load
 
-from pydoc_markdown.contrib.renderers.hugo import HugoPage, HugoRenderer
+from pydoc_markdown.contrib.renderers.hugo import HugoPage, HugoRenderer, _get_hugo_platform, get_hugo_binary
 from pydoc_markdown.util.pages import Page
 
 
@@ -38,3 +49,95 @@ def test_deserialize_hugo_renderer() -> None:
             ),
         ]
     )
+
+
+@pytest.fixture
+def hugo_server() -> t.Iterator[t.Tuple[str, t.Dict[str, bytes], t.List[str]]]:
+    """
+    A local HTTP stand-in for the GitHub API and release downloads. Yields the base URL, the mapping of paths
+    to response bodies and the list of requested paths.
+    """
+
+    files: t.Dict[str, bytes] = {}
+    requested: t.List[str] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requested.append(self.path)
+            if self.path not in files:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(files[self.path])))
+            self.end_headers()
+            self.wfile.write(files[self.path])
+
+        def log_message(self, *args: t.Any) -> None:
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", files, requested
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _add_hugo_release(url: str, files: t.Dict[str, bytes], version: str, checksum: t.Optional[str] = None) -> None:
+    platform, arch = _get_hugo_platform()
+    archive_name = f"hugo_extended_{version}_{platform}-{arch}.tar.gz"
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        content = f"#!/bin/sh\necho hugo v{version}\n".encode()
+        info = tarfile.TarInfo("hugo")
+        info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+    files[f"/download/{archive_name}"] = buffer.getvalue()
+    checksum = checksum or hashlib.sha256(buffer.getvalue()).hexdigest()
+    files[f"/download/hugo_{version}_checksums.txt"] = f"{checksum}  {archive_name}\n".encode()
+    release = {
+        "tag_name": f"v{version}",
+        "assets": [
+            {"name": name, "browser_download_url": f"{url}/download/{name}"}
+            for name in (archive_name, f"hugo_{version}_checksums.txt")
+        ],
+    }
+    files[f"/repos/gohugoio/hugo/releases/tags/v{version}"] = json.dumps(release).encode()
+    files["/repos/gohugoio/hugo/releases/latest"] = json.dumps(release).encode()
+
+
+def test__get_hugo_binary__is_cached(hugo_server: t.Any, tmp_path: Path) -> None:
+    url, files, requested = hugo_server
+    _add_hugo_release(url, files, "0.100.0")
+
+    binary = get_hugo_binary(cache_dir=str(tmp_path), api_url=url)
+    assert Path(binary).read_text() == "#!/bin/sh\necho hugo v0.100.0\n"
+    assert os.access(binary, os.X_OK)
+    assert len(requested) == 3
+
+    # Neither the latest version nor the binary are fetched again.
+    files.clear()
+    assert get_hugo_binary(cache_dir=str(tmp_path), api_url=url) == binary
+    assert get_hugo_binary("v0.100.0", cache_dir=str(tmp_path), api_url=url) == binary
+    assert len(requested) == 3
+
+    # A corrupted binary is downloaded again.
+    _add_hugo_release(url, files, "0.100.0")
+    Path(binary).write_text("corrupted")
+    assert get_hugo_binary("0.100.0", cache_dir=str(tmp_path), api_url=url) == binary
+    assert Path(binary).read_text() == "#!/bin/sh\necho hugo v0.100.0\n"
+
+
+def test__get_hugo_binary__checksum_mismatch(hugo_server: t.Any, tmp_path: Path) -> None:
+    url, files, _requested = hugo_server
+    _add_hugo_release(url, files, "0.100.0", checksum="0" * 64)
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        get_hugo_binary("0.100.0", cache_dir=str(tmp_path), api_url=url)
+
+
+def test__get_hugo_binary__unknown_version(hugo_server: t.Any, tmp_path: Path) -> None:
+    url, _files, _requested = hugo_server
+    with pytest.raises(ValueError, match="no Hugo release for version"):
+        get_hugo_binary("0.1.0", cache_dir=str(tmp_path), api_url=url)
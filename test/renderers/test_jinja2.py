@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import docspec
+import pytest
+
+from pydoc_markdown.contrib.renderers.jinja2 import Args, Jinja2Renderer, ModuleIndex, RenderBlock
+
+
+def _make_modules() -> list:
+    loc = docspec.Location("<string>", 0)
+    return [
+        docspec.Module(loc, "a", None, [docspec.Class(loc, "A", None, [], None, [], None)]),
+        docspec.Module(loc, "b", None, [docspec.Function(loc, "b", None, None, [], None, None)]),
+    ]
+
+
+def test__Jinja2Renderer__render(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("module.jinja").write_text(
+        "# {{ module.name }}\n{% for c in [module] | classes %}- {{ c.name }}\n{% endfor %}"
+    )
+    Path("index.jinja").write_text(
+        "{% for m in modules %}{{ m.name }}\n{% endfor %}"
+        "{% for c in modules | selectattr('name') | classes %}- {{ c.name }}\n{% endfor %}"
+    )
+
+    renderer = Jinja2Renderer(
+        renders=[
+            RenderBlock("module.jinja", {"a": Args(module="a"), "b": Args(module="b")}),
+            RenderBlock("index.jinja", {"index": Args(modules=["*"])}),
+        ],
+        build_directory="build",
+        bytecode_cache_directory=str(tmp_path / "cache"),
+    )
+    renderer.render(_make_modules())
+
+    assert Path("build/a.md").read_text() == "# a\n- A\n"
+    assert Path("build/b.md").read_text() == "# b\n"
+    assert Path("build/index.md").read_text() == "a\nb\n- A\n"
+    assert len(renderer._environments) == 1
+    assert len(os.listdir(tmp_path / "cache")) == 2
+
+
+def test__ModuleIndex() -> None:
+    modules = _make_modules()
+    index = ModuleIndex(modules)
+    assert index.get_module("b") is modules[1]
+    assert index.get_module("c") is None
+    assert index.select_modules(["b", "a"]) == modules
+    assert index.select_modules("[ab]") == modules
+    assert index.select_modules(["b*"]) == [modules[1]]
+    assert [x.name for x in index.classes(modules)] == ["A"]
+    assert [x.name for x in index.functions(modules[1])] == ["b"]
+    assert index.attrs(modules) == []
+    assert index.classes(modules) is index.classes(modules)
+    assert [x.name for x in index.classes(m for m in modules)] == ["A"]
+
+    args = Args(module="a", modules=["*"]).get_render_args(modules, index)
+    assert args == {"module": modules[0], "modules": modules, "module_index": index}
+    with pytest.raises(ValueError):
+        Args(module="c").get_render_args(modules)
+
+
+def test__Jinja2Renderer__render_changed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("module.jinja").write_text("{{ module.name }}")
+    Path("index.jinja").write_text("{{ modules | length }}")
+    renderer = Jinja2Renderer(
+        renders=[
+            RenderBlock("module.jinja", {"a": Args(module="a"), "b": Args(module="b")}),
+            RenderBlock("index.jinja", {"index": Args(modules=["*"])}),
+        ],
+        build_directory="build",
+    )
+    modules = _make_modules()
+    renderer.render(modules)
+    for name in ("a", "b", "index"):
+        Path("build", name + ".md").write_text("stale")
+
+    renderer.render_changed(modules, [modules[1]])
+    assert Path("build/a.md").read_text() == "stale"
+    assert Path("build/b.md").read_text() == "b"
+    assert Path("build/index.md").read_text() == "2"
+    assert renderer.get_output_files() == [os.path.join("build", x + ".md") for x in ("a", "b", "index")]
+
+    assert Args().may_include({"a"})
+    assert Args(modules="[ab]").may_include({"b"})
+    assert not Args(module="a", modules=["c*"]).may_include({"b"})
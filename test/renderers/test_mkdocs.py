@@ -1,3 +1,5 @@
+import typing as t
+
 from databind.json import load
 
 from pydoc_markdown.contrib.renderers.mkdocs import MkdocsRenderer
@@ -38,3 +40,27 @@ def test_deserialize_mkdocs_renderer() -> None:
             ),
         ]
     )
+
+
+class _FakeProcess:
+    def __init__(self, returncode: t.Optional[int] = None) -> None:
+        self.returncode = returncode
+        self.terminated = False
+
+    def poll(self) -> t.Optional[int]:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+def test__MkdocsRenderer__reload_server__keeps_running_process() -> None:
+    process: t.Any = _FakeProcess()
+    assert MkdocsRenderer().reload_server(process) is process
+    assert not process.terminated
+
+    exited: t.Any = _FakeProcess(1)
+    assert MkdocsRenderer().reload_server(exited) is None
+
+    assert MkdocsRenderer(server_restart=True).reload_server(process) is None
+    assert process.terminated
@@ -0,0 +1,202 @@
+import os
+import subprocess
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from pydoc_markdown import daemon
+from pydoc_markdown.contrib.loaders.python import PythonLoader
+from pydoc_markdown.interfaces import Context
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="requires Unix sockets")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> t.Iterator[t.Tuple[Path, t.Dict[str, str]]]:
+    runtime_dir = tmp_path / "run"
+    runtime_dir.mkdir(mode=0o700)
+    directory = tmp_path / "project"
+    directory.mkdir()
+    (directory / "mod.py").write_text('def foo():\n    """Does foo."""\n')
+    env = {**os.environ, "XDG_RUNTIME_DIR": str(runtime_dir)}
+    yield directory, env
+    subprocess.run([sys.executable, "-m", "pydoc_markdown.main", "daemon", "--stop"], cwd=directory, env=env)
+
+
+def _pydoc_markdown(directory: Path, env: t.Dict[str, str], *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "pydoc_markdown.main", *args],
+        cwd=directory,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def _is_listening(path: Path) -> bool:
+    sock = daemon._connect(str(path))
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+
+def _start_daemon(directory: Path, env: t.Dict[str, str]) -> subprocess.Popen:
+    process = subprocess.Popen([sys.executable, "-m", "pydoc_markdown.main", "daemon"], cwd=directory, env=env)
+    socket_path = Path(env["XDG_RUNTIME_DIR"]) / f"pydoc-markdown-{os.getuid()}"
+    deadline = time.time() + 10
+    # Wait until the daemon accepts connections, the socket file may be left over from a killed daemon.
+    while not any(_is_listening(x) for x in socket_path.glob("*.sock")):
+        assert process.poll() is None, "daemon exited"
+        assert time.time() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    return process
+
+
+def test__forward__without_daemon_runs_in_process(project: t.Tuple[Path, t.Dict[str, str]]) -> None:
+    directory, env = project
+    result = _pydoc_markdown(directory, env, "-vv", "-m", "mod")
+    assert result.returncode == 0
+    assert "Does foo." in result.stdout
+    assert "handled by the pydoc-markdown daemon" not in result.stderr
+
+
+def test__forward__daemon_handles_invocations(project: t.Tuple[Path, t.Dict[str, str]]) -> None:
+    directory, env = project
+    process = _start_daemon(directory, env)
+
+    result = _pydoc_markdown(directory, env, "-vv", "-m", "mod")
+    assert result.returncode == 0, result.stderr
+    assert "Does foo." in result.stdout
+    assert "handled by the pydoc-markdown daemon" in result.stderr
+
+    # Changes to the source files are picked up by the warm daemon.
+    (directory / "mod.py").write_text('def foo():\n    """Does foo, but better."""\n')
+    result = _pydoc_markdown(directory, env, "-m", "mod")
+    assert "Does foo, but better." in result.stdout
+
+    # Errors are reported to the client.
+    result = _pydoc_markdown(directory, env, "-m", "does_not_exist")
+    assert result.returncode == 1
+    assert "does_not_exist" in result.stderr
+
+    # --no-daemon runs in-process.
+    result = _pydoc_markdown(directory, env, "-vv", "--no-daemon", "-m", "mod")
+    assert result.returncode == 0
+    assert "handled by the pydoc-markdown daemon" not in result.stderr
+
+    result = _pydoc_markdown(directory, env, "daemon", "--stop")
+    assert result.returncode == 0
+    assert process.wait(10) == 0
+    assert not list((Path(env["XDG_RUNTIME_DIR"]) / f"pydoc-markdown-{os.getuid()}").glob("*.sock"))
+
+
+def test__forward__stale_socket_runs_in_process(project: t.Tuple[Path, t.Dict[str, str]]) -> None:
+    directory, env = project
+    process = _start_daemon(directory, env)
+    process.kill()
+    process.wait()
+
+    result = _pydoc_markdown(directory, env, "-m", "mod")
+    assert result.returncode == 0
+    assert "Does foo." in result.stdout
+
+    # A new daemon replaces the stale socket.
+    _start_daemon(directory, env)
+    result = _pydoc_markdown(directory, env, "-vv", "-m", "mod")
+    assert "handled by the pydoc-markdown daemon" in result.stderr
+
+
+def test__PythonLoader__reuses_parsed_modules(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text('def foo():\n    """Does foo."""\n')
+    loader = PythonLoader(modules=["mod"], search_path=[str(tmp_path)])
+    loader.init(Context(directory=str(tmp_path)))
+    loader.keep_parsed_modules()
+
+    first = list(loader.load())
+    first[0].members[0].docstring = None
+    second = list(loader.load())
+    assert second[0] is not first[0]
+    assert second[0].members[0].docstring is not None
+    assert second[0].members[0].parent is second[0]
+
+    (tmp_path / "mod.py").write_text("def bar():\n    pass\n")
+    assert [m.name for m in list(loader.load())[0].members] == ["bar"]
+
+
+def test__PythonLoader__does_not_keep_parsed_modules_by_default(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text('def foo():\n    """Does foo."""\n')
+    loader = PythonLoader(modules=["mod"], search_path=[str(tmp_path)])
+    loader.init(Context(directory=str(tmp_path)))
+
+    list(loader.load())
+    assert loader._parse_cache is None
+
+
+def test__PythonLoader__use_parsed_modules_only_for_the_request(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text('def foo():\n    """Does foo."""\n')
+    loader = PythonLoader(modules=["mod"], search_path=[str(tmp_path)])
+    loader.init(Context(directory=str(tmp_path)))
+    loader.keep_parsed_modules()
+    (previous,) = loader.load()
+    previous.members[0].name = "previous"
+
+    with loader.use_parsed_modules([previous]):
+        (module,) = loader.load()
+        assert module is previous
+    (module,) = loader.load()
+    assert [m.name for m in module.members] == ["foo"]
+
+
+def test__ConfigCache__only_keys_on_referenced_environment_variables(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pydoc_markdown.main import RenderSession
+
+    (tmp_path / "pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: #@ env.OUTPUT_FILE\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OUTPUT_FILE", "a.md")
+    monkeypatch.setenv("UNRELATED", "1")
+    session = RenderSession(str(tmp_path / "pydoc-markdown.yml"))
+    cache = daemon.ConfigCache()
+
+    config = cache.load(session)
+    assert config.env_vars == {"OUTPUT_FILE"}
+    assert all(loader._parse_cache is not None for loader in config.loaders)  # type: ignore[attr-defined]
+
+    monkeypatch.setenv("UNRELATED", "2")
+    assert cache.load(session) is config
+
+    monkeypatch.setenv("OUTPUT_FILE", "b.md")
+    config = cache.load(session)
+    assert config.renderer.filename == "b.md"  # type: ignore[attr-defined]
+
+
+def test__ConfigCache__reloads_source_linkers_when_git_head_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pydoc_markdown.main import RenderSession
+
+    def _git(*args: str) -> None:
+        subprocess.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args])
+
+    (tmp_path / "pydoc-markdown.yml").write_text(
+        "renderer:\n  type: markdown\n  filename: api.md\n  source_linker: {type: github, repo: a/b}\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    _git("init", "-q")
+    _git("commit", "-q", "--allow-empty", "-m", "initial")
+    session = RenderSession(str(tmp_path / "pydoc-markdown.yml"))
+    cache = daemon.ConfigCache()
+
+    config = cache.load(session)
+    assert cache.load(session) is config
+
+    _git("commit", "-q", "--allow-empty", "-m", "second")
+    new_config = cache.load(session)
+    assert new_config is not config
+    assert new_config.renderer.source_linker._sha != config.renderer.source_linker._sha  # type: ignore[attr-defined]
@@ -0,0 +1,71 @@
+"""
+Guards the startup time of the `pydoc-markdown` command. The modules below are only needed by specific loaders,
+processors and renderers (or by `--server`) and must not be imported when the CLI starts.
+"""
+
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+#: Third-party modules that are expensive to import and must only be imported by the features that need them.
+HEAVY_MODULES = [
+    "black",
+    "docspec_python",
+    "docstring_parser",
+    "jinja2",
+    "requests",
+    "watchdog",
+    "yaml",
+    "yapf",
+]
+
+
+class ImportTime(t.NamedTuple):
+    self_us: int
+    cumulative_us: int
+
+
+def get_import_times(statement: str) -> t.Dict[str, ImportTime]:
+    """
+    Runs *statement* in a new Python interpreter with `-X importtime` and returns the import time of every module
+    that was imported, in microseconds.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # The header line.
+        times[name.strip()] = ImportTime(int(self_us), int(cumulative_us))
+    return times
+
+
+def _format_slowest(times: t.Dict[str, ImportTime], n: int = 15) -> str:
+    slowest = sorted(times.items(), key=lambda x: x[1].cumulative_us, reverse=True)[:n]
+    return "\n".join(f"  {x.cumulative_us / 1000:8.1f}ms  {name}" for name, x in slowest)
+
+
+@pytest.mark.parametrize("module", ["pydoc_markdown", "pydoc_markdown.main"])
+def test__import__does_not_import_heavy_modules(module: str) -> None:
+    times = get_import_times(f"import {module}")
+    assert module in times
+    imported = sorted(name for name in times if any(name == x or name.startswith(x + ".") for x in HEAVY_MODULES))
+    assert not imported, f"importing {module} imported {imported}, slowest imports:\n{_format_slowest(times)}"
+
+
+def test__default_config__imports_plugins_lazily() -> None:
+    times = get_import_times("import pydoc_markdown; pydoc_markdown.PydocMarkdown()")
+    assert "pydoc_markdown.contrib.loaders.python" in times
+    assert "pydoc_markdown.contrib.renderers.markdown" in times
+    assert "yapf" not in times
@@ -0,0 +1,147 @@
+"""
+Test incremental builds with `--changed-since` and `--previous-build`.
+"""
+
+import shutil
+import subprocess
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from pydoc_markdown.contrib.loaders import python
+from pydoc_markdown.main import RenderSession
+from pydoc_markdown.util.git import get_changed_files
+
+CONFIG = """
+loaders:
+  - type: python
+    packages: [pkg]
+renderer:
+  type: docusaurus
+"""
+
+
+def _git(*args: str) -> None:
+    subprocess.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args])
+
+
+@pytest.fixture
+def repository(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text(CONFIG)
+    Path(".gitignore").write_text("build/\ndocs/\n")
+    Path("pkg").mkdir()
+    Path("pkg/__init__.py").write_text("")
+    Path("pkg/a.py").write_text('def a():\n    """Does a."""\n')
+    Path("pkg/b.py").write_text('def b():\n    """Does b."""\n')
+    _git("init", "-q")
+    _git("add", ".")
+    _git("commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+@pytest.fixture
+def parsed_files(monkeypatch) -> t.List[str]:
+    result = []
+    parse_python_module = python.docspec_python.parse_python_module
+
+    def _parse_python_module(filename, *args, **kwargs):
+        if isinstance(filename, str):  # It calls itself with the opened file.
+            result.append(Path(filename).name)
+        return parse_python_module(filename, *args, **kwargs)
+
+    monkeypatch.setattr(python.docspec_python, "parse_python_module", _parse_python_module)
+    return result
+
+
+def test__get_changed_files(repository: Path) -> None:
+    sha, changed = get_changed_files(str(repository), "HEAD")
+    assert len(sha) == 40
+    assert changed == set()
+
+    Path("pkg/a.py").write_text("")
+    Path("pkg/c.py").write_text("")
+    Path("pkg/b.py").unlink()
+    Path("docs").mkdir()
+    Path("docs/ignored.md").write_text("")
+    _, changed = get_changed_files(str(repository / "pkg"), "HEAD")
+    assert changed == {str((repository / "pkg" / x).resolve()) for x in ("a.py", "b.py", "c.py")}
+
+
+def test__RenderSession__changed_since__only_renders_changed_modules(
+    repository: Path, parsed_files: t.List[str]
+) -> None:
+    session = RenderSession("pydoc-markdown.yml", save_build="build")
+    session.render(session.load())
+    assert sorted(parsed_files) == ["__init__.py", "a.py", "b.py"]
+    assert Path("build/build.json").exists()
+
+    # A fresh checkout in CI, with changes since the commit that the previous build was made from.
+    shutil.rmtree("docs")
+    Path("pkg/b.py").write_text('def b():\n    """Does b, but better."""\n')
+    Path("pkg/c.py").write_text('def c():\n    """Does c."""\n')
+    parsed_files.clear()
+
+    session = RenderSession("pydoc-markdown.yml", changed_since="HEAD", previous_build="build", save_build="build")
+    config = session.load()
+    rendered: t.List[str] = []
+    render_module = config.renderer._render_module  # type: ignore[attr-defined]
+    config.renderer._render_module = lambda m: rendered.append(m.name) or render_module(m)  # type: ignore
+    session.render(config)
+
+    assert sorted(parsed_files) == ["b.py", "c.py"]
+    assert sorted(rendered) == ["pkg.b", "pkg.c"]
+    assert "Does a." in Path("docs/reference/pkg/a.md").read_text()
+    assert "Does b, but better." in Path("docs/reference/pkg/b.md").read_text()
+    assert "Does c." in Path("docs/reference/pkg/c.md").read_text()
+    assert "pkg/c" in Path("docs/reference/sidebar.json").read_text()
+
+    # Removed modules are removed from the outputs.
+    _git("add", ".")
+    _git("commit", "-q", "-m", "add c")
+    Path("pkg/a.py").unlink()
+    session = RenderSession("pydoc-markdown.yml", changed_since="HEAD~1", previous_build="build", save_build="build")
+    session.render(session.load())
+    assert not Path("docs/reference/pkg/a.md").exists()
+    assert "pkg/a" not in Path("docs/reference/sidebar.json").read_text()
+
+    # The build was saved from HEAD, so the changes since HEAD~1 cannot be applied to it.
+    parsed_files.clear()
+    session.render(session.load())
+    assert sorted(parsed_files) == ["__init__.py", "b.py", "c.py"]
+
+
+def test__RenderSession__changed_since__renders_everything_if_config_changed(
+    repository: Path, parsed_files: t.List[str]
+) -> None:
+    session = RenderSession("pydoc-markdown.yml", save_build="build")
+    session.render(session.load())
+    parsed_files.clear()
+
+    Path("pydoc-markdown.yml").write_text(CONFIG + "  relative_output_path: api\n")
+    session = RenderSession("pydoc-markdown.yml", changed_since="HEAD", previous_build="build")
+    session.render(session.load())
+    assert sorted(parsed_files) == ["__init__.py", "a.py", "b.py"]
+    assert Path("docs/api/pkg/a.md").exists()
+
+
+def test__RenderSession__changed_since__rerenders_pages_of_removed_objects(repository: Path) -> None:
+    Path("pydoc-markdown.yml").write_text(
+        CONFIG.replace("type: docusaurus", "type: mkdocs")
+        + "  pages:\n"
+        + "  - {title: Foo, name: foo, contents: [pkg.a.foo]}\n"
+        + "  - {title: Bar, name: bar, contents: [pkg.a.bar]}\n"
+    )
+    Path("pkg/a.py").write_text('def foo():\n    """Does foo."""\n\ndef bar():\n    """Does bar."""\n')
+    _git("add", ".")
+    _git("commit", "-q", "-m", "pages")
+    session = RenderSession("pydoc-markdown.yml", save_build="build/previous")
+    session.render(session.load())
+    assert "Does foo." in Path("build/docs/content/foo.md").read_text()
+
+    Path("pkg/a.py").write_text('def bar():\n    """Does bar."""\n')
+    session = RenderSession("pydoc-markdown.yml", changed_since="HEAD", previous_build="build/previous")
+    session.render(session.load())
+    assert "foo" not in Path("build/docs/content/foo.md").read_text()
+    assert "Does bar." in Path("build/docs/content/bar.md").read_text()
@@ -0,0 +1,104 @@
+"""
+Test the #PydocTagPreprocessor that implements the `@pydoc` tag for Novella.
+"""
+
+import logging
+import subprocess
+import typing as t
+from pathlib import Path
+
+import pytest
+from novella.markdown.preprocessor import MarkdownFile, MarkdownFiles
+
+from pydoc_markdown.contrib.loaders.python import PythonLoader
+from pydoc_markdown.contrib.source_linkers.git import GithubSourceLinker
+from pydoc_markdown.novella.preprocessor import PydocTagPreprocessor
+
+
+class _Action:
+    _processors = None
+
+    def repeat(self, path: Path, output_path: Path, content: str) -> str:
+        return content
+
+
+def _git(*args: str) -> None:
+    subprocess.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args])
+
+
+@pytest.fixture
+def preprocessor(tmp_path: Path, monkeypatch) -> PydocTagPreprocessor:
+    monkeypatch.chdir(tmp_path)
+    Path("pkg.py").write_text('def foo():\n    """Does foo."""\n\n\ndef bar():\n    """Does bar."""\n')
+    preprocessor = PydocTagPreprocessor(t.cast(t.Any, _Action()), "pydoc")
+    preprocessor.loader(PythonLoader(search_path=["."], modules=["pkg"]), None)
+    return preprocessor
+
+
+@pytest.fixture
+def rendered(preprocessor: PydocTagPreprocessor, monkeypatch) -> t.List[str]:
+    result: t.List[str] = []
+    renderer = preprocessor.renderer()
+    render_object = renderer.render_object
+    monkeypatch.setattr(
+        renderer, "render_object", lambda fp, obj, o: result.append(obj.name) or render_object(fp, obj, o)
+    )
+    return result
+
+
+def _process(preprocessor: PydocTagPreprocessor, *contents: str) -> t.List[str]:
+    files = [MarkdownFile(Path(f"{i}.md"), Path(f"build/{i}.md"), content) for i, content in enumerate(contents)]
+    preprocessor.process_files(MarkdownFiles(files, t.cast(t.Any, None), t.cast(t.Any, None)))
+    return [file.content for file in files]
+
+
+def test__PydocTagPreprocessor__reuses_rendered_fragments(
+    preprocessor: PydocTagPreprocessor, rendered: t.List[str]
+) -> None:
+    contents = _process(preprocessor, "@pydoc pkg.foo\n", "@pydoc pkg.foo\n")
+    assert rendered == ["foo"]
+    assert "Does foo." in contents[0]
+    assert contents[0] == contents[1]
+
+    assert _process(preprocessor, "@pydoc pkg.foo\n") == contents[:1]
+    assert rendered == ["foo"]
+
+
+def test__PydocTagPreprocessor__fragments_are_invalidated(
+    preprocessor: PydocTagPreprocessor, rendered: t.List[str]
+) -> None:
+    _git("init", "-q")
+    _git("add", ".")
+    _git("commit", "-q", "-m", "initial")
+    renderer = preprocessor.renderer()
+    renderer.source_linker = GithubSourceLinker(repo="user/repo")
+    _process(preprocessor, "@pydoc pkg.foo\n")
+    assert rendered == ["foo"]
+
+    # A new commit changes the source links.
+    _git("commit", "-q", "--allow-empty", "-m", "empty")
+    _process(preprocessor, "@pydoc pkg.foo\n")
+    assert rendered == ["foo", "foo"]
+
+    # So does the renderer configuration.
+    renderer.descriptive_class_title = False
+    _process(preprocessor, "@pydoc pkg.foo\n")
+    assert rendered == ["foo", "foo", "foo"]
+
+    # And the object itself.
+    Path("pkg.py").write_text('def foo():\n    """Does foo, but better."""\n')
+    contents = _process(preprocessor, "@pydoc pkg.foo\n")
+    assert rendered == ["foo", "foo", "foo", "foo"]
+    assert "Does foo, but better." in contents[0]
+
+
+def test__PydocTagPreprocessor__renders_fragments_once_and_logs_in_file_order(
+    preprocessor: PydocTagPreprocessor, rendered: t.List[str], caplog
+) -> None:
+    contents = [f"@pydoc pkg.{name}\n" for name in ("foo", "missing_1", "bar", "missing_2", "foo", "missing_3")]
+
+    with caplog.at_level(logging.WARNING):
+        result = _process(preprocessor, *contents)
+    assert rendered == ["foo", "bar"]
+    assert [r.args for r in caplog.records] == [("pkg.missing_1",), ("pkg.missing_2",), ("pkg.missing_3",)]
+    assert result[0] == result[4]
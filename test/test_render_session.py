@@ -0,0 +1,345 @@
+"""
+Test the #RenderSession that is used by the Pydoc-Markdown CLI.
+"""
+
+import subprocess
+import typing as t
+from pathlib import Path
+
+import docspec
+
+from pydoc_markdown import PydocMarkdown
+from pydoc_markdown.contrib.loaders.snapshot import SnapshotLoader
+from pydoc_markdown.contrib.renderers.markdown import MarkdownReferenceResolver, MarkdownRenderer
+from pydoc_markdown.interfaces import Builder
+from pydoc_markdown.main import RenderSession
+
+
+def test__RenderSession__reload__keeps_plugins_unless_config_changed(tmp_path: Path) -> None:
+    config_file = tmp_path / "pydoc-markdown.yml"
+    config_file.write_text("renderer:\n  type: markdown\n  filename: api.md\n")
+    (tmp_path / "module.py").write_text("def foo(): pass\n")
+
+    session = RenderSession(str(config_file))
+    config = session.load()
+    config.resolver = MarkdownReferenceResolver()
+
+    reused = session.reload(config, {str(tmp_path / "module.py")})
+    assert reused is config
+    assert reused.resolver is None
+
+    reloaded = session.reload(config, {str(config_file)})
+    assert reloaded is not config
+    assert reloaded == config
+
+
+def test__RenderSession__manifest__skips_render_if_nothing_changed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: api.md\n")
+    Path("module.py").write_text("def foo(): pass\n")
+
+    session = RenderSession("pydoc-markdown.yml", manifest=".manifest.json")
+    assert not session.is_up_to_date()
+    session.render(session.load())
+    assert Path(".manifest.json").exists()
+    assert session.is_up_to_date()
+
+    # Changes to the outputs, inputs, the configuration or the overrides invalidate the manifest.
+    Path("api.md").write_text("changed")
+    assert not session.is_up_to_date()
+    session.render(session.load())
+    assert session.is_up_to_date()
+
+    Path("module.py").write_text("def bar(): pass\n")
+    assert not session.is_up_to_date()
+    session.render(session.load())
+
+    Path("other.py").write_text("def baz(): pass\n")
+    assert not session.is_up_to_date()
+    session.render(session.load())
+    assert session.is_up_to_date()
+
+    assert not RenderSession("pydoc-markdown.yml", render_toc=True, manifest=".manifest.json").is_up_to_date()
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: api.md\n  render_toc: true\n")
+    assert not session.is_up_to_date()
+
+
+def test__RenderSession__manifest__records_referenced_environment_variables(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: #@ env.OUTPUT_FILE\n")
+    Path("module.py").write_text("def foo(): pass\n")
+    monkeypatch.setenv("OUTPUT_FILE", "a.md")
+    monkeypatch.setenv("UNRELATED", "1")
+
+    session = RenderSession("pydoc-markdown.yml", manifest=".manifest.json")
+    session.render(session.load())
+    assert session.is_up_to_date()
+
+    monkeypatch.setenv("UNRELATED", "2")
+    assert session.is_up_to_date()
+
+    monkeypatch.setenv("OUTPUT_FILE", "b.md")
+    assert not session.is_up_to_date()
+    monkeypatch.delenv("OUTPUT_FILE")
+    assert not session.is_up_to_date()
+
+
+def test__RenderSession__manifest__records_renderer_inputs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text(
+        "renderer:\n  type: jinja2\n  bytecode_cache_directory: ''\n"
+        "  renders:\n  - template: api.j2\n    produces: {api: {}}\n"
+    )
+    Path("api.j2").write_text('{% include "part.j2" %}\n')
+    Path("part.j2").write_text("Part\n")
+    Path("module.py").write_text("def foo(): pass\n")
+
+    session = RenderSession("pydoc-markdown.yml", manifest=".manifest.json")
+    config = session.load()
+    watch_files = session.render(config)
+    assert {str(tmp_path / "api.j2"), str(tmp_path / "part.j2")} <= set(watch_files)
+    assert session.is_up_to_date()
+
+    Path("part.j2").write_text("Changed\n")
+    assert not session.is_up_to_date()
+
+    # With --server, a changed template renders everything again.
+    session.render(config, {str(tmp_path / "part.j2")})
+    assert Path("build/docs/api.md").read_text().strip() == "Changed"
+
+
+def test__RenderSession__manifest__records_git_head_for_source_links(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "test@example.org")
+    Path("pydoc-markdown.yml").write_text(
+        "renderer:\n  type: markdown\n  filename: api.md\n  source_linker: {type: github, repo: a/b}\n"
+    )
+    Path("module.py").write_text('def foo():\n    """Foo."""\n')
+    subprocess.check_call(["git", "init", "-q"])
+    subprocess.check_call(["git", "add", "."])
+    subprocess.check_call(["git", "commit", "-q", "-m", "Initial commit"])
+
+    session = RenderSession("pydoc-markdown.yml", manifest=".manifest.json")
+    session.render(session.load())
+    assert session.is_up_to_date()
+
+    # The source links point to the new commit.
+    subprocess.check_call(["git", "commit", "-q", "--allow-empty", "-m", "Second commit"])
+    assert not session.is_up_to_date()
+
+
+def test__RenderSession__manifest__not_written_for_unknown_outputs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("module.py").write_text("def foo(): pass\n")
+    Path(".manifest.json").write_text("{}")
+
+    session = RenderSession({"renderer": {"type": "markdown"}}, manifest=".manifest.json")
+    session.render(session.load())
+    assert not Path(".manifest.json").exists()
+    assert not session.is_up_to_date()
+
+
+def test__RenderSession__checkpoint__skips_load_and_process_if_unchanged(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: api.md\n")
+    Path("module.py").write_text('def foo():\n    """Does foo."""\n')
+    loads = []
+    load_modules = PydocMarkdown.load_modules
+    monkeypatch.setattr(PydocMarkdown, "load_modules", lambda self: loads.append(1) or load_modules(self))
+
+    session = RenderSession("pydoc-markdown.yml", checkpoint=".checkpoint")
+    session.render(session.load())
+    assert len(loads) == 1
+    assert Path(".checkpoint/modules.pickle").exists()
+
+    # Changes to the renderer configuration are rendered from the checkpoint.
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: markdown\n  filename: api.md\n  render_toc: true\n")
+    session.render(session.load())
+    assert len(loads) == 1
+    assert "Table of Contents" in Path("api.md").read_text()
+    assert "Does foo." in Path("api.md").read_text()
+
+    # Changes to the processors or the input files invalidate the checkpoint.
+    Path("module.py").write_text('def foo():\n    """Does foo, but better."""\n')
+    session.render(session.load())
+    assert len(loads) == 2
+    assert "Does foo, but better." in Path("api.md").read_text()
+
+    config = session.load()
+    config.processors = config.processors[:1]
+    session.render(config)
+    assert len(loads) == 3
+    session.render(session.load())
+    assert len(loads) == 4
+
+
+def test__RenderSession__checkpoint__invalidated_by_resolver_renderers_and_added_modules(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config = "renderers:\n  a: {type: markdown, filename: a.md}\n  b: {type: markdown, filename: b.md}\n"
+    Path("pydoc-markdown.yml").write_text(config)
+    Path("src/pkg").mkdir(parents=True)
+    Path("src/pkg/__init__.py").write_text('def foo():\n    """Does foo."""\n')
+    loads = []
+    load_modules = PydocMarkdown.load_modules
+    monkeypatch.setattr(PydocMarkdown, "load_modules", lambda self: loads.append(1) or load_modules(self))
+
+    session = RenderSession("pydoc-markdown.yml", checkpoint=".checkpoint")
+    session.render(session.load())
+    session.render(session.load())
+    assert len(loads) == 1
+
+    # The processors use the resolver of the first renderer.
+    Path("pydoc-markdown.yml").write_text(config.replace("a:", "c:").replace("b:", "a:").replace("c:", "b:"))
+    session.render(session.load())
+    assert len(loads) == 2
+
+    pydocmd = session.load()
+    for renderer in pydocmd.renderers.values():
+        renderer._resolver = MarkdownReferenceResolver(global_=True)  # type: ignore[attr-defined]
+    session.render(pydocmd)
+    assert len(loads) == 3
+
+    # Modules added to the search path are detected, even though no module was loaded from there before.
+    session.render(session.load())
+    assert len(loads) == 4
+    Path("src/other.py").write_text('def bar():\n    """Does bar."""\n')
+    session.render(session.load())
+    assert len(loads) == 5
+    assert "Does bar." in Path("a.md").read_text()
+
+
+def test__RenderSession__manifest__not_written_for_snapshot_modules(tmp_path: Path, monkeypatch) -> None:
+    from pydoc_markdown.util.snapshot import dump_snapshot
+
+    monkeypatch.chdir(tmp_path)
+    Path("module.py").write_text('def foo():\n    """Does foo."""\n')
+    config = RenderSession({"renderer": {"type": "markdown"}}).load()
+    with open("modules.snapshot", "wb") as fp:
+        dump_snapshot(config.load_modules(), fp)
+    Path("module.py").unlink()
+
+    session = RenderSession(None, manifest=".manifest.json")
+    config = PydocMarkdown(loaders=[SnapshotLoader(path="modules.snapshot")])
+    config.renderer = MarkdownRenderer(filename="api.md")
+    session.render(config)
+    assert "Does foo." in Path("api.md").read_text()
+    assert not Path(".manifest.json").exists()
+
+
+def test__RenderSession__renderers__load_and_process_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text(
+        "renderers:\n"
+        "  markdown:\n    type: markdown\n    filename: api.md\n"
+        "  docusaurus:\n    type: docusaurus\n"
+        "max_render_workers: 2\n"
+    )
+    Path("module.py").write_text('def foo():\n    """Does foo."""\n')
+    calls = []
+    load_modules = PydocMarkdown.load_modules
+    process = PydocMarkdown.process
+    monkeypatch.setattr(PydocMarkdown, "load_modules", lambda self: calls.append("load") or load_modules(self))
+    monkeypatch.setattr(PydocMarkdown, "process", lambda self, m: calls.append("process") or process(self, m))
+
+    session = RenderSession("pydoc-markdown.yml", render_toc=True, manifest=".manifest.json")
+    session.render(session.load())
+    assert calls == ["load", "process"]
+    assert "Table of Contents" in Path("api.md").read_text()
+    assert "Does foo." in Path("api.md").read_text()
+    assert "Does foo." in Path("docs/reference/module.md").read_text()
+    assert session.is_up_to_date()
+
+    # Only the selected targets are rendered.
+    Path("api.md").unlink()
+    session = RenderSession("pydoc-markdown.yml", targets=["markdown"])
+    config = session.load()
+    assert list(config.renderers) == ["markdown"]
+    session.render(config)
+    assert Path("api.md").exists()
+
+
+def test__PydocMarkdown__build__uses_subdirectories_for_multiple_builders(tmp_path: Path) -> None:
+    built: t.List[t.Tuple[str, str]] = []
+
+    class _Builder(MarkdownRenderer, Builder):
+        def build(self, site_dir: str) -> None:
+            built.append((self.filename, site_dir))
+
+    config = PydocMarkdown(renderers={"a": _Builder(filename="a.md"), "b": _Builder(filename="b.md")})
+    config.build(str(tmp_path / "site"))
+    assert built == [("a.md", str(tmp_path / "site" / "a")), ("b.md", str(tmp_path / "site" / "b"))]
+
+    built.clear()
+    config = PydocMarkdown(renderers={"a": _Builder(filename="a.md"), "b": MarkdownRenderer()})
+    config.build(str(tmp_path / "site"))
+    assert built == [("a.md", str(tmp_path / "site"))]
+
+
+def test__RenderSession__renderers__process_copy_for_other_resolvers(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text(
+        "renderers:\n  markdown: {type: markdown, filename: api.md}\n  docusaurus: {type: docusaurus}\n"
+    )
+    Path("module.py").write_text('def foo():\n    """See #bar."""\n\ndef bar():\n    """Does bar."""\n')
+
+    session = RenderSession("pydoc-markdown.yml", checkpoint=".checkpoint")
+    config = session.load()
+    modules = config.load_modules()
+    assert [names for _, names in config.get_resolver_groups(modules)] == [["markdown"], ["docusaurus"]]
+    processed: t.List[str] = []
+
+    def _wrap(processor: t.Any) -> None:
+        process = processor.process
+        processor.process = lambda *a: processed.append(type(processor).__name__) or process(*a)
+
+    for processor in config.processors:
+        _wrap(processor)
+    session.render(config)
+
+    # Only the processors that depend on the resolver run for each of them.
+    assert processed == ["FilterProcessor", "SmartProcessor", "CrossrefProcessor", "CrossrefProcessor"]
+
+    # Each renderer renders the references as they would be rendered by it alone.
+    assert "See [`bar`](#module.bar)." in Path("api.md").read_text()
+    assert "See `bar`." in Path("docs/reference/module.md").read_text()
+    assert not Path(".checkpoint/modules.pickle").exists()
+
+
+def test__RenderSession__render__only_renders_changed_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("pydoc-markdown.yml").write_text("renderer:\n  type: docusaurus\n")
+    Path("a.py").write_text('def a():\n    """Does a."""\n')
+    Path("b.py").write_text('def b():\n    """Does b."""\n')
+
+    session = RenderSession("pydoc-markdown.yml")
+    config = session.load()
+    rendered: t.List[str] = []
+    render_module = config.renderer._render_module  # type: ignore[attr-defined]
+    config.renderer._render_module = lambda m: rendered.append(m.name) or render_module(m)  # type: ignore
+    session.render(config)
+    assert sorted(rendered) == ["a", "b"]
+
+    # As with --server, which passes the files that the watcher reported.
+    rendered.clear()
+    Path("b.py").write_text('def b():\n    """Does b, but better."""\n')
+    Path("c.py").write_text('def c():\n    """Does c."""\n')
+    session.render(config, {str(tmp_path / "b.py"), str(tmp_path / "c.py")})
+    assert sorted(rendered) == ["b", "c"]
+    assert "Does b, but better." in Path("docs/reference/b.md").read_text()
+    assert "Does c." in Path("docs/reference/c.md").read_text()
+    assert "reference/c" in Path("docs/reference/sidebar.json").read_text()
+
+
+def test__RenderSession__get_changed_modules__includes_previous_versions(tmp_path: Path) -> None:
+    def _module(name: str, filename: str) -> docspec.Module:
+        return docspec.Module(docspec.Location(str(tmp_path / filename), 0), name, None, [])
+
+    previous = [_module("a", "a.py"), _module("b", "b.py"), _module("c", "c.py")]
+    current = [_module("a", "a.py"), _module("b", "b.py"), _module("d", "d.py")]
+    changed = RenderSession._get_changed_modules(previous, current, [str(tmp_path / "b.py")])
+    assert changed == [current[1], current[2], previous[1], previous[2]]
+    assert changed[0] is current[1] and changed[2] is previous[1]